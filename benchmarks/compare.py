@@ -0,0 +1,70 @@
+# benchmarks/compare.py
+"""
+Compare two benchmark runs (JSON from benchmarks.run):
+
+    python -m benchmarks.compare baseline.json candidate.json --threshold 0.1 --fail
+
+Lists every measurement present in both runs with the ratio of median
+seconds and peak memory; ratios above 1 + threshold are regressions.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+Key = Tuple[str, int, str, str]
+
+
+def _index(doc: Dict[str, Any]) -> Dict[Key, Dict[str, Any]]:
+    return {(r["shape"], r["rows"], r["target"], r["name"]): r for r in doc["results"]}
+
+
+def compare(old: Dict[str, Any], new: Dict[str, Any], threshold: float = 0.1) -> List[Dict[str, Any]]:
+    """One row per shared measurement, with time / memory ratios and a regression flag."""
+    before, after = _index(old), _index(new)
+    rows = []
+    for key in sorted(before.keys() & after.keys()):
+        a, b = before[key], after[key]
+        time_ratio = b["seconds_median"] / a["seconds_median"] if a["seconds_median"] else None
+        mem_ratio = b["peak_memory_bytes"] / a["peak_memory_bytes"] if a["peak_memory_bytes"] else None
+        rows.append({
+            "shape": key[0], "rows": key[1], "target": key[2], "name": key[3],
+            "seconds_before": a["seconds_median"], "seconds_after": b["seconds_median"],
+            "time_ratio": time_ratio, "memory_ratio": mem_ratio,
+            "regression": any(r is not None and r > 1 + threshold for r in (time_ratio, mem_ratio)),
+        })
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare two dfguard benchmark runs")
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=0.1, help="allowed slowdown, e.g. 0.1 = 10%%")
+    parser.add_argument("--fail", action="store_true", help="exit 1 when anything regressed")
+    args = parser.parse_args(argv)
+
+    with open(args.baseline) as fh:
+        old = json.load(fh)
+    with open(args.candidate) as fh:
+        new = json.load(fh)
+
+    rows = compare(old, new, args.threshold)
+    for r in rows:
+        fmt = lambda ratio: f"{ratio:6.2f}x" if ratio is not None else "     -"
+        flag = "  REGRESSION" if r["regression"] else ""
+        print(
+            f"{r['shape']:15} {r['rows']:>11,} {r['target']:9} {r['name']:26} "
+            f"time {fmt(r['time_ratio'])}  memory {fmt(r['memory_ratio'])}{flag}"
+        )
+
+    regressed = sum(r["regression"] for r in rows)
+    print(f"{len(rows)} measurements compared, {regressed} regressed", file=sys.stderr)
+    return 1 if args.fail and regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
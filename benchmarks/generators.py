@@ -0,0 +1,148 @@
+# benchmarks/generators.py
+"""
+Seeded synthetic datasets for the benchmark suite.
+
+Every shape is generated chunk by chunk from (seed, chunk index), so the
+same arguments always give the same data and files of 10^8 rows can be
+written without holding them in memory.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, Iterator
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_CHUNK_ROWS = 1_000_000
+
+_WORDS = np.array([
+    "alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel",
+    "india", "juliet", "kilo", "lima", "mike", "november", "oscar", "papa",
+])
+# The same words with each whitespace issue WhitespaceRule looks for
+_NOISY_WORDS = np.concatenate([
+    " " + _WORDS, _WORDS + " ", _WORDS + "  " + _WORDS, _WORDS + "\t" + _WORDS,
+])
+
+
+def _words(rng: np.random.Generator, n: int, noise: float) -> np.ndarray:
+    values = _WORDS[rng.integers(0, len(_WORDS), n)].astype(object)
+    noisy = rng.random(n) < noise
+    values[noisy] = _NOISY_WORDS[rng.integers(0, len(_NOISY_WORDS), int(noisy.sum()))]
+    return values
+
+
+def _with_nulls(rng: np.random.Generator, values: np.ndarray, ratio: float) -> np.ndarray:
+    values = values.astype(object) if values.dtype.kind in "OU" else values.astype(float)
+    values[rng.random(len(values)) < ratio] = None if values.dtype == object else np.nan
+    return values
+
+
+# ------------------------------------------------------------
+# Shapes: (rng, start row, rows) -> chunk
+# ------------------------------------------------------------
+
+def tall_narrow(rng: np.random.Generator, start: int, n: int) -> pd.DataFrame:
+    """Few numeric columns, many rows; a heavy tail produces outliers."""
+    return pd.DataFrame({
+        "id": np.arange(start, start + n, dtype=np.int64),
+        "value": rng.normal(100.0, 15.0, n),
+        "latency": rng.lognormal(3.0, 1.0, n),
+        "bucket": rng.integers(0, 100, n, dtype=np.int32),
+    })
+
+
+def wide_sparse(rng: np.random.Generator, start: int, n: int, width: int = 200) -> pd.DataFrame:
+    """Many float columns, about 90% null."""
+    values = rng.random((n, width))
+    values[rng.random((n, width)) < 0.9] = np.nan
+    return pd.DataFrame(values, columns=[f"f{i:03d}" for i in range(width)])
+
+
+def string_heavy(rng: np.random.Generator, start: int, n: int) -> pd.DataFrame:
+    """Text columns with about 5% whitespace noise and a few nulls."""
+    return pd.DataFrame({
+        f"s{i}": _with_nulls(rng, _words(rng, n, noise=0.05), 0.02)
+        for i in range(6)
+    })
+
+
+def high_duplicate(rng: np.random.Generator, start: int, n: int) -> pd.DataFrame:
+    """Rows drawn from a pool of 1,000 distinct rows, so nearly all are duplicates."""
+    pool = np.random.default_rng(0)
+    keys = pool.integers(0, 50, (1000, 2))
+    amounts = pool.normal(0.0, 1.0, 1000).round(2)
+    pick = rng.integers(0, 1000, n)
+    return pd.DataFrame({
+        "customer": keys[pick, 0],
+        "product": keys[pick, 1],
+        "amount": amounts[pick],
+        "channel": _WORDS[pick % 4],
+    })
+
+
+def mixed(rng: np.random.Generator, start: int, n: int) -> pd.DataFrame:
+    """Numeric strings mixed with text, nullable numbers and booleans."""
+    numeric_text = rng.integers(0, 10_000, n).astype(str).astype(object)
+    garbage = rng.random(n) < 0.1
+    numeric_text[garbage] = _words(rng, int(garbage.sum()), noise=0.2)
+    return pd.DataFrame({
+        "code": numeric_text,
+        "score": _with_nulls(rng, rng.normal(size=n), 0.2),
+        "flag": rng.random(n) < 0.5,
+        "label": _with_nulls(rng, _words(rng, n, noise=0.01), 0.3),
+    })
+
+
+SHAPES: Dict[str, Callable[..., pd.DataFrame]] = {
+    "tall_narrow": tall_narrow,
+    "wide_sparse": wide_sparse,
+    "string_heavy": string_heavy,
+    "high_duplicate": high_duplicate,
+    "mixed": mixed,
+}
+
+
+def generate_chunks(
+    shape: str,
+    rows: int,
+    *,
+    seed: int = 0,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> Iterator[pd.DataFrame]:
+    """The dataset as chunks of at most chunk_rows rows."""
+    if shape not in SHAPES:
+        raise ValueError(f"Unknown shape '{shape}', expected one of {sorted(SHAPES)}")
+    make = SHAPES[shape]
+
+    for index, start in enumerate(range(0, rows, chunk_rows)):
+        rng = np.random.default_rng([seed, index])
+        yield make(rng, start, min(chunk_rows, rows - start))
+
+
+def generate(shape: str, rows: int, *, seed: int = 0) -> pd.DataFrame:
+    """The whole dataset in memory; equal to concatenating generate_chunks()."""
+    chunks = list(generate_chunks(shape, rows, seed=seed))
+    if not chunks:
+        return SHAPES[shape](np.random.default_rng(seed), 0, 0)
+    return pd.concat(chunks, ignore_index=True)
+
+
+def write_parquet(shape: str, rows: int, path: str, *, seed: int = 0) -> str:
+    """Write the dataset to Parquet chunk by chunk (one row group per chunk)."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = None
+    try:
+        for chunk in generate_chunks(shape, rows, seed=seed):
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+    return path
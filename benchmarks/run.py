@@ -0,0 +1,249 @@
+# benchmarks/run.py
+"""
+Benchmark suite: time and peak memory of profiling, each built-in rule,
+validate() and the CLI, per dataset shape and row count.
+
+    python -m benchmarks.run                                  # 10^3 .. 10^6 rows, all shapes
+    python -m benchmarks.run --rows 1e3,1e5 --shapes mixed --output bench.json
+    python -m benchmarks.run --rows 1e8 --targets cli         # file-based only
+
+Run from the repository root with dfguard importable (installed, or
+PYTHONPATH=src). Results are JSON (see --output); compare two runs with
+`python -m benchmarks.compare old.json new.json`.
+
+Targets:
+  profile   profile_dataframe() on an in-memory DataFrame
+  rules     every built-in rule's apply() on that profile
+  validate  dfguard.validate() end to end
+  cli       `dfguard <file>.parquet --json --no-cache` in a fresh process
+
+In-process targets report tracemalloc peaks (numpy and Python
+allocations, not Arrow buffers); the CLI reports the process's max RSS.
+Row counts above --max-memory-rows run the cli target only.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+from .generators import SHAPES, generate, write_parquet
+
+TARGETS = ("profile", "rules", "validate", "cli")
+DEFAULT_ROWS = (10**3, 10**4, 10**5, 10**6)
+
+
+def measure(fn: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    """Seconds (min / median over repeat runs) and the tracemalloc peak of the first run."""
+    times = []
+    peak = 0
+    for i in range(repeat):
+        if i == 0:
+            tracemalloc.start()
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+        if i == 0:
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+    # The first run pays for tracing: time the others when there are any
+    timed = times[1:] or times
+    return {
+        "seconds_min": round(min(timed), 6),
+        "seconds_median": round(statistics.median(timed), 6),
+        "peak_memory_bytes": peak,
+        "repeat": len(timed),
+    }
+
+
+def measure_process(argv: List[str], repeat: int, env: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """Wall-clock seconds and max RSS of a command, one fresh process per run."""
+    times = []
+    peak = 0
+    for _ in range(repeat):
+        with tempfile.TemporaryFile() as err:
+            start = time.perf_counter()
+            proc = subprocess.Popen(argv, stdout=subprocess.DEVNULL, stderr=err, env=env)
+            # wait4() gives this child's own rusage, unlike RUSAGE_CHILDREN
+            _, status, usage = os.wait4(proc.pid, 0)
+            times.append(time.perf_counter() - start)
+            proc.returncode = os.waitstatus_to_exitcode(status)
+            if proc.returncode not in (0, 1):
+                err.seek(0)
+                stderr = err.read().decode(errors="replace")
+                raise RuntimeError(f"{' '.join(argv)} exited with {proc.returncode}: {stderr}")
+        peak = max(peak, usage.ru_maxrss * 1024)  # KiB on Linux
+    return {
+        "seconds_min": round(min(times), 6),
+        "seconds_median": round(statistics.median(times), 6),
+        "peak_memory_bytes": peak,
+        "repeat": len(times),
+    }
+
+
+# ------------------------------------------------------------
+# Targets
+# ------------------------------------------------------------
+
+def bench_in_memory(shape: str, rows: int, targets: List[str], repeat: int, seed: int) -> List[Dict[str, Any]]:
+    from dfguard import validate
+    from dfguard.core import _build_default_engine
+    from dfguard.profiler import profile_dataframe
+
+    df = generate(shape, rows, seed=seed)
+    results = []
+
+    def record(target: str, name: str, measured: Dict[str, Any]) -> None:
+        results.append({"shape": shape, "rows": rows, "target": target, "name": name, **measured})
+
+    if "profile" in targets:
+        record("profile", "profile_dataframe", measure(lambda: profile_dataframe(df), repeat))
+
+    if "rules" in targets:
+        profile = profile_dataframe(df)
+        engine = _build_default_engine()
+        for rule in engine.structural_rules + engine.quality_rules + engine.numeric_rules:
+            record("rules", rule.name, measure(lambda rule=rule: rule.apply(profile), repeat))
+
+    if "validate" in targets:
+        record("validate", "validate", measure(lambda: validate(df), repeat))
+
+    return results
+
+
+def bench_cli(shape: str, rows: int, repeat: int, seed: int, workdir: str) -> List[Dict[str, Any]]:
+    path = os.path.join(workdir, f"{shape}-{rows}.parquet")
+    if not os.path.exists(path):
+        write_parquet(shape, rows, path, seed=seed)
+
+    import dfguard
+
+    # The CLI runs the same dfguard as the in-process targets
+    package_root = os.path.dirname(os.path.dirname(dfguard.__file__))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_root, env.get("PYTHONPATH")]))
+
+    argv = [sys.executable, "-m", "dfguard.cli", path, "--json", "--no-cache"]
+    measured = measure_process(argv, repeat, env)
+    return [{
+        "shape": shape, "rows": rows, "target": "cli", "name": "dfguard --json",
+        "file_bytes": os.path.getsize(path), **measured,
+    }]
+
+
+# ------------------------------------------------------------
+# Entry point
+# ------------------------------------------------------------
+
+def _parse_rows(value: str) -> List[int]:
+    return [int(float(v)) for v in value.split(",") if v.strip()]
+
+
+def _parse_list(value: str, allowed) -> List[str]:
+    items = [v.strip() for v in value.split(",") if v.strip()]
+    unknown = [v for v in items if v not in allowed]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown {unknown}, expected some of {sorted(allowed)}")
+    return items
+
+
+def environment() -> Dict[str, Any]:
+    import numpy
+    import pandas
+    import pyarrow
+    from dfguard import __version__
+
+    return {
+        "dfguard_version": __version__,
+        "python": platform.python_version(),
+        "pandas": pandas.__version__,
+        "numpy": numpy.__version__,
+        "pyarrow": pyarrow.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+    }
+
+
+def run(
+    shapes: List[str],
+    rows: List[int],
+    targets: List[str],
+    *,
+    repeat: int = 3,
+    seed: int = 0,
+    max_memory_rows: int = 10**7,
+    workdir: Optional[str] = None,
+    log: Callable[[str], None] = lambda line: None,
+) -> Dict[str, Any]:
+    """Run the suite and return the JSON document."""
+    results: List[Dict[str, Any]] = []
+    skipped: List[Dict[str, Any]] = []
+
+    with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+        for shape in shapes:
+            for n in rows:
+                in_memory = [t for t in targets if t != "cli"]
+                if in_memory and n > max_memory_rows:
+                    skipped.append({"shape": shape, "rows": n, "targets": in_memory,
+                                    "reason": "above --max-memory-rows"})
+                    in_memory = []
+                if in_memory:
+                    log(f"{shape} {n:,} rows: {', '.join(in_memory)}")
+                    results.extend(bench_in_memory(shape, n, in_memory, repeat, seed))
+                if "cli" in targets:
+                    log(f"{shape} {n:,} rows: cli")
+                    results.extend(bench_cli(shape, n, repeat, seed, tmp))
+
+    return {
+        "environment": environment(),
+        "config": {
+            "shapes": shapes, "rows": rows, "targets": targets,
+            "repeat": repeat, "seed": seed, "max_memory_rows": max_memory_rows,
+        },
+        "results": results,
+        "skipped": skipped,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="dfguard benchmark suite")
+    parser.add_argument("--shapes", type=lambda v: _parse_list(v, SHAPES), default=list(SHAPES))
+    parser.add_argument("--rows", type=_parse_rows, default=list(DEFAULT_ROWS),
+                        help="comma-separated row counts, e.g. 1e3,1e6,1e8")
+    parser.add_argument("--targets", type=lambda v: _parse_list(v, TARGETS), default=list(TARGETS))
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per measurement")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-memory-rows", type=lambda v: int(float(v)), default=10**7,
+                        help="largest row count for the in-memory targets")
+    parser.add_argument("--workdir", help="where generated files go (default: system temp)")
+    parser.add_argument("--output", "-o", help="write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    doc = run(
+        args.shapes, args.rows, args.targets,
+        repeat=args.repeat, seed=args.seed,
+        max_memory_rows=args.max_memory_rows, workdir=args.workdir,
+        log=lambda line: print(line, file=sys.stderr),
+    )
+
+    text = json.dumps(doc, indent=2)
+    if args.output:
+        with open(args.output, "w") as fh:
+            fh.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
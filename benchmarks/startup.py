@@ -0,0 +1,126 @@
+# benchmarks/startup.py
+"""
+Cold-start latency of the dfguard CLI.
+
+Every sample is a fresh interpreter, as when the CLI is called from a
+shell pipeline:
+
+    python benchmarks/startup.py                   # table of timings
+    python benchmarks/startup.py --json            # machine-readable
+    python benchmarks/startup.py --budget-ms 150   # exit 1 if --version is slower
+    python benchmarks/startup.py --importtime      # slowest imports per command
+
+dfguard must be importable (installed, or PYTHONPATH=src).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+HEAVY_MODULES = ("pandas", "numpy", "pyarrow", "rich", "pyspark")
+
+
+def _commands(csv_path: str) -> Dict[str, List[str]]:
+    cli = [sys.executable, "-m", "dfguard.cli"]
+    return {
+        "import dfguard": [sys.executable, "-c", "import dfguard"],
+        "dfguard --version": cli + ["--version"],
+        "dfguard --help": cli + ["--help"],
+        "dfguard small.csv --json": cli + [csv_path, "--json", "--no-cache"],
+    }
+
+
+def _write_small_csv(directory: str) -> str:
+    path = os.path.join(directory, "small.csv")
+    with open(path, "w") as fh:
+        fh.write("id,name,value\n")
+        for i in range(100):
+            fh.write(f"{i},name {i % 7},{i * 0.5}\n")
+    return path
+
+
+def time_command(argv: List[str], repeat: int) -> Dict[str, float]:
+    """Wall-clock milliseconds over repeat fresh processes (one warm-up run first)."""
+    subprocess.run(argv, capture_output=True, check=True)
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(argv, capture_output=True, check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        "min_ms": round(min(samples), 1),
+        "median_ms": round(statistics.median(samples), 1),
+        "max_ms": round(max(samples), 1),
+    }
+
+
+def loaded_modules(argv: List[str]) -> List[str]:
+    """HEAVY_MODULES a command imports, from its -X importtime trace."""
+    trace = importtime(argv)
+    names = {name.split(".")[0] for name, _ in trace}
+    return [m for m in HEAVY_MODULES if m in names]
+
+
+def importtime(argv: List[str]) -> List[tuple]:
+    """(module, cumulative microseconds) for every import the command makes."""
+    proc = subprocess.run(
+        [argv[0], "-X", "importtime"] + argv[1:], capture_output=True, text=True, check=True
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+\s+\|\s+(\d+)\s+\|(\s*)(\S+)", line)
+        if match:
+            rows.append((match.group(3), int(match.group(1))))
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=10, help="timed runs per command")
+    parser.add_argument("--json", action="store_true", help="print JSON instead of a table")
+    parser.add_argument("--budget-ms", type=float, help="fail if the median of --version exceeds this")
+    parser.add_argument("--importtime", action="store_true", help="list the slowest imports per command")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DFGUARD_CACHE_DIR"] = os.path.join(tmp, "cache")
+        commands = _commands(_write_small_csv(tmp))
+
+        results = {}
+        for name, argv in commands.items():
+            results[name] = {
+                **time_command(argv, args.repeat),
+                "heavy_imports": loaded_modules(argv),
+            }
+            if args.importtime:
+                top = sorted(importtime(argv), key=lambda r: r[1], reverse=True)[:10]
+                results[name]["slowest_imports_ms"] = {m: round(us / 1000, 1) for m, us in top}
+
+    if args.json:
+        print(json.dumps({"python": sys.version.split()[0], "results": results}, indent=2))
+    else:
+        for name, r in results.items():
+            heavy = ", ".join(r["heavy_imports"]) or "-"
+            print(f"{name:28} median {r['median_ms']:8.1f} ms   min {r['min_ms']:8.1f} ms   imports: {heavy}")
+            for module, ms in r.get("slowest_imports_ms", {}).items():
+                print(f"    {module:40} {ms:8.1f} ms")
+
+    if args.budget_ms is not None:
+        median = results["dfguard --version"]["median_ms"]
+        if median > args.budget_ms:
+            print(f"--version median {median} ms exceeds budget {args.budget_ms} ms", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
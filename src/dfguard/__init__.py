@@ -1,6 +1,14 @@
 # src/validator/__init__.py
 from .version import __version__
-from .core import validate  # primary Python API
 
 
-__all__ = ["validate", "__version__"]
\ No newline at end of file
+__all__ = ["validate", "__version__"]
+
+
+def __getattr__(name):
+    # Imported on first use, so `import dfguard` (and the CLI's --help /
+    # --version) do not pay for pandas and the rule modules
+    if name == "validate":
+        from .core import validate  # primary Python API
+        return validate
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,328 @@
+# src/dfguard/accumulators.py
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Collection, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .duplicates import DuplicateAccumulator, make_duplicate_accumulator, row_hashes
+from .profiler import _column_pass, iqr_fences, numeric_summary
+from .sketches import QuantileSketch
+
+if TYPE_CHECKING:
+    from .planner import StatsPlan
+
+
+# ------------------------------------------------------------
+# Columns
+# ------------------------------------------------------------
+
+class ColumnAccumulator:
+    """
+    Mergeable running version of profiler.column_stats().
+
+    Every statistic except the quartiles is an exact sum/min/max over
+    chunks, and mean/M2 are merged with Chan's pairwise update; quartiles
+    and the IQR outlier count come from a QuantileSketch, which stays
+    exact until it first compacts.
+
+    CSV dtype inference runs per chunk, so a column can be numeric in one
+    chunk and text in another. The column is reported as numeric only if
+    every chunk with values was numeric, mirroring a full read.
+
+    stats limits the optional statistics as in profiler._column_pass();
+    skipped ones are None in result(). null_dtype is the dtype reported
+    when no chunk holds a value (see profiler._null_dtypes()); without a
+    declared schema that is float64, as pandas.read_csv makes it.
+    """
+
+    def __init__(
+        self,
+        sketch_k: int = 4096,
+        stats: Optional[Collection[str]] = None,
+        null_dtype: Optional[str] = None,
+    ):
+        self.stats = frozenset(stats) if stats is not None else None
+        self.null_dtype = null_dtype
+        self.rows = 0
+        self.null_count = 0
+        self.kinds: set = set()
+        self.dtypes: set = set()
+        self.min: Any = None
+        self.max: Any = None
+        self.sum = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.numeric_count = 0
+        self.bool_count = 0
+        self.whitespace = 0
+        self.coercible = 0
+        self.sketch = QuantileSketch(k=sketch_k)
+
+    def _wants(self, name: str) -> bool:
+        return self.stats is None or name in self.stats
+
+    def update(self, series: pd.Series) -> None:
+        self.add(*_column_pass(series, quartiles=False, stats=self.stats))
+
+    def add(self, stats: Dict[str, Any], values: Optional[np.ndarray]) -> None:
+        """Fold one chunk's kernel output (pandas or Arrow) into the state."""
+        self._add(stats)
+        if values is not None and self._wants("quartiles"):
+            self.sketch.update(values)
+
+    def _is_bool(self, stats: Dict[str, Any]) -> bool:
+        if self._wants("numeric_coercible"):
+            # The kernels leave it None only for bool-like dtypes
+            return stats["numeric_coercible"] is None
+        return stats["dtype"] in ("bool", "boolean")
+
+    def _add(self, stats: Dict[str, Any]) -> None:
+        self.rows += stats["rows"]
+        self.null_count += stats["null_count"]
+
+        if not stats["count"]:
+            # All-null chunks say nothing about the column's real dtype
+            return
+
+        self.dtypes.add(stats["dtype"])
+        if stats["numeric"]:
+            self.kinds.add("numeric")
+            self._add_moments(stats["count"], stats["mean"], stats["m2"])
+            self.sum += stats["sum"]
+            self.min = stats["min"] if self.min is None else min(self.min, stats["min"])
+            self.max = stats["max"] if self.max is None else max(self.max, stats["max"])
+        elif self._is_bool(stats):
+            self.kinds.add("bool")
+            self.bool_count += stats["count"]
+        else:
+            self.kinds.add("text")
+            self.whitespace += stats["whitespace"] or 0
+            self.coercible += stats["numeric_coercible"] or 0
+
+    def _add_moments(self, count: int, mean: float, m2: float) -> None:
+        # Chan et al.'s pairwise update of (count, mean, M2)
+        if not count:
+            return
+        total = self.numeric_count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.numeric_count * count / total
+        self.numeric_count = total
+
+    def merge(self, other: "ColumnAccumulator") -> None:
+        self.rows += other.rows
+        self.null_count += other.null_count
+        if self.null_dtype is None:
+            self.null_dtype = other.null_dtype
+        self.kinds |= other.kinds
+        self.dtypes |= other.dtypes
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        self._add_moments(other.numeric_count, other.mean, other.m2)
+        self.sum += other.sum
+        self.bool_count += other.bool_count
+        self.whitespace += other.whitespace
+        self.coercible += other.coercible
+        self.sketch.merge(other.sketch)
+
+    def _dtype(self) -> str:
+        if not self.dtypes and self.null_dtype is not None:
+            return self.null_dtype
+        if self.kinds == {"bool"}:
+            # pandas has no nullable default for bools: NaN turns them object
+            return "object" if self.null_count else "bool"
+        if self.kinds - {"numeric"}:
+            return "object"
+        if not self.dtypes or self.null_count or any(d.startswith("float") for d in self.dtypes):
+            return "float64"
+        return "int64"
+
+    def result(self) -> Dict[str, Any]:
+        """Column stats in the exact shape profiler.column_stats() returns."""
+        dtype = self._dtype()
+        numeric = dtype not in ("bool", "object")
+
+        stats: Dict[str, Any] = {
+            "dtype": dtype,
+            "numeric": numeric,
+            "rows": self.rows,
+            "null_count": self.null_count,
+            "count": self.rows - self.null_count,
+            "min": None,
+            "max": None,
+            "sum": None,
+            "mean": None,
+            "m2": None,
+            "q1": None,
+            "q3": None,
+            "outliers": None,
+            "whitespace": self.whitespace if self._wants("whitespace") else None,
+            "numeric_coercible": None,
+        }
+
+        if numeric:
+            stats["whitespace"] = 0
+            if self.numeric_count:
+                as_float = dtype.startswith("float")
+                stats.update({
+                    "min": float(self.min) if as_float else self.min,
+                    "max": float(self.max) if as_float else self.max,
+                    "sum": self.sum,
+                    "mean": self.mean,
+                    "m2": self.m2,
+                })
+            if not self._wants("quartiles"):
+                return stats
+            if self.numeric_count:
+                q1, q3 = self.sketch.quantiles([0.25, 0.75])
+                lower, upper = iqr_fences(q1, q3)
+                stats.update({
+                    "q1": q1,
+                    "q3": q3,
+                    "outliers": self.sketch.count_outside(lower, upper),
+                })
+            else:
+                stats["outliers"] = 0
+            stats["quartiles_exact"] = self.sketch.is_exact
+            stats["quantile_error"] = self.sketch.error_bound
+            stats["outliers_exact"] = self.sketch.is_exact
+        elif dtype == "object" and self._wants("numeric_coercible"):
+            # Values from numeric-typed chunks always coerce to numbers;
+            # so do Python bools, but only when no text chunk turned them into strings
+            stats["numeric_coercible"] = self.coercible + self.numeric_count
+            if self.kinds == {"bool"}:
+                stats["numeric_coercible"] += self.bool_count
+
+        return stats
+
+
+# ------------------------------------------------------------
+# Whole profile
+# ------------------------------------------------------------
+
+class ProfileAccumulator:
+    """
+    Builds a profile chunk by chunk.
+
+    Chunks must share the same columns. Partial accumulators (one per chunk
+    range, file or worker) can be merged before calling to_profile().
+
+    duplicates holds keyword arguments for make_duplicate_accumulator()
+    (key_columns, exact, memory_budget, spill_dir). With a plan, columns
+    get just its statistics, and no rule reading rows means no duplicate
+    detection (and no duplicate_count in the profile). dtypes gives, for
+    formats with a schema, the dtype of each column that holds only nulls
+    (see profiler._null_dtypes()).
+    """
+
+    def __init__(
+        self,
+        sketch_k: int = 4096,
+        column_names: Optional[List[str]] = None,
+        duplicates: Optional[Dict[str, Any]] = None,
+        plan: Optional[StatsPlan] = None,
+        dtypes: Optional[Dict[str, str]] = None,
+    ):
+        self.sketch_k = sketch_k
+        self.plan = plan
+        self.dtypes = dict(dtypes or {})
+        self.rows = 0
+        self.column_names: Optional[List[str]] = None
+        self.columns: Dict[str, ColumnAccumulator] = {}
+        self.duplicates: Optional[DuplicateAccumulator] = None
+        if plan is None or plan.reads_rows:
+            self.duplicates = make_duplicate_accumulator(**(duplicates or {}))
+
+        # Known up front for self-describing formats, so empty inputs keep their columns
+        if column_names is not None:
+            self._init_columns(column_names)
+
+    def _init_columns(self, names: List[str]) -> None:
+        self.column_names = list(names)
+        self.columns = {
+            col: ColumnAccumulator(
+                self.sketch_k, self.plan.stats_for(col) if self.plan else None, self.dtypes.get(col)
+            )
+            for col in names
+        }
+
+    def declare(self, dtypes: Dict[str, str]) -> None:
+        """Add schema dtypes of all-null columns (see dtypes); the first one seen wins."""
+        for col, dtype in dtypes.items():
+            self.dtypes.setdefault(col, dtype)
+            if col in self.columns and self.columns[col].null_dtype is None:
+                self.columns[col].null_dtype = dtype
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        names = list(chunk.columns)
+        if self.column_names is None:
+            self._init_columns(names)
+        elif names != self.column_names:
+            raise ValueError("All chunks must have the same columns")
+
+        self.rows += len(chunk)
+        for col in names:
+            self.columns[col].update(chunk[col])
+        if self.duplicates is not None:
+            self.duplicates.update(chunk)
+
+    def update_arrow(self, batch) -> None:
+        """Same as update() for a pyarrow RecordBatch, using the Arrow kernels."""
+        from .arrow_backend import arrow_column_pass
+
+        names = list(batch.schema.names)
+        if self.column_names is None:
+            self._init_columns(names)
+        elif names != self.column_names:
+            raise ValueError("All chunks must have the same columns")
+
+        self.rows += batch.num_rows
+        for col, column in zip(names, batch.columns):
+            self.columns[col].add(*arrow_column_pass(column, quartiles=False))
+        if self.duplicates is not None:
+            self.duplicates.update_arrow(batch)
+
+    def merge(self, other: "ProfileAccumulator") -> None:
+        if other.column_names is None:
+            return
+        if self.column_names is None:
+            self._init_columns(other.column_names)
+        elif other.column_names != self.column_names:
+            raise ValueError("Cannot merge profiles with different columns")
+
+        self.rows += other.rows
+        for col, acc in other.columns.items():
+            self.columns[col].merge(acc)
+        if self.duplicates is not None and other.duplicates is not None:
+            self.duplicates.merge(other.duplicates)
+
+    def to_profile(self, source: Optional[str] = None) -> Dict[str, Any]:
+        """Profile dict with the same keys profile_dataframe() produces (df=None)."""
+        stats = {col: acc.result() for col, acc in self.columns.items()}
+
+        profile: Dict[str, Any] = {
+            "df": None,
+            "rows": self.rows,
+            "columns": len(stats),
+            "column_names": list(self.column_names or []),
+            "nulls": {col: s["null_count"] for col, s in stats.items()},
+            "numeric_stats": {
+                col: numeric_summary(s)
+                for col, s in stats.items()
+                if s["numeric"] and s["count"]
+            },
+            "column_stats": stats,
+            "streamed": True,
+        }
+        if self.duplicates is not None:
+            profile["duplicate_count"] = self.duplicates.duplicates
+            profile["duplicate_keys"] = self.duplicates.key_columns
+
+        if source is not None:
+            profile["path"] = source
+
+        return profile
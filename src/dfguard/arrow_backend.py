@@ -0,0 +1,517 @@
+# src/dfguard/arrow_backend.py
+
+from __future__ import annotations
+
+import os
+import re
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from .profiler import _column_pass, compute_column_stats, iqr_fences, numeric_summary, sketch_quartiles
+
+
+# ------------------------------------------------------------
+# Patterns (RE2 syntax, evaluated by pyarrow.compute)
+# ------------------------------------------------------------
+
+# Every character Python's str.isspace() / re's \s accepts, so results
+# match the pandas backend's regex exactly.
+_WS = (
+    r"[\t\n\x0b\f\r \x1c-\x1f\x{85}\x{a0}\x{1680}\x{2000}-\x{200a}"
+    r"\x{2028}\x{2029}\x{202f}\x{205f}\x{3000}]"
+)
+_WHITESPACE_PATTERN = rf"^{_WS}|{_WS}$|{_WS}{{2}}|\t|\\t"
+
+# Strings pd.to_numeric(errors="coerce") turns into a non-NaN number
+_NUMERIC_PATTERN = (
+    r"(?i)^\s*[+-]?(\d+\.?\d*(e[+-]?\d+)?|\.\d+(e[+-]?\d+)?|inf|infinity)\s*$"
+)
+
+
+def _is_string_type(t: pa.DataType) -> bool:
+    return pa.types.is_string(t) or pa.types.is_large_string(t)
+
+
+def _is_numeric_type(t: pa.DataType) -> bool:
+    return pa.types.is_integer(t) or pa.types.is_floating(t)
+
+
+def _pandas_dtype_name(t: pa.DataType, has_nulls: bool) -> str:
+    """The dtype pandas would give this column after to_pandas()."""
+    if pa.types.is_integer(t) and has_nulls:
+        return "float64"
+    if pa.types.is_boolean(t) and has_nulls:
+        return "object"
+    try:
+        return str(np.dtype(t.to_pandas_dtype()))
+    except (NotImplementedError, TypeError):
+        return "object"
+
+
+def _as_array(column: Union[pa.Array, pa.ChunkedArray]) -> pa.Array:
+    if isinstance(column, pa.ChunkedArray):
+        if column.num_chunks == 1:
+            return column.chunk(0)
+        return pa.concat_arrays(column.chunks) if column.num_chunks else pa.array([], type=column.type)
+    return column
+
+
+# ------------------------------------------------------------
+# Column kernel
+# ------------------------------------------------------------
+
+def arrow_column_pass(column: Union[pa.Array, pa.ChunkedArray], *, quartiles: bool = True):
+    """
+    pyarrow.compute version of profiler._column_pass().
+
+    Returns (stats, values) with the same keys and semantics as the pandas
+    kernel (NaN counts as null, dtype names are pandas' names), so every
+    rule and accumulator works unchanged. String columns are scanned with
+    RE2 kernels and never become Python objects.
+    """
+    t = column.type
+    if pa.types.is_dictionary(t):
+        column = pc.dictionary_decode(_as_array(column))
+        t = column.type
+
+    if not (_is_numeric_type(t) or pa.types.is_boolean(t) or _is_string_type(t)
+            or pa.types.is_temporal(t)):
+        # Nested and exotic types: defer to the pandas kernel
+        return _column_pass(column.to_pandas())
+
+    rows = len(column)
+    null_count = column.null_count
+    if pa.types.is_floating(t):
+        null_count += pc.sum(pc.is_nan(column)).as_py() or 0
+
+    numeric = _is_numeric_type(t)
+    stats: Dict[str, Any] = {
+        "dtype": _pandas_dtype_name(t, null_count > 0),
+        "numeric": numeric,
+        "rows": rows,
+        "null_count": null_count,
+        "count": rows - null_count,
+        "min": None,
+        "max": None,
+        "sum": None,
+        "mean": None,
+        "m2": None,
+        "q1": None,
+        "q3": None,
+        "outliers": None,
+        "whitespace": 0,
+        "numeric_coercible": None,
+    }
+
+    if numeric:
+        valid = pc.drop_null(column)
+        if pa.types.is_floating(t):
+            valid = pc.filter(valid, pc.invert(pc.is_nan(valid)))
+        values = _as_array(valid).to_numpy(zero_copy_only=False)
+        if pa.types.is_integer(t) and null_count:
+            # pandas turns integer columns with nulls into float64
+            values = values.astype(np.float64)
+        stats.update(_arrow_numeric_stats(valid, values, quartiles=quartiles))
+        return stats, values
+
+    if _is_string_type(t):
+        if stats["count"]:
+            stats["whitespace"] = _count_true(pc.match_substring_regex(column, _WHITESPACE_PATTERN))
+            stats["numeric_coercible"] = _count_true(pc.match_substring_regex(column, _NUMERIC_PATTERN))
+        else:
+            stats["numeric_coercible"] = 0
+    elif pa.types.is_temporal(t):
+        # Datetimes coerce to their integer representation; date/time objects do not
+        coercible = pa.types.is_timestamp(t) or pa.types.is_duration(t)
+        stats["numeric_coercible"] = stats["count"] if coercible else 0
+    elif pa.types.is_boolean(t) and null_count:
+        # Object column of Python bools: each one coerces to 0/1
+        stats["numeric_coercible"] = stats["count"]
+
+    return stats, None
+
+
+def _count_true(mask) -> int:
+    return int(pc.sum(mask).as_py() or 0)
+
+
+def _arrow_numeric_stats(valid, values: np.ndarray, *, quartiles: bool) -> Dict[str, Any]:
+    if not len(valid):
+        return {"outliers": 0}
+
+    # Unsafe: int64 beyond 2**53 rounds like pandas' float sums instead of raising
+    as_float = pc.cast(valid, pa.float64(), safe=False)
+    minmax = pc.min_max(valid)
+    stats: Dict[str, Any] = {
+        "min": values.dtype.type(minmax["min"].as_py()),
+        "max": values.dtype.type(minmax["max"].as_py()),
+        "sum": pc.sum(as_float).as_py(),
+        "mean": pc.mean(as_float).as_py(),
+    }
+    # Squared deviations from the mean, as profiler._numeric_stats()
+    deviations = pc.subtract(as_float, stats["mean"])
+    m2 = pc.sum(pc.multiply(deviations, deviations)).as_py()
+    m2 -= pc.sum(deviations).as_py() ** 2 / len(valid)
+    stats["m2"] = max(m2, 0.0)
+
+    if quartiles:
+        q1, q3 = pc.quantile(as_float, q=[0.25, 0.75], interpolation="linear").to_pylist()
+        lower, upper = iqr_fences(q1, q3)
+        outside = pc.or_(pc.less(as_float, lower), pc.greater(as_float, upper))
+        stats.update({"q1": q1, "q3": q3, "outliers": _count_true(outside)})
+
+    return stats
+
+
+# ------------------------------------------------------------
+# Row hashing
+# ------------------------------------------------------------
+
+_MIX1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX2 = np.uint64(0x94D049BB133111EB)
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+_NULL_HASH = np.uint64(0x6A09E667F3BCC909)
+_POLY = 0x100000001B3
+_POLY_INV = pow(_POLY, -1, 2 ** 64)
+
+
+def _mix(h: np.ndarray) -> np.ndarray:
+    """splitmix64 finalizer (uint64 arithmetic wraps)."""
+    h = h ^ (h >> np.uint64(30))
+    h = h * _MIX1
+    h = h ^ (h >> np.uint64(27))
+    h = h * _MIX2
+    return h ^ (h >> np.uint64(31))
+
+
+def _powers(base: int, n: int) -> np.ndarray:
+    powers = np.full(n, base, dtype=np.uint64)
+    if n:
+        powers[0] = 1
+    return np.cumprod(powers, dtype=np.uint64)
+
+
+def _hash_strings(array: pa.Array) -> np.ndarray:
+    """
+    Polynomial hash of every string, straight from the Arrow buffers.
+
+    A prefix sum of byte * P**i over the data buffer gives each string's
+    hash as one subtraction and one multiplication by P**-start, so no
+    Python string is ever created.
+    """
+    offset_type = np.int64 if pa.types.is_large_string(array.type) else np.int32
+    _, offsets_buf, data_buf = array.buffers()
+    offsets = np.frombuffer(offsets_buf, dtype=offset_type)[array.offset: array.offset + len(array) + 1]
+    offsets = offsets.astype(np.int64)
+
+    lo, hi = offsets[0], offsets[-1]
+    data = np.frombuffer(data_buf, dtype=np.uint8)[lo:hi] if data_buf is not None else np.empty(0, np.uint8)
+
+    n = data.size
+    prefix = np.zeros(n + 1, dtype=np.uint64)
+    np.cumsum(data.astype(np.uint64) * _powers(_POLY, n), dtype=np.uint64, out=prefix[1:])
+    inverse = _powers(_POLY_INV, n + 1)
+
+    starts = offsets[:-1] - lo
+    ends = offsets[1:] - lo
+    h = (prefix[ends] - prefix[starts]) * inverse[starts]
+    return _mix(h ^ ((ends - starts).astype(np.uint64) * _GOLDEN))
+
+
+def _hash_column(column: Union[pa.Array, pa.ChunkedArray]) -> np.ndarray:
+    array = _as_array(column)
+    t = array.type
+
+    if pa.types.is_dictionary(t):
+        array = pc.dictionary_decode(array)
+        t = array.type
+
+    if _is_numeric_type(t):
+        # Same keys as duplicates.row_hashes: exact integers, whole floats as integers
+        from .duplicates import numeric_keys
+
+        nulls = array.is_null().to_numpy(zero_copy_only=False)
+        keys = numeric_keys(pc.fill_null(array, 0).to_numpy(zero_copy_only=False), nulls)
+        if pa.types.is_floating(t):
+            nulls = nulls | np.isnan(array.to_numpy(zero_copy_only=False))
+        h = _mix(keys)
+    elif pa.types.is_boolean(t):
+        nulls = array.is_null().to_numpy(zero_copy_only=False)
+        h = _mix(pc.fill_null(array, False).to_numpy(zero_copy_only=False).astype(np.uint64) + np.uint64(1))
+    elif _is_string_type(t):
+        nulls = array.is_null().to_numpy(zero_copy_only=False)
+        h = _hash_strings(array)
+    elif pa.types.is_temporal(t):
+        nulls = array.is_null().to_numpy(zero_copy_only=False)
+        ints = pc.fill_null(array.view(pa.int64() if t.bit_width == 64 else pa.int32()), 0)
+        h = _mix(ints.to_numpy(zero_copy_only=False).astype(np.int64).view(np.uint64))
+    else:
+        # Nested types: hash their Python repr (rare, not zero-copy)
+        series = array.to_pandas()
+        nulls = series.isna().to_numpy()
+        h = pd.util.hash_pandas_object(series.map(repr), index=False).to_numpy()
+
+    return np.where(nulls, _NULL_HASH, h)
+
+
+def arrow_row_hashes(table: Union[pa.Table, pa.RecordBatch]) -> np.ndarray:
+    """64-bit hash per row of an Arrow table or record batch."""
+    h = np.zeros(table.num_rows, dtype=np.uint64)
+    for column in table.columns:
+        h = _mix(h * _GOLDEN + _hash_column(column))
+    return h
+
+
+# ------------------------------------------------------------
+# Profiles
+# ------------------------------------------------------------
+
+def _profile_from_stats(stats: Dict[str, Dict[str, Any]], rows: int) -> Dict[str, Any]:
+    return {
+        "rows": rows,
+        "columns": len(stats),
+        "column_names": list(stats),
+        "nulls": {col: s["null_count"] for col, s in stats.items()},
+        "numeric_stats": {
+            col: numeric_summary(s)
+            for col, s in stats.items()
+            if s.get("numeric") and s["count"]
+        },
+        "column_stats": stats,
+        "backend": "arrow",
+    }
+
+
+def profile_table(
+    table: pa.Table,
+    *,
+    source: Optional[str] = None,
+    duplicates: Optional[Dict[str, Any]] = None,
+    quantile_accuracy: Optional[float] = None,
+    exact_outliers: bool = False,
+) -> Dict[str, Any]:
+    """
+    Arrow counterpart of profile_dataframe() for an in-memory pyarrow.Table.
+
+    Duplicates are counted from arrow_row_hashes() (or exactly, see
+    duplicates.make_duplicate_accumulator()); the profile has df=None.
+    """
+    from .duplicates import make_duplicate_accumulator
+
+    stats: Dict[str, Dict[str, Any]] = {}
+    for name, column in zip(table.column_names, table.columns):
+        stats[name] = _arrow_stats(column, quantile_accuracy, exact_outliers)
+
+    dup_acc = make_duplicate_accumulator(**(duplicates or {}))
+    dup_acc.update_arrow(table)
+
+    profile = _profile_from_stats(stats, table.num_rows)
+    profile["df"] = None
+    profile["duplicate_count"] = dup_acc.duplicates
+    profile["duplicate_keys"] = dup_acc.key_columns
+
+    if source is not None:
+        profile["path"] = source
+
+    return profile
+
+
+def _arrow_stats(column, quantile_accuracy: Optional[float], exact_outliers: bool) -> Dict[str, Any]:
+    """arrow_column_pass() stats, with sketched quartiles when quantile_accuracy is set."""
+    if quantile_accuracy is None:
+        stats, _ = arrow_column_pass(column)
+        return stats
+
+    stats, values = arrow_column_pass(column, quartiles=False)
+    if values is not None:
+        stats.update(sketch_quartiles(
+            values, quantile_accuracy=quantile_accuracy, exact_outliers=exact_outliers
+        ))
+    return stats
+
+
+def profile_dataframe_arrow(
+    df: pd.DataFrame,
+    *,
+    source: Optional[str] = None,
+    quantile_accuracy: Optional[float] = None,
+    exact_outliers: bool = False,
+) -> Dict[str, Any]:
+    """
+    Run the Arrow kernels over a pandas DataFrame.
+
+    Columns pyarrow cannot convert (mixed Python objects) use the pandas
+    kernel. df stays in the profile, so DuplicateRule keeps pandas semantics.
+    """
+    stats: Dict[str, Dict[str, Any]] = {}
+    for col in df.columns:
+        series = df[col]
+        try:
+            array = pa.array(series, from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            stats[col] = compute_column_stats(
+                df[[col]], quantile_accuracy=quantile_accuracy, exact_outliers=exact_outliers
+            )[col]
+            continue
+        stats[col] = _arrow_stats(array, quantile_accuracy, exact_outliers)
+
+    profile = _profile_from_stats(stats, len(df))
+    profile["df"] = df
+
+    if source is not None:
+        profile["path"] = source
+
+    return profile
+
+
+# ------------------------------------------------------------
+# Streaming readers
+# ------------------------------------------------------------
+
+_CSV_COLUMN_ERROR = re.compile(r"In CSV column #(\d+)")
+
+# Align pyarrow's CSV type inference with pandas.read_csv defaults
+_PANDAS_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None",
+    "n/a", "nan", "null",
+]
+
+
+def _csv_block_size(path: str, chunksize: int) -> int:
+    """Bytes per CSV block holding about chunksize rows, from the first MiB's row length."""
+    with open(path, "rb") as fh:
+        head = fh.read(1 << 20)
+    row_bytes = len(head) / max(head.count(b"\n"), 1)
+    return int(min(max(chunksize * row_bytes, 1 << 16), 1 << 30))
+
+
+def _open_csv(
+    path: str,
+    columns: Optional[List[str]],
+    forced: Dict[str, pa.DataType],
+    block_size: Optional[int] = None,
+):
+    import pyarrow.csv as pacsv
+
+    convert = pacsv.ConvertOptions(
+        column_types=forced,
+        include_columns=columns,
+        null_values=_PANDAS_NA_VALUES,
+        strings_can_be_null=True,
+        true_values=["True", "TRUE", "true"],
+        false_values=["False", "FALSE", "false"],
+    )
+    read = pacsv.ReadOptions(block_size=block_size) if block_size else None
+    return pacsv.open_csv(path, read_options=read, convert_options=convert)
+
+
+def _csv_header(path: str) -> List[str]:
+    import pyarrow.csv as pacsv
+
+    with pacsv.open_csv(path) as reader:
+        return reader.schema.names
+
+
+def _mistyped_columns(
+    path: str,
+    schema: pa.Schema,
+    columns: Optional[List[str]],
+    forced: Dict[str, pa.DataType],
+    block_size: Optional[int],
+) -> List[str]:
+    """
+    Non-string columns of schema holding a value that does not convert to
+    their inferred type, found in one pass that reads them all as strings.
+    """
+    typed = {f.name: f.type for f in schema if f.name not in forced and not _is_string_type(f.type)}
+    as_text = {**forced, **{name: pa.string() for name in typed}}
+    bad: List[str] = []
+    with _open_csv(path, columns, as_text, block_size) as reader:
+        for batch in reader:
+            for name, t in typed.items():
+                if name in bad:
+                    continue
+                try:
+                    pc.cast(batch.column(name), t)
+                except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                    bad.append(name)
+            if len(bad) == len(typed):
+                break
+    return bad
+
+
+def stream_profile_arrow(
+    path: str,
+    *,
+    chunksize: int,
+    columns: Optional[List[str]] = None,
+    duplicates: Optional[Dict[str, Any]] = None,
+    sketch_k: int = 4096,
+) -> Dict[str, Any]:
+    """
+    Streaming Arrow-native profile of a CSV or Parquet file.
+
+    pyarrow infers CSV column types from the first block and fails on a
+    later value that does not fit. One pass over the file as strings then
+    finds every such column, and the file is re-read from the start with
+    all of them as string, as pandas would make them object columns. Date
+    and timestamp columns are read as strings too, as pandas does.
+    """
+    from .accumulators import ProfileAccumulator
+
+    ext = os.path.splitext(path)[1].lower()
+
+    if ext == ".parquet":
+        import pyarrow.parquet as pq
+        from .profiler import _data_columns, _null_dtypes
+
+        with pq.ParquetFile(path) as pf:
+            # Read the same list: pandas index columns are not data
+            names = columns or _data_columns(pf.schema_arrow)
+            acc = ProfileAccumulator(
+                sketch_k=sketch_k, column_names=names, duplicates=duplicates,
+                dtypes=_null_dtypes(pf.schema_arrow, names),
+            )
+            for batch in pf.iter_batches(batch_size=chunksize, columns=names):
+                acc.update_arrow(batch)
+
+    elif ext == ".csv":
+        forced: Dict[str, pa.DataType] = {}
+        block_size = _csv_block_size(path, chunksize)
+        while True:
+            acc = ProfileAccumulator(sketch_k=sketch_k, duplicates=duplicates)
+            reader = _open_csv(path, columns, forced, block_size)
+            temporal = [f.name for f in reader.schema if pa.types.is_temporal(f.type)]
+            if temporal:
+                reader.close()
+                forced.update({name: pa.string() for name in temporal})
+                continue
+            try:
+                for batch in reader:
+                    acc.update_arrow(batch)
+                break
+            except pa.ArrowInvalid as exc:
+                match = _CSV_COLUMN_ERROR.search(str(exc))
+                if not match:
+                    raise
+                name = _csv_header(path)[int(match.group(1))]
+                if name in forced:
+                    raise
+                # Every mistyped column at once, so the file is re-read once
+                forced[name] = pa.string()
+                for other in _mistyped_columns(path, reader.schema, columns, forced, block_size):
+                    forced[other] = pa.string()
+            finally:
+                reader.close()
+
+    else:
+        raise ValueError(f"Unsupported format: {path}")
+
+    profile = acc.to_profile(source=path)
+    profile["backend"] = "arrow"
+    return profile
@@ -0,0 +1,237 @@
+# src/dfguard/batch.py
+
+from __future__ import annotations
+
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from .cache import ResultCache
+from .core import validate_profile
+from .profiler import DEFAULT_CHUNKSIZE, quick_profile, stream_profile
+from .report import ValidationReport
+from .version import __version__
+
+
+SUPPORTED_EXTENSIONS = (".csv", ".parquet")
+
+_GLOB_CHARS = set("*?[")
+
+
+# ------------------------------------------------------------
+# Inputs
+# ------------------------------------------------------------
+
+def is_pattern(arg: str) -> bool:
+    """True for arguments to be expanded (directories and glob patterns)."""
+    return os.path.isdir(arg) or (not os.path.exists(arg) and bool(_GLOB_CHARS & set(arg)))
+
+
+def _files_under(directory: str) -> List[str]:
+    found = []
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for name in sorted(files):
+            if os.path.splitext(name)[1].lower() in SUPPORTED_EXTENSIONS:
+                found.append(os.path.join(root, name))
+    return found
+
+
+def expand_paths(args: List[str]) -> List[str]:
+    """
+    Files to validate for a list of paths, directories and glob patterns.
+
+    Directories are searched recursively for CSV and Parquet files; globs
+    are expanded (** included). Explicit paths are kept even when missing,
+    so they are reported as failed instead of silently dropped. Order
+    follows the arguments, duplicates are removed.
+    """
+    result: List[str] = []
+    seen = set()
+
+    def add(path: str) -> None:
+        key = os.path.normpath(path)
+        if key not in seen:
+            seen.add(key)
+            result.append(path)
+
+    for arg in args:
+        if os.path.isdir(arg):
+            for path in _files_under(arg):
+                add(path)
+        elif not os.path.exists(arg) and _GLOB_CHARS & set(arg):
+            matches = sorted(glob.glob(arg, recursive=True))
+            if not matches:
+                add(arg)
+            for match in matches:
+                if os.path.isdir(match):
+                    for path in _files_under(match):
+                        add(path)
+                elif os.path.splitext(match)[1].lower() in SUPPORTED_EXTENSIONS:
+                    add(match)
+        else:
+            add(arg)
+
+    return result
+
+
+# ------------------------------------------------------------
+# One file
+# ------------------------------------------------------------
+
+def profile_path(
+    path: str,
+    *,
+    metadata_only: bool = False,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    **stream_options: Any,
+) -> Dict[str, Any]:
+    """Profile a file the way the CLI does (streamed, or from the Parquet footer)."""
+    if metadata_only:
+        return quick_profile(path, metadata_only=True, columns=stream_options.get("columns"))
+    return stream_profile(path, chunksize=chunksize, **stream_options)
+
+
+def validate_path(
+    path: str,
+    profile_options: Optional[Dict[str, Any]] = None,
+    validate_options: Optional[Dict[str, Any]] = None,
+    cache: Optional[ResultCache] = None,
+) -> ValidationReport:
+    """
+    profile_path() + validate_profile(), answered from cache when the file
+    and options are unchanged (report.profile["cached"] is then True).
+
+    With validate_options["timings"] the cache is bypassed and profiling
+    is timed along with the rules. Profiling errors propagate unchanged.
+    """
+    profile_options = profile_options or {}
+    validate_options = validate_options or {}
+
+    if validate_options.get("timings"):
+        from .timing import measure
+
+        profile, cost = measure(lambda: profile_path(path, **profile_options), memory="rss")
+        cost["rows"] = profile.get("rows")
+        report = validate_profile(profile, **validate_options)
+        report.add_profile_timing(cost)
+        return report
+
+    key = None
+    if cache is not None:
+        # workers / executor do not change results
+        key = cache.key(path, profile_options)
+        report = cache.get(key)
+        if report is not None:
+            # Same file, maybe spelled differently this time
+            report.profile["path"] = path
+            return report
+
+    profile = profile_path(path, **profile_options)
+    report = validate_profile(profile, **validate_options)
+
+    if key is not None:
+        try:
+            cache.put(key, report)
+        except OSError:
+            pass  # a read-only or full cache never fails validation
+
+    return report
+
+
+def validate_file(
+    path: str,
+    profile_options: Optional[Dict[str, Any]] = None,
+    validate_options: Optional[Dict[str, Any]] = None,
+    cache: Optional[ResultCache] = None,
+) -> Dict[str, Any]:
+    """
+    Validate one file and return a JSON-ready entry for the batch report.
+
+    Never raises: a missing or unreadable file gets status "failed" and an
+    "error" message.
+    """
+    start = time.perf_counter()
+    entry: Dict[str, Any] = {"file": path}
+
+    try:
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"file not found: {path}")
+        report = validate_path(path, profile_options, validate_options, cache)
+    except Exception as exc:
+        entry.update({"status": "failed", "rows": None, "warnings": None, "error": str(exc)})
+    else:
+        entry.update({
+            "status": report.status,
+            "rows": report.profile.get("rows"),
+            "warnings": sum(1 for r in report.all_results if r.warning),
+            "cached": bool(report.profile.get("cached")),
+            "report": report.to_dict(),
+        })
+
+    entry["seconds"] = round(time.perf_counter() - start, 3)
+    return entry
+
+
+# ------------------------------------------------------------
+# Many files
+# ------------------------------------------------------------
+
+def validate_files(
+    paths: List[str],
+    *,
+    jobs: Optional[int] = None,
+    profile_options: Optional[Dict[str, Any]] = None,
+    validate_options: Optional[Dict[str, Any]] = None,
+    cache: Optional[ResultCache] = None,
+) -> List[Dict[str, Any]]:
+    """
+    validate_file() over many files on a pool of jobs processes.
+
+    Entries come back in the order of paths. The interpreter and its
+    imports are paid for once per worker, not once per file.
+    """
+    jobs = min(jobs or os.cpu_count() or 1, max(len(paths), 1))
+    args = [(path, profile_options, validate_options, cache) for path in paths]
+
+    if jobs == 1:
+        return [validate_file(*a) for a in args]
+
+    with ProcessPoolExecutor(jobs) as pool:
+        futures = [pool.submit(validate_file, *a) for a in args]
+        return [f.result() for f in futures]
+
+
+BATCH_STATUSES = ("ok", "warning", "error", "failed")
+
+
+def batch_summary(entries: List[Dict[str, Any]], seconds: float) -> Dict[str, Any]:
+    """
+    Aggregate counts for a batch run.
+
+    exit_code is 1 when any file could not be read or validated, else 0
+    (the same rule as for a single file).
+    """
+    counts = {status: 0 for status in BATCH_STATUSES}
+    for entry in entries:
+        counts[entry["status"]] += 1
+
+    return {
+        "files": len(entries),
+        **counts,
+        "cached": sum(1 for entry in entries if entry.get("cached")),
+        "rows": sum(entry["rows"] or 0 for entry in entries),
+        "seconds": round(seconds, 3),
+        "exit_code": 1 if counts["failed"] else 0,
+    }
+
+
+def batch_report(entries: List[Dict[str, Any]], seconds: float) -> Dict[str, Any]:
+    """JSON document for `dfguard --json` over several files."""
+    return {
+        "validator_version": __version__,
+        "summary": batch_summary(entries, seconds),
+        "files": entries,
+    }
@@ -0,0 +1,221 @@
+# src/dfguard/cache.py
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Dict, List, Optional
+
+from .report import ValidationReport
+from .rules.base import ValidationResult
+from .version import __version__
+
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Profile keys the renderers need to redraw a cached report
+_PROFILE_KEYS = (
+    "rows", "columns", "column_names", "nulls", "numeric_stats",
+    "path", "notes", "stats_source", "metadata_only", "sample",
+)
+
+
+def default_cache_dir() -> str:
+    """$DFGUARD_CACHE_DIR, else $XDG_CACHE_HOME/dfguard, else ~/.cache/dfguard."""
+    if os.environ.get("DFGUARD_CACHE_DIR"):
+        return os.environ["DFGUARD_CACHE_DIR"]
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "dfguard")
+
+
+def _json_default(value: Any) -> Any:
+    # numpy scalars and similar
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+def file_digest(path: str, chunk: int = 1 << 20) -> str:
+    """blake2b of the file contents."""
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(chunk), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    On-disk cache of validation results for unchanged files.
+
+    Entries are keyed by the file's identity (absolute path, size, mtime
+    and, with content_hash=True, a hash of its bytes), the dfguard version
+    and the options the file was profiled and validated with. Each entry
+    holds ValidationReport.to_dict() plus the few profile fields the
+    console renderer needs.
+
+    Entries are JSON files under directory; reading one refreshes its
+    mtime, and once the cache outgrows max_bytes the least recently used
+    entries are deleted.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        content_hash: bool = False,
+    ):
+        self.directory = directory or default_cache_dir()
+        self.max_bytes = max_bytes
+        self.content_hash = content_hash
+        self._size: Optional[int] = None
+
+    # ------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------
+
+    def key(self, path: str, options: Dict[str, Any]) -> str:
+        st = os.stat(path)
+        identity: Dict[str, Any] = {
+            "path": os.path.realpath(path),
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "version": __version__,
+            "options": options,
+        }
+        if self.content_hash:
+            identity["content"] = file_digest(path)
+
+        blob = json.dumps(identity, sort_keys=True, default=_json_default)
+        return hashlib.sha256(blob.encode()).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    # ------------------------------------------------------------
+    # Lookup / store
+    # ------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[ValidationReport]:
+        path = self._entry_path(key)
+        try:
+            with open(path, encoding="utf-8") as fh:
+                entry = json.load(fh)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return report_from_entry(entry)
+
+    def put(self, key: str, report: ValidationReport) -> None:
+        path = self._entry_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = json.dumps(report_to_entry(report), default=_json_default).encode("utf-8")
+
+        # Atomic: concurrent workers may store the same key
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp, path)
+        except OSError:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+        if self._size is None:
+            self._size = sum(size for _, size, _ in self._entries())
+        else:
+            self._size += len(data)
+        if self._size > self.max_bytes:
+            self.evict()
+
+    # ------------------------------------------------------------
+    # Eviction
+    # ------------------------------------------------------------
+
+    def _entries(self) -> List[tuple]:
+        """(path, size, last use) of every entry."""
+        entries = []
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((path, st.st_size, st.st_mtime_ns))
+        return entries
+
+    def evict(self) -> None:
+        """Delete least recently used entries down to 90% of max_bytes."""
+        entries = sorted(self._entries(), key=lambda e: e[2])
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * 0.9)
+
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+
+        self._size = total
+
+    def clear(self) -> None:
+        for path, _, _ in self._entries():
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+        self._size = 0
+
+
+# ------------------------------------------------------------
+# Serialization
+# ------------------------------------------------------------
+
+def report_to_entry(report: ValidationReport) -> Dict[str, Any]:
+    profile = report.profile
+    light = {k: profile[k] for k in _PROFILE_KEYS if k in profile}
+    if profile.get("column_stats") is not None:
+        light["column_stats"] = {
+            col: {"numeric": bool(s.get("numeric"))}
+            for col, s in profile["column_stats"].items()
+        }
+    return {"report": report.to_dict(), "profile": light}
+
+
+def _results(items: List[Dict[str, Any]]) -> List[ValidationResult]:
+    results = []
+    for item in items:
+        result = ValidationResult(
+            warning=item["warning"],
+            message=item["message"],
+            details=item["details"],
+            estimate=item.get("estimate"),
+        )
+        setattr(result, "name", item["name"])
+        results.append(result)
+    return results
+
+
+def report_from_entry(entry: Dict[str, Any]) -> ValidationReport:
+    """Rebuild a ValidationReport whose to_dict() equals the cached one."""
+    doc = entry["report"]
+    profile = dict(entry["profile"])
+    profile.setdefault("df", None)
+    profile["cached"] = True
+
+    return ValidationReport(
+        profile=profile,
+        structural_results=_results(doc["structural"]),
+        quality_results=_results(doc["quality"]),
+        numeric_results=_results(doc["numeric"]),
+    )
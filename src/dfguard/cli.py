@@ -2,49 +2,274 @@
 
 from __future__ import annotations
 
+import json
 import sys
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
 
+import click
 import typer
 
-from .profiler import quick_profile
-from .core import validate_profile
-from .renderers import render_console   
+# Only light modules at import time: pandas, pyarrow and rich are imported
+# inside the commands, so --help and --version start fast
+from .defaults import BACKENDS, DEFAULT_CHUNKSIZE, EXECUTORS
+from .version import __version__
+
+if TYPE_CHECKING:
+    from .cache import ResultCache
 
 app = typer.Typer(help="DfGuard - Data validation CLI")
 
 
+def _print_version(value: bool) -> None:
+    if value:
+        typer.echo(f"dfguard {__version__}")
+        raise typer.Exit()
+
+
+def _split_columns(value: Optional[str]) -> Optional[List[str]]:
+    if not value:
+        return None
+    return [c.strip() for c in value.split(",") if c.strip()] or None
+
+
 @app.command()
 def main(
-    path: str = typer.Argument(..., help="Path to CSV or Parquet file"),
+    paths: List[str] = typer.Argument(
+        ..., help="CSV or Parquet files, directories or glob patterns"
+    ),
     json_output: bool = typer.Option(False, "--json", help="Output JSON instead of text"),
+    chunksize: int = typer.Option(
+        DEFAULT_CHUNKSIZE, "--chunksize", min=1, help="Rows per chunk / record batch when streaming"
+    ),
+    columns: Optional[str] = typer.Option(
+        None, "--columns", help="Comma-separated columns to read and validate (default: all)"
+    ),
+    backend: str = typer.Option(
+        "pandas",
+        "--backend",
+        click_type=click.Choice(BACKENDS),
+        help="Profiling backend: pandas or arrow (pyarrow.compute)",
+    ),
+    metadata_only: bool = typer.Option(
+        False, "--metadata-only", help="Parquet only: row count and null ratios from footer statistics (of --columns, if given)"
+    ),
+    key_columns: Optional[str] = typer.Option(
+        None, "--key-columns", help="Comma-separated columns that identify a duplicate row (default: all)"
+    ),
+    exact_duplicates: bool = typer.Option(
+        False, "--exact-duplicates", help="Compare rows exactly instead of by 64-bit row hash"
+    ),
+    duplicates_memory: Optional[int] = typer.Option(
+        None, "--duplicates-memory", min=1, help="Memory budget in MB for duplicate detection before spilling to disk"
+    ),
+    quantile_accuracy: Optional[float] = typer.Option(
+        None, "--quantile-accuracy",
+        # k_for_error() needs 0 < error < 1
+        click_type=click.FloatRange(0.0, 1.0, min_open=True, max_open=True),
+        help="Rank error of the outlier quantile sketch (e.g. 0.01)",
+    ),
+    exact_outliers: bool = typer.Option(
+        False, "--exact-outliers", help="Re-read sketched columns to count outliers exactly"
+    ),
+    workers: int = typer.Option(
+        1, "--workers", min=1, help="Run rules concurrently on this many workers"
+    ),
+    executor: str = typer.Option(
+        "thread", "--executor", help="Worker pool for --workers: thread or process"
+    ),
+    jobs: Optional[int] = typer.Option(
+        None, "--jobs", "-j", min=1, help="Files validated in parallel when given several (default: CPU count)"
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Ignore and do not update the result cache"
+    ),
+    hash_content: bool = typer.Option(
+        False, "--hash-content", help="Key the result cache on a hash of the file contents too"
+    ),
+    sample: Optional[str] = typer.Option(
+        None, "--sample", help="Validate a random sample: rows (10000) or a fraction (0.01, 1%)"
+    ),
+    sample_seed: int = typer.Option(
+        0, "--sample-seed", help="Random seed for --sample"
+    ),
+    state: Optional[Path] = typer.Option(
+        None, "--state", help="Validate the files as one append-only dataset, keeping profile state here"
+    ),
+    rebuild: bool = typer.Option(
+        False, "--rebuild", help="With --state: discard the stored state and profile everything"
+    ),
+    profile_rules: bool = typer.Option(
+        False, "--profile-rules", help="Time profiling and every rule; print a ranked table (timings in --json)"
+    ),
+    version: Optional[bool] = typer.Option(
+        None, "--version", callback=_print_version, is_eager=True, help="Show the version and exit"
+    ),
 ):
     """CLI entrypoint."""
+    from .batch import is_pattern, validate_path
+    from .cache import ResultCache
+    from .sampling import parse_sample
+
+    if executor not in EXECUTORS:
+        typer.echo(f"Error: unknown executor '{executor}', expected one of {EXECUTORS}", err=True)
+        raise typer.Exit(code=1)
+
+    if sample is not None:
+        try:
+            parse_sample(sample)
+        except ValueError as exc:
+            typer.echo(f"Error: {exc}", err=True)
+            raise typer.Exit(code=1)
+        if metadata_only or state is not None:
+            typer.echo("Error: --sample cannot be combined with --metadata-only or --state", err=True)
+            raise typer.Exit(code=1)
+
+    if metadata_only:
+        profile_options = {"metadata_only": True, "columns": _split_columns(columns)}
+    else:
+        profile_options = {
+            "chunksize": chunksize,
+            "columns": _split_columns(columns),
+            "backend": backend,
+            "duplicates": {
+                "key_columns": _split_columns(key_columns),
+                "exact": exact_duplicates,
+                "memory_budget": duplicates_memory * 1024 * 1024 if duplicates_memory else None,
+            },
+            "quantile_accuracy": quantile_accuracy,
+            "exact_outliers": exact_outliers,
+        }
+        if sample is not None:
+            profile_options.update({"sample": sample, "sample_seed": sample_seed})
+    validate_options = {"workers": workers, "executor": executor}
+    if profile_rules:
+        validate_options["timings"] = True
+    # Measured runs always profile, so they neither read nor fill the cache
+    cache = None if no_cache or profile_rules else ResultCache(content_hash=hash_content)
 
-    file_path = Path(path)
+    if state is not None:
+        if metadata_only:
+            typer.echo("Error: --state cannot be combined with --metadata-only", err=True)
+            raise typer.Exit(code=1)
+        _run_incremental(paths, state, rebuild, json_output, profile_options, validate_options)
+
+    if len(paths) > 1 or is_pattern(paths[0]):
+        _run_batch(paths, jobs, json_output, profile_options, validate_options, cache)
+
+    file_path = Path(paths[0])
 
     if not file_path.exists():
         typer.echo(f"Error: file not found: {file_path}", err=True)
         raise typer.Exit(code=1)
 
     try:
-        profile = quick_profile(str(file_path))
+        report = validate_path(str(file_path), profile_options, validate_options, cache)
     except Exception as exc:
         typer.echo(f"Error: failed to read file: {exc}", err=True)
         raise typer.Exit(code=1)
 
-    report = validate_profile(profile)
-
     # JSON MODE -----------------------------------------------------
     if json_output:
         typer.echo(report.to_json())
         raise typer.Exit(code=0)
 
     # TEXT MODE -----------------------------------------------------
+    from .renderers import render_console, render_timings
+
     typer.echo(f"Reading: {file_path}")
     render_console(report)
+    if report.timings:
+        render_timings(report.timings)
     raise typer.Exit(code=0)
 
 
+def _run_incremental(
+    args: List[str],
+    state: Path,
+    rebuild: bool,
+    json_output: bool,
+    profile_options: dict,
+    validate_options: dict,
+) -> None:
+    """Validate the files as one dataset, profiling only new data; always exits."""
+    from .batch import expand_paths
+    from .incremental import validate_incremental
+
+    paths = expand_paths(args)
+    missing = [p for p in paths if not Path(p).exists()]
+    if not paths or missing:
+        typer.echo(f"Error: file not found: {missing[0] if missing else args[0]}", err=True)
+        raise typer.Exit(code=1)
+
+    options = dict(profile_options)
+    exact_outliers = options.pop("exact_outliers")
+    if exact_outliers or options.pop("backend") != "pandas":
+        typer.echo("Note: --state profiles with the pandas backend and sketched outliers", err=True)
+
+    try:
+        report = validate_incremental(
+            paths,
+            str(state),
+            rebuild=rebuild,
+            source=args[0] if len(args) == 1 else None,
+            **options,
+            **validate_options,
+        )
+    except Exception as exc:
+        typer.echo(f"Error: failed to read files: {exc}", err=True)
+        raise typer.Exit(code=1)
+
+    if json_output:
+        typer.echo(report.to_json())
+    else:
+        from .renderers import render_console, render_timings
+        render_console(report)
+        if report.timings:
+            render_timings(report.timings)
+    raise typer.Exit(code=0)
+
+
+def _run_batch(
+    args: List[str],
+    jobs: Optional[int],
+    json_output: bool,
+    profile_options: dict,
+    validate_options: dict,
+    cache: Optional[ResultCache],
+) -> None:
+    """Validate every file the arguments expand to; always exits."""
+    from .batch import batch_report, expand_paths, validate_files
+
+    paths = expand_paths(args)
+    if not paths:
+        typer.echo("Error: no CSV or Parquet files found", err=True)
+        raise typer.Exit(code=1)
+
+    start = time.perf_counter()
+    entries = validate_files(
+        paths,
+        jobs=jobs,
+        profile_options=profile_options,
+        validate_options=validate_options,
+        cache=cache,
+    )
+    batch = batch_report(entries, time.perf_counter() - start)
+
+    if json_output:
+        typer.echo(json.dumps(batch, indent=2))
+    else:
+        from .renderers import render_batch, render_timings
+        render_batch(batch)
+
+        measured = [e["report"]["timings"] for e in entries if "timings" in e.get("report", {})]
+        if measured:
+            from .timing import aggregate
+            render_timings(aggregate(measured), title="Rule Timings (all files)")
+
+    raise typer.Exit(code=batch["summary"]["exit_code"])
+
+
 if __name__ == "__main__":
     app()
@@ -2,33 +2,50 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Union
 
 import pandas as pd
 
+from .defaults import BACKENDS
 from .profiler import profile_dataframe
 from .engine import RuleEngine
+from .planner import StatsPlan
+from .rules.base import BaseRule
 from .report import ValidationReport
 
-# Structural rules
-from .rules.structural import NonEmptyRule, DuplicateRule
 
-# Quality rules
-from .rules.quality import WhitespaceRule, NullRatioRule, TypeMismatchRule
-
-# Numeric rules
-from .rules.numeric import NumericOutlierRule
-
-
-def _build_default_engine() -> RuleEngine:
+def _build_default_engine(
+    metadata_only: bool = False,
+    duplicates: Optional[Dict[str, Any]] = None,
+    workers: int = 1,
+    executor: str = "thread",
+    timings: bool = False,
+) -> RuleEngine:
     """
     Construct the RuleEngine with all built-in rules.
     This is the single source of truth for rule ordering.
+
+    metadata_only keeps just the rules a footer-statistics profile can
+    answer (see parquet_stats.METADATA_RULES). duplicates holds
+    DuplicateRule options (key_columns, exact, memory_budget). workers and
+    executor configure concurrent rule execution (see RuleEngine).
+
+    Rule modules are imported here, when the first engine is built, not
+    when dfguard.core is imported.
     """
-    return RuleEngine(
+    # Structural rules
+    from .rules.structural import NonEmptyRule, DuplicateRule
+
+    # Quality rules
+    from .rules.quality import WhitespaceRule, NullRatioRule, TypeMismatchRule
+
+    # Numeric rules
+    from .rules.numeric import NumericOutlierRule
+
+    engine = RuleEngine(
         structural_rules=[
             NonEmptyRule(),
-            DuplicateRule(),
+            DuplicateRule(**(duplicates or {})),
         ],
         quality_rules=[
             WhitespaceRule(),
@@ -38,17 +55,146 @@ def _build_default_engine() -> RuleEngine:
         numeric_rules=[
             NumericOutlierRule(),
         ],
+        workers=workers,
+        executor=executor,
+        timings=timings,
     )
 
+    if metadata_only:
+        from .parquet_stats import METADATA_RULES
+
+        def keep(rules: List[BaseRule]) -> List[BaseRule]:
+            return [r for r in rules if r.name in METADATA_RULES]
+
+        engine.structural_rules = keep(engine.structural_rules)
+        engine.quality_rules = keep(engine.quality_rules)
+        engine.numeric_rules = keep(engine.numeric_rules)
+
+    return engine
+
+
+def _profile_input(
+    df: Any,
+    backend: str,
+    duplicates: Optional[Dict[str, Any]] = None,
+    profile_workers: int = 1,
+    plan: Optional[StatsPlan] = None,
+    **quantiles: Any,
+) -> Dict[str, Any]:
+    """
+    Profile a pandas DataFrame or pyarrow.Table with the chosen backend.
 
-def validate(df: pd.DataFrame) -> ValidationReport:
+    quantiles holds quantile_accuracy / exact_outliers for the profilers.
+    profile_workers > 1 shards the columns across a process pool. plan
+    (see RuleEngine.plan()) is honoured by the single-process pandas
+    profiler; the others compute every statistic.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}', expected one of {BACKENDS}")
+
+    import pyarrow as pa
+
+    if profile_workers > 1:
+        from .parallel import profile_dataframe_parallel
+        if isinstance(df, pa.Table):
+            df = df.to_pandas()
+        return profile_dataframe_parallel(df, workers=profile_workers, backend=backend, **quantiles)
+
+    if isinstance(df, pa.Table):
+        if backend == "arrow":
+            from .arrow_backend import profile_table
+            return profile_table(df, duplicates=duplicates, **quantiles)
+        df = df.to_pandas()
+
+    if backend == "arrow":
+        from .arrow_backend import profile_dataframe_arrow
+        return profile_dataframe_arrow(df, **quantiles)
+
+    return profile_dataframe(df, plan=plan, **quantiles)
+
+
+def validate(
+    df: pd.DataFrame,
+    *,
+    backend: str = "pandas",
+    duplicate_keys: Optional[List[str]] = None,
+    exact_duplicates: bool = False,
+    duplicates_memory: Optional[int] = None,
+    quantile_accuracy: Optional[float] = None,
+    exact_outliers: bool = False,
+    workers: int = 1,
+    executor: str = "thread",
+    profile_workers: int = 1,
+    sample: Optional[Union[int, float, str]] = None,
+    sample_seed: Optional[int] = 0,
+    timings: bool = False,
+) -> ValidationReport:
     """
     Public API: Validate a pandas DataFrame and return a ValidationReport.
     ALWAYS returns ValidationReport (never ValidationResult).
+
+    backend="arrow" profiles with pyarrow.compute kernels instead of pandas;
+    df may also be a pyarrow.Table, which is then never converted to pandas.
+
+    duplicate_keys limits duplicate detection to those columns.
+    exact_duplicates compares rows instead of 64-bit row hashes, and
+    duplicates_memory (bytes) bounds its memory before spilling to disk.
+
+    quantile_accuracy (e.g. 0.01) computes outlier quartiles with a
+    mergeable quantile sketch of that rank error instead of sorting each
+    column; exact_outliers then counts outliers against the sketch fences
+    exactly. The error bound is reported with each column's outliers.
+
+    workers > 1 runs the rules concurrently on a thread pool, or a process
+    pool with executor="process"; results keep the usual order.
+    profile_workers > 1 profiles the columns on that many processes, which
+    read them from shared memory (see parallel.profile_dataframe_parallel()).
+
+    sample (a row count, or a fraction such as 0.01) validates a uniform
+    random sample drawn with sample_seed. Ratio results are then marked
+    "estimated" in to_dict() with their confidence intervals.
+
+    timings=True measures wall time, CPU time, peak memory and rows of the
+    profiling phase (memory as RSS growth) and of every rule (tracemalloc
+    peak), reported under "timings" in to_dict().
     """
-    profile = profile_dataframe(df)
-    engine = _build_default_engine()
+    info = None
+    if sample is not None:
+        from .sampling import parse_sample, sample_frame
+        df, info = sample_frame(df, parse_sample(sample), seed=sample_seed)
+
+    duplicates = {
+        "key_columns": duplicate_keys,
+        "exact": exact_duplicates,
+        "memory_budget": duplicates_memory,
+    }
+    engine = _build_default_engine(
+        duplicates=duplicates, workers=workers, executor=executor, timings=timings
+    )
+
+    def run_profile() -> Dict[str, Any]:
+        return _profile_input(
+            df,
+            backend,
+            duplicates,
+            profile_workers=profile_workers,
+            plan=engine.plan(),
+            quantile_accuracy=quantile_accuracy,
+            exact_outliers=exact_outliers,
+        )
+
+    if timings:
+        from .timing import measure
+        profile, profile_cost = measure(run_profile, memory="rss")
+        profile_cost["rows"] = profile.get("rows")
+    else:
+        profile = run_profile()
+
+    if info is not None:
+        profile["sample"] = info
     report = engine.run(profile)
+    if timings:
+        report.add_profile_timing(profile_cost)
 
     # Hard contract check:
     if not isinstance(report, ValidationReport):
@@ -59,12 +205,31 @@ def validate(df: pd.DataFrame) -> ValidationReport:
     return report
 
 
-def validate_profile(profile: Dict[str, Any]) -> ValidationReport:
+def validate_profile(
+    profile: Dict[str, Any],
+    *,
+    duplicates: Optional[Dict[str, Any]] = None,
+    workers: int = 1,
+    executor: str = "thread",
+    timings: bool = False,
+) -> ValidationReport:
     """
     Internal helper: validate an already-profiled dataset.
     Used by CLI to avoid redundant profiling.
+
+    duplicates must match the options the profile was built with; by
+    default the key columns recorded in the profile are used.
+    timings=True records each rule's cost (see RuleEngine).
     """
-    engine = _build_default_engine()
+    if duplicates is None:
+        duplicates = {"key_columns": profile.get("duplicate_keys")}
+    engine = _build_default_engine(
+        metadata_only=bool(profile.get("metadata_only")),
+        duplicates=duplicates,
+        workers=workers,
+        executor=executor,
+        timings=timings,
+    )
     report = engine.run(profile)
 
     if not isinstance(report, ValidationReport):
@@ -0,0 +1,10 @@
+# src/dfguard/defaults.py
+
+# Defaults the CLI needs to build its options. This module must stay free
+# of heavy imports: `dfguard --help` and `--version` import nothing else.
+
+DEFAULT_CHUNKSIZE = 100_000
+
+EXECUTORS = ("thread", "process")
+
+BACKENDS = ("pandas", "arrow")
@@ -0,0 +1,438 @@
+# src/dfguard/duplicates.py
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+import weakref
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+# Spill files are split on the top bits of the row hash
+_PARTITION_BITS = 6
+_PARTITIONS = 1 << _PARTITION_BITS
+
+# Rows hashed per slice when counting an in-memory DataFrame
+_HASH_SLICE = 1_000_000
+
+
+# ------------------------------------------------------------
+# Row hashing
+# ------------------------------------------------------------
+
+# Mixed into the bits of non-integral floats so they never share a key with an integer
+_FLOAT_SALT = np.uint64(0xC2B2AE3D27D4EB4F)
+
+
+def numeric_keys(values: np.ndarray, nulls: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    uint64 key per numeric value, equal exactly when the values are equal.
+
+    Integers keep their int64 bit pattern, so IDs above 2**53 stay
+    distinct. Floats holding whole numbers get the key of that integer,
+    so a column read as int64 in one chunk and float64 in another (CSV
+    dtype inference is per chunk) keys identical rows identically; other
+    floats key on their bits, -0.0 folded into 0.0. Null and NaN get 0,
+    with nulls (True where missing) to tell them apart.
+    """
+    if values.dtype.kind in "iu":
+        # uint64 above 2**63 wraps, still one key per value
+        keys = values.astype(np.int64, copy=False).view(np.uint64).copy()
+    else:
+        floats = values.astype(np.float64) + 0.0
+        missing = np.isnan(floats)
+        nulls = missing if nulls is None else nulls | missing
+
+        whole = ~missing & (np.floor(floats) == floats) & (np.abs(floats) < 2.0 ** 63)
+        ints = np.zeros(len(floats), dtype=np.int64)
+        ints[whole] = floats[whole].astype(np.int64)
+        keys = np.where(whole, ints.view(np.uint64), floats.view(np.uint64) ^ _FLOAT_SALT)
+
+    if nulls is not None:
+        keys[nulls] = 0
+    return keys
+
+
+def _numeric_columns(series: pd.Series) -> Optional[Dict[str, np.ndarray]]:
+    """Key and null flag columns for a numeric series, None for other dtypes."""
+    dtype = series.dtype
+    if not pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_bool_dtype(dtype):
+        return None
+
+    nulls = series.isna().to_numpy()
+    if pd.api.types.is_integer_dtype(dtype):
+        # Nullable Int64 and friends: fill before leaving pandas
+        values = series.to_numpy(dtype=np.int64 if dtype.kind != "u" else np.uint64, na_value=0)
+    elif pd.api.types.is_float_dtype(dtype):
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    else:
+        return None
+    return {"key": numeric_keys(values, nulls), "null": nulls}
+
+
+def row_hashes(df: pd.DataFrame) -> np.ndarray:
+    """
+    64-bit hash per row, stable across chunks.
+
+    Numeric columns are hashed through numeric_keys(): integers exactly,
+    whole-number floats as the integer they hold. Object columns holding
+    unhashable values (dicts, lists) fall back to their repr.
+    """
+    if not len(df.columns):
+        return np.zeros(len(df), dtype=np.uint64)
+
+    normalized = {}
+    for i, col in enumerate(df.columns):
+        series = df.iloc[:, i]
+        numeric = _numeric_columns(series)
+        if numeric is None:
+            normalized[(i, "value")] = series
+        else:
+            normalized[(i, "key")] = pd.Series(numeric["key"], index=series.index)
+            normalized[(i, "null")] = pd.Series(numeric["null"], index=series.index)
+
+    frame = pd.DataFrame(normalized, index=df.index)
+    try:
+        return pd.util.hash_pandas_object(frame, index=False).to_numpy()
+    except (TypeError, ValueError):
+        for i in frame.columns:
+            if pd.api.types.is_object_dtype(frame[i].dtype):
+                frame[i] = frame[i].map(repr)
+        return pd.util.hash_pandas_object(frame, index=False).to_numpy()
+
+
+def _partition_of(hashes: np.ndarray) -> np.ndarray:
+    return (hashes >> np.uint64(64 - _PARTITION_BITS)).astype(np.int64)
+
+
+class _SpillDirectory:
+    """Temporary directory removed on close() or garbage collection."""
+
+    def __init__(self, parent: Optional[str]):
+        self.path = tempfile.mkdtemp(prefix="dfguard-dups-", dir=parent)
+        self._finalizer = weakref.finalize(self, shutil.rmtree, self.path, ignore_errors=True)
+
+    def file(self, name: str) -> str:
+        return os.path.join(self.path, name)
+
+    def close(self) -> None:
+        self._finalizer()
+
+
+# ------------------------------------------------------------
+# Hash-based (default)
+# ------------------------------------------------------------
+
+class DuplicateAccumulator:
+    """
+    Counts duplicate rows across chunks from 64-bit row hashes.
+
+    Distinct hashes are kept as a handful of sorted, disjoint uint64 runs
+    (merged like a binary counter), so memory is 8 bytes per distinct row
+    and each chunk is probed with a binary search per run.
+
+    With memory_budget (bytes) set, the runs are spilled to disk once they
+    outgrow it: hashes are appended to 64 partition files by their top bits
+    and each partition is deduplicated on its own at the end.
+
+    key_columns restricts duplicate detection to a subset of columns. Do
+    not merge accumulators fed by different backends: pandas and Arrow
+    hash rows differently.
+    """
+
+    def __init__(
+        self,
+        key_columns: Optional[List[str]] = None,
+        memory_budget: Optional[int] = None,
+        spill_dir: Optional[str] = None,
+    ):
+        self.key_columns = list(key_columns) if key_columns else None
+        self.memory_budget = memory_budget
+        self.spill_dir = spill_dir
+        self.rows = 0
+        self._counted = 0
+        self._runs: List[np.ndarray] = []
+        self._spill: Optional[_SpillDirectory] = None
+
+    # ------------------------------------------------------------
+    # Input
+    # ------------------------------------------------------------
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        if self.key_columns:
+            chunk = chunk[self.key_columns]
+        for start in range(0, len(chunk), _HASH_SLICE):
+            self.add_hashes(row_hashes(chunk.iloc[start:start + _HASH_SLICE]))
+
+    def update_arrow(self, batch) -> None:
+        from .arrow_backend import arrow_row_hashes
+
+        if self.key_columns:
+            batch = batch.select(self.key_columns)
+        self.add_hashes(arrow_row_hashes(batch))
+
+    def add_hashes(self, hashes: np.ndarray) -> None:
+        self.rows += hashes.size
+
+        if self._spill is not None:
+            self._append_partitions(hashes)
+            return
+
+        unique = np.unique(hashes)
+        self._counted += hashes.size - unique.size
+        self._absorb(unique)
+
+    def merge(self, other: "DuplicateAccumulator") -> None:
+        self.rows += other.rows
+        self._counted += other._counted
+
+        for run in other._runs:
+            if self._spill is not None:
+                self._append_partitions(run)
+            else:
+                self._absorb(run)
+
+        if other._spill is not None:
+            self._spill_runs()
+            for p in range(_PARTITIONS):
+                path = other._spill.file(f"{p}.u64")
+                if os.path.exists(path):
+                    self._append_partitions(np.fromfile(path, dtype=np.uint64))
+
+    # ------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------
+
+    @property
+    def duplicates(self) -> int:
+        if self._spill is None:
+            return self._counted
+
+        total = self._counted
+        for p in range(_PARTITIONS):
+            path = self._spill.file(f"{p}.u64")
+            if os.path.exists(path):
+                hashes = np.fromfile(path, dtype=np.uint64)
+                total += hashes.size - np.unique(hashes).size
+        return total
+
+    @property
+    def distinct(self) -> int:
+        return self.rows - self.duplicates
+
+    @property
+    def spilled(self) -> bool:
+        return self._spill is not None
+
+    def close(self) -> None:
+        if self._spill is not None:
+            self._spill.close()
+
+    # ------------------------------------------------------------
+    # Pickling (incremental state)
+    # ------------------------------------------------------------
+
+    def __getstate__(self):
+        """Spilled partitions are read back, so the state is self-contained."""
+        state = self.__dict__.copy()
+        state["_spill"] = None
+        if self._spill is not None:
+            counted = self._counted
+            uniques = []
+            for p in range(_PARTITIONS):
+                path = self._spill.file(f"{p}.u64")
+                if os.path.exists(path):
+                    hashes = np.fromfile(path, dtype=np.uint64)
+                    unique = np.unique(hashes)
+                    counted += hashes.size - unique.size
+                    uniques.append(unique)
+            # Partitions are hash ranges in order, so this is already sorted
+            state["_counted"] = counted
+            state["_runs"] = [np.concatenate(uniques)] if uniques else []
+        return state
+
+    # ------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------
+
+    def _absorb(self, unique: np.ndarray) -> None:
+        """Count hashes already seen, then store the new ones."""
+        for run in self._runs:
+            if not unique.size:
+                return
+            pos = np.searchsorted(run, unique)
+            seen = run[np.minimum(pos, run.size - 1)] == unique
+            self._counted += int(seen.sum())
+            unique = unique[~seen]
+
+        if not unique.size:
+            return
+
+        while self._runs and self._runs[-1].size <= unique.size:
+            unique = np.concatenate([self._runs.pop(), unique])
+            unique.sort()
+        self._runs.append(unique)
+
+        if self.memory_budget is not None and self._stored_bytes() > self.memory_budget:
+            self._spill_runs()
+
+    def _stored_bytes(self) -> int:
+        return sum(run.nbytes for run in self._runs)
+
+    def _spill_runs(self) -> None:
+        """Move the in-memory runs (all distinct) into partition files."""
+        if self._spill is None:
+            self._spill = _SpillDirectory(self.spill_dir)
+        runs, self._runs = self._runs, []
+        for run in runs:
+            self._append_partitions(run)
+
+    def _append_partitions(self, hashes: np.ndarray) -> None:
+        if not hashes.size:
+            return
+        parts = _partition_of(hashes)
+        order = np.argsort(parts, kind="stable")
+        parts, hashes = parts[order], hashes[order]
+        bounds = np.flatnonzero(np.diff(parts)) + 1
+        for piece in np.split(hashes, bounds):
+            p = int(_partition_of(piece[:1])[0])
+            with open(self._spill.file(f"{p}.u64"), "ab") as fh:
+                piece.tofile(fh)
+
+
+# ------------------------------------------------------------
+# Exact
+# ------------------------------------------------------------
+
+class ExactDuplicateAccumulator:
+    """
+    Exact duplicate counting, immune to hash collisions.
+
+    Rows (or their key columns) are buffered in memory; once the buffer
+    outgrows memory_budget bytes it is split into 64 partitions by row hash
+    and spilled to disk as pickles. Equal rows always share a partition, so
+    running duplicated() on each partition separately gives the exact count.
+    """
+
+    def __init__(
+        self,
+        key_columns: Optional[List[str]] = None,
+        memory_budget: Optional[int] = 256 * 1024 * 1024,
+        spill_dir: Optional[str] = None,
+    ):
+        self.key_columns = list(key_columns) if key_columns else None
+        self.memory_budget = memory_budget
+        self.spill_dir = spill_dir
+        self.rows = 0
+        self._buffer: List[pd.DataFrame] = []
+        self._buffered_bytes = 0
+        self._pieces = 0
+        self._spill: Optional[_SpillDirectory] = None
+        self._partition_files: Dict[int, List[str]] = {}
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        if self.key_columns:
+            chunk = chunk[self.key_columns]
+        self.rows += len(chunk)
+        self._buffer.append(chunk)
+        self._buffered_bytes += int(chunk.memory_usage(index=False, deep=True).sum())
+
+        if self.memory_budget is not None and self._buffered_bytes > self.memory_budget:
+            self._flush()
+
+    def update_arrow(self, batch) -> None:
+        if self.key_columns:
+            batch = batch.select(self.key_columns)
+        self.update(batch.to_pandas())
+
+    def merge(self, other: "ExactDuplicateAccumulator") -> None:
+        for chunk in other._buffer:
+            self.update(chunk)
+        self.rows += other.rows - sum(len(c) for c in other._buffer)
+
+        if other._spill is not None:
+            if self._spill is None:
+                self._spill = _SpillDirectory(self.spill_dir)
+            for p, paths in other._partition_files.items():
+                for path in paths:
+                    self._store_piece(p, pd.read_pickle(path))
+
+    @property
+    def duplicates(self) -> int:
+        if self._spill is None:
+            if not self._buffer:
+                return 0
+            return int(pd.concat(self._buffer, ignore_index=True).duplicated().sum())
+
+        self._flush()
+        total = 0
+        for paths in self._partition_files.values():
+            part = pd.concat([pd.read_pickle(path) for path in paths], ignore_index=True)
+            total += int(part.duplicated().sum())
+        return total
+
+    @property
+    def spilled(self) -> bool:
+        return self._spill is not None
+
+    def close(self) -> None:
+        if self._spill is not None:
+            self._spill.close()
+
+    def __getstate__(self):
+        """Spilled pieces are read back, so the state is self-contained."""
+        state = self.__dict__.copy()
+        state.update({"_spill": None, "_partition_files": {}, "_pieces": 0})
+        if self._spill is not None:
+            state["_buffer"] = list(self._buffer) + [
+                pd.read_pickle(path)
+                for paths in self._partition_files.values()
+                for path in paths
+            ]
+            state["_buffered_bytes"] = sum(
+                int(chunk.memory_usage(index=False, deep=True).sum()) for chunk in state["_buffer"]
+            )
+        return state
+
+    def _flush(self) -> None:
+        if not self._buffer:
+            return
+        if self._spill is None:
+            self._spill = _SpillDirectory(self.spill_dir)
+
+        frame = pd.concat(self._buffer, ignore_index=True)
+        self._buffer, self._buffered_bytes = [], 0
+
+        parts = _partition_of(row_hashes(frame))
+        for p in np.unique(parts):
+            self._store_piece(int(p), frame[parts == p])
+
+    def _store_piece(self, p: int, frame: pd.DataFrame) -> None:
+        path = self._spill.file(f"{p}-{self._pieces}.pkl")
+        self._pieces += 1
+        frame.to_pickle(path)
+        self._partition_files.setdefault(p, []).append(path)
+
+
+def make_duplicate_accumulator(
+    key_columns: Optional[List[str]] = None,
+    exact: bool = False,
+    memory_budget: Optional[int] = None,
+    spill_dir: Optional[str] = None,
+):
+    """
+    Accumulator for the requested duplicate mode.
+
+    exact=False hashes rows (8 bytes per distinct row); exact=True compares
+    the rows themselves, spilling to disk past memory_budget bytes
+    (256 MB when not given).
+    """
+    if exact:
+        if memory_budget is None:
+            return ExactDuplicateAccumulator(key_columns, spill_dir=spill_dir)
+        return ExactDuplicateAccumulator(key_columns, memory_budget, spill_dir)
+    return DuplicateAccumulator(key_columns, memory_budget, spill_dir)
@@ -2,16 +2,116 @@
 
 from __future__ import annotations
 
-from typing import List, Optional, Dict, Any
+import os
+import time
+from typing import List, Optional, Dict, Any, Tuple, Union
 
 from .rules.base import BaseRule, ValidationResult
+from .defaults import EXECUTORS
+from .planner import StatsPlan, plan_stats, rule_inputs
 from .report import ValidationReport
 
 
+BUCKETS = ("structural", "quality", "numeric")
+
+
+def _rule_name(rule: BaseRule) -> Optional[str]:
+    return getattr(rule, "name", None)
+
+
+def _failure(rule: BaseRule, exc: BaseException) -> ValidationResult:
+    """Register a rule failure as a warning."""
+    vr = ValidationResult(
+        warning=True,
+        message=f"Rule '{getattr(rule, 'name', rule.__class__.__name__)}' failed",
+        details={"error": str(exc)},
+    )
+    setattr(vr, "name", _rule_name(rule))
+    return vr
+
+
+def apply_rule(rule: BaseRule, profile: Dict[str, Any]) -> Optional[ValidationResult]:
+    """
+    Apply one rule to its inputs (see planner.rule_inputs()). Returns:
+    - ValidationResult if the rule fires
+    - None if the rule returns clean
+    Any rule failure becomes a ValidationResult(warning=True).
+    """
+    try:
+        result = rule.apply(rule_inputs(rule, profile))
+
+        # Clean path → rule returns None
+        if result is None:
+            return None
+
+        # Must be ValidationResult
+        if isinstance(result, ValidationResult):
+            # Attach rule name so tests can find it
+            setattr(result, "name", _rule_name(rule))
+            return result
+
+        # Invalid return type
+        raise TypeError(
+            f"Rule '{getattr(rule, 'name', rule.__class__.__name__)}' "
+            f"returned invalid result type: {type(result)}"
+        )
+
+    except Exception as exc:
+        return _failure(rule, exc)
+
+
+def _is_dataframe(value: Any) -> bool:
+    import pandas as pd
+    return isinstance(value, pd.DataFrame)
+
+
+# ------------------------------------------------------------
+# Process pool workers
+# ------------------------------------------------------------
+
+# The profile is shipped to each worker process once, not once per rule
+_WORKER_PROFILE: Optional[Dict[str, Any]] = None
+
+
+def _init_worker(profile: Dict[str, Any]) -> None:
+    global _WORKER_PROFILE
+    _WORKER_PROFILE = profile
+
+
+def _apply_in_worker(rule: BaseRule) -> Optional[ValidationResult]:
+    return apply_rule(rule, _WORKER_PROFILE)
+
+
+def timed_apply_rule(
+    rule: BaseRule,
+    profile: Dict[str, Any],
+    memory: Optional[str] = "tracemalloc",
+) -> Tuple[Optional[ValidationResult], Dict[str, Any]]:
+    """apply_rule() plus its cost (see timing.measure())."""
+    from .timing import measure
+    return measure(lambda: apply_rule(rule, profile), rows=profile.get("rows"), memory=memory)
+
+
+def _timed_apply_in_worker(rule: BaseRule, memory: Optional[str]):
+    return timed_apply_rule(rule, _WORKER_PROFILE, memory)
+
+
 class RuleEngine:
     """
     Simple rule engine that runs structural, quality, and numeric rules
     and always returns a ValidationReport.
+
+    With workers > 1 the rules of all buckets run concurrently on a thread
+    pool (executor="thread", default) or a process pool
+    (executor="process"). Results keep rule order either way.
+
+    With timings=True every rule's wall time, CPU time, tracemalloc peak
+    and rows are recorded in report.timings["rules"]. Peak memory is None
+    on a thread pool, where concurrent rules would share one peak.
+
+    plan() collects the inputs the rules declare (see BaseRule); profile()
+    and validate() compute just those, so removing a rule or restricting
+    it to some columns removes profiling work too.
     """
 
     def __init__(
@@ -19,10 +119,56 @@ class RuleEngine:
         structural_rules: Optional[List[BaseRule]] = None,
         quality_rules: Optional[List[BaseRule]] = None,
         numeric_rules: Optional[List[BaseRule]] = None,
+        workers: int = 1,
+        executor: str = "thread",
+        timings: bool = False,
     ):
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unknown executor '{executor}', expected one of {EXECUTORS}")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
         self.structural_rules: List[BaseRule] = structural_rules or []
         self.quality_rules: List[BaseRule] = quality_rules or []
         self.numeric_rules: List[BaseRule] = numeric_rules or []
+        self.workers = workers
+        self.executor = executor
+        self.timings = timings
+
+    @property
+    def rules(self) -> List[BaseRule]:
+        """Every rule, in run order."""
+        return self.structural_rules + self.quality_rules + self.numeric_rules
+
+    def plan(self) -> StatsPlan:
+        """The statistics and column reads the rules need (see planner.plan_stats())."""
+        return plan_stats(self.rules)
+
+    def profile(self, data: Any, **options: Any) -> Dict[str, Any]:
+        """
+        Profile a pandas DataFrame (profile_dataframe()) or a CSV / Parquet
+        path (stream_profile()) computing only what the rules need.
+
+        options go to the profiler; when streaming, duplicate detection
+        defaults to the options of the engine's duplicate rule.
+        """
+        plan = self.plan()
+        if isinstance(data, (str, os.PathLike)):
+            from .profiler import stream_profile
+
+            if "duplicates" not in options:
+                for rule in self.rules:
+                    if hasattr(rule, "accumulator_options"):
+                        options["duplicates"] = rule.accumulator_options()
+                        break
+            return stream_profile(os.fspath(data), plan=plan, **options)
+
+        from .profiler import profile_dataframe
+        return profile_dataframe(data, plan=plan, **options)
+
+    def validate(self, data: Union[Any, str], **options: Any) -> ValidationReport:
+        """profile() the data and run() the rules on it."""
+        return self.run(self.profile(data, **options))
 
     def _run_bucket(
         self,
@@ -30,44 +176,44 @@ class RuleEngine:
         profile: Dict[str, Any],
     ) -> List[Optional[ValidationResult]]:
         """
-        Apply all rules in a category. Returns a list where items may be:
-        - ValidationResult if the rule fires
-        - None if the rule returns clean
-        Any rule failure becomes a ValidationResult(warning=True).
+        Apply all rules in a category, in order (see apply_rule()).
+        With timings=True each item is a (result, cost) pair.
         """
-        results: List[Optional[ValidationResult]] = []
-
-        for rule in rules:
-            try:
-                result = rule.apply(profile)
-
-                # Clean path → rule returns None
-                if result is None:
-                    results.append(None)
-                    continue
-
-                # Must be ValidationResult
-                if isinstance(result, ValidationResult):
-                    # Attach rule name so tests can find it
-                    setattr(result, "name", getattr(rule, "name", None))
-                    results.append(result)
-                    continue
-
-                # Invalid return type
-                raise TypeError(
-                    f"Rule '{getattr(rule, 'name', rule.__class__.__name__)}' "
-                    f"returned invalid result type: {type(result)}"
-                )
-
-            except Exception as exc:
-                # Register rule failure as a warning
-                vr = ValidationResult(
-                    warning=True,
-                    message=f"Rule '{getattr(rule, 'name', rule.__class__.__name__)}' failed",
-                    details={"error": str(exc)},
-                )
-                setattr(vr, "name", getattr(rule, "name", None))
-                results.append(vr)
+        if self.timings:
+            return [timed_apply_rule(rule, profile) for rule in rules]
+        return [apply_rule(rule, profile) for rule in rules]
+
+    def _run_parallel(
+        self,
+        rules: List[BaseRule],
+        profile: Dict[str, Any],
+    ) -> List[Optional[ValidationResult]]:
+        """Apply rules concurrently; the result list follows the rule list."""
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+        workers = min(self.workers, len(rules))
+        if self.executor == "process":
+            pool = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(profile,))
+            if self.timings:
+                futures = [pool.submit(_timed_apply_in_worker, rule, "tracemalloc") for rule in rules]
+            else:
+                futures = [pool.submit(_apply_in_worker, rule) for rule in rules]
+        else:
+            pool = ThreadPoolExecutor(workers, thread_name_prefix="dfguard-rule")
+            if self.timings:
+                futures = [pool.submit(timed_apply_rule, rule, profile, None) for rule in rules]
+            else:
+                futures = [pool.submit(apply_rule, rule, profile) for rule in rules]
+
+        results: List[Any] = []
+        with pool:
+            for rule, future in zip(rules, futures):
+                try:
+                    results.append(future.result())
+                except Exception as exc:
+                    # Worker crashes and unpicklable rules / results
+                    failed = _failure(rule, exc)
+                    results.append((failed, None) if self.timings else failed)
 
         return results
 
@@ -75,14 +221,45 @@ class RuleEngine:
         """
         Run all rule buckets and return a unified ValidationReport.
         This is the ONLY place that constructs ValidationReport.
+
+        A hand-built profile holding just a DataFrame gets its planned
+        column statistics computed once here, before any rule runs.
         """
-        structural_results = self._run_bucket(self.structural_rules, profile)
-        quality_results = self._run_bucket(self.quality_rules, profile)
-        numeric_results = self._run_bucket(self.numeric_rules, profile)
+        if profile.get("column_stats") is None and _is_dataframe(profile.get("df")):
+            from .profiler import compute_column_stats
+            profile["column_stats"] = compute_column_stats(profile["df"], plan=self.plan())
+
+        buckets = [self.structural_rules, self.quality_rules, self.numeric_rules]
+        start = time.perf_counter()
+
+        if self.workers > 1 and sum(len(b) for b in buckets) > 1:
+            flat = self._run_parallel([rule for bucket in buckets for rule in bucket], profile)
+            split = []
+            for bucket in buckets:
+                split.append(flat[:len(bucket)])
+                flat = flat[len(bucket):]
+            structural_results, quality_results, numeric_results = split
+        else:
+            structural_results = self._run_bucket(self.structural_rules, profile)
+            quality_results = self._run_bucket(self.quality_rules, profile)
+            numeric_results = self._run_bucket(self.numeric_rules, profile)
+
+        timings = None
+        if self.timings:
+            timings = {"rules": []}
+            unzipped = []
+            for name, bucket, items in zip(BUCKETS, buckets, (structural_results, quality_results, numeric_results)):
+                for rule, (_, cost) in zip(bucket, items):
+                    if cost is not None:
+                        timings["rules"].append({"name": _rule_name(rule), "bucket": name, **cost})
+                unzipped.append([result for result, _ in items])
+            structural_results, quality_results, numeric_results = unzipped
+            timings["rules_wall_seconds"] = round(time.perf_counter() - start, 6)
 
         return ValidationReport(
             profile=profile,
             structural_results=[r for r in structural_results if r is not None],
             quality_results=[r for r in quality_results if r is not None],
             numeric_results=[r for r in numeric_results if r is not None],
+            timings=timings,
         )
@@ -0,0 +1,186 @@
+# src/dfguard/parallel.py
+
+from __future__ import annotations
+
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+import pyarrow as pa
+
+from .profiler import _dataframe_profile, compute_column_stats
+
+
+# Shards per worker: enough to even out wide/narrow columns, few enough
+# that each task still amortises its scheduling cost
+_SHARDS_PER_WORKER = 4
+
+
+def _shared_array(series: pd.Series) -> Optional[pa.Array]:
+    """
+    Arrow array for a column that survives the Arrow round trip unchanged,
+    or None to profile it in the parent process.
+
+    NumPy-backed numeric, bool and datetime columns, categoricals and
+    object columns holding only strings are shared. Pandas extension
+    dtypes and other object columns (mixed values, nested data) are not,
+    since their Arrow version would come back with a different dtype.
+    """
+    dtype = series.dtype
+    if pd.api.types.is_extension_array_dtype(dtype) and not isinstance(dtype, pd.CategoricalDtype):
+        return None
+    if pd.api.types.is_complex_dtype(dtype):
+        return None
+
+    try:
+        array = pa.array(series, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return None
+
+    if pd.api.types.is_object_dtype(dtype) and not (
+        pa.types.is_string(array.type)
+        or pa.types.is_large_string(array.type)
+        or pa.types.is_null(array.type)
+    ):
+        return None
+
+    return array
+
+
+def _shards(arrays: Dict[str, pa.Array], count: int) -> List[List[str]]:
+    """Greedy split of columns into count shards of similar byte size."""
+    shards: List[List[str]] = [[] for _ in range(count)]
+    sizes = [0] * count
+    for name in sorted(arrays, key=lambda n: arrays[n].nbytes, reverse=True):
+        i = sizes.index(min(sizes))
+        shards[i].append(name)
+        sizes[i] += arrays[name].nbytes
+    return [shard for shard in shards if shard]
+
+
+def _shard_stats(
+    names: List[str],
+    table: pa.Table,
+    backend: str,
+    quantile_accuracy: Optional[float],
+    exact_outliers: bool,
+) -> Dict[str, Dict[str, Any]]:
+    result: Dict[str, Dict[str, Any]] = {}
+    for name in names:
+        column = table.column(name)
+        if backend == "arrow":
+            from .arrow_backend import _arrow_stats
+            try:
+                result[name] = _arrow_stats(column, quantile_accuracy, exact_outliers)
+            except Exception as exc:
+                # Same shape as compute_column_stats() gives a failed column
+                result[name] = {
+                    "numeric": False,
+                    "rows": len(column),
+                    "null_count": column.null_count,
+                    "error": str(exc),
+                }
+        else:
+            frame = pd.DataFrame({name: column.to_pandas()})
+            result[name] = compute_column_stats(
+                frame, quantile_accuracy=quantile_accuracy, exact_outliers=exact_outliers
+            )[name]
+    return result
+
+
+def _profile_shard(
+    path: str,
+    names: List[str],
+    backend: str,
+    quantile_accuracy: Optional[float],
+    exact_outliers: bool,
+) -> Dict[str, Dict[str, Any]]:
+    """Worker task: memory-map the shared Arrow IPC file and profile some columns."""
+    with pa.memory_map(path) as source:
+        # Zero-copy: the columns are views into the page cache
+        table = pa.ipc.open_file(source).read_all()
+        return _shard_stats(names, table, backend, quantile_accuracy, exact_outliers)
+
+
+def profile_dataframe_parallel(
+    df: pd.DataFrame,
+    *,
+    workers: Optional[int] = None,
+    backend: str = "pandas",
+    source: Optional[str] = None,
+    quantile_accuracy: Optional[float] = None,
+    exact_outliers: bool = False,
+) -> Dict[str, Any]:
+    """
+    profile_dataframe() with columns sharded across a process pool.
+
+    The shareable columns (see _shared_array()) are written once to an
+    Arrow IPC file in shared memory (/dev/shm where available), which every
+    worker memory-maps, so no column data is pickled; only the per-column
+    statistics travel back. Remaining columns are profiled in this process.
+    backend="arrow" runs the pyarrow.compute kernels in the workers, which
+    avoids the Python-level string checks of the pandas kernel.
+
+    The profile keeps df, so DuplicateRule works as with profile_dataframe().
+    """
+    if backend not in ("pandas", "arrow"):
+        raise ValueError(f"Unknown backend '{backend}'")
+    workers = workers or os.cpu_count() or 1
+
+    # Columns are keyed by position: names may repeat or not be strings
+    arrays: Dict[str, pa.Array] = {}
+    local: List[int] = []
+    for i in range(len(df.columns)):
+        array = _shared_array(df.iloc[:, i])
+        if array is None:
+            local.append(i)
+        else:
+            arrays[str(i)] = array
+
+    by_position: Dict[int, Dict[str, Any]] = {}
+
+    def profile_local() -> None:
+        for i in local:
+            frame = df.iloc[:, [i]]
+            by_position[i] = compute_column_stats(
+                frame, quantile_accuracy=quantile_accuracy, exact_outliers=exact_outliers
+            )[frame.columns[0]]
+
+    if not arrays:
+        profile_local()
+    else:
+        table = pa.table(arrays)
+        shm_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+        fd, path = tempfile.mkstemp(prefix="dfguard-", suffix=".arrow", dir=shm_dir)
+        try:
+            with os.fdopen(fd, "wb") as fh, pa.ipc.new_file(fh, table.schema) as writer:
+                writer.write_table(table)
+            del table
+
+            shards = _shards(arrays, min(len(arrays), workers * _SHARDS_PER_WORKER))
+            with ProcessPoolExecutor(min(workers, len(shards))) as pool:
+                futures = [
+                    pool.submit(_profile_shard, path, shard, backend, quantile_accuracy, exact_outliers)
+                    for shard in shards
+                ]
+                # The parent handles the unshareable columns meanwhile
+                profile_local()
+                for future in futures:
+                    for name, stats in future.result().items():
+                        by_position[int(name)] = stats
+        finally:
+            os.unlink(path)
+
+    stats: Dict[Any, Dict[str, Any]] = {}
+    for i, col in enumerate(df.columns):
+        col_stats = by_position[i]
+        # The Arrow round trip may normalise units (datetime64[s] -> [ns])
+        col_stats["dtype"] = str(df.iloc[:, i].dtype)
+        stats[col] = col_stats
+
+    profile = _dataframe_profile(df, stats, source=source)
+    if backend == "arrow":
+        profile["backend"] = "arrow"
+    return profile
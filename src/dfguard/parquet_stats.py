@@ -0,0 +1,218 @@
+# src/dfguard/parquet_stats.py
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+# Rules that can finish from footer statistics alone
+METADATA_RULES = ("non_empty", "null_ratio")
+
+
+def _is_numeric_type(arrow_type: pa.DataType) -> bool:
+    return pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type)
+
+
+def _column_footer_stats(
+    metadata: pq.FileMetaData,
+    index: int,
+    numeric: bool,
+) -> Tuple[Optional[int], Any, Any]:
+    """
+    Fold one column's chunk statistics over all row groups.
+
+    Returns (null_count, min, max); null_count is None when any non-empty
+    row group lacks it, min/max are None when any lacks them.
+    """
+    nulls: Optional[int] = 0
+    lo = hi = None
+    have_min_max = numeric
+
+    for rg in range(metadata.num_row_groups):
+        row_group = metadata.row_group(rg)
+        if row_group.num_rows == 0:
+            continue
+
+        stats = row_group.column(index).statistics
+        if stats is None or not stats.has_null_count:
+            return None, None, None
+        nulls += stats.null_count
+
+        if not have_min_max:
+            continue
+        if not stats.has_min_max:
+            # A chunk with only nulls legitimately has no min/max
+            if stats.null_count == row_group.num_rows:
+                continue
+            have_min_max = False
+            continue
+
+        lo = stats.min if lo is None else min(lo, stats.min)
+        hi = stats.max if hi is None else max(hi, stats.max)
+
+    if not have_min_max:
+        lo = hi = None
+
+    return nulls, lo, hi
+
+
+def footer_profile(
+    path: str,
+    columns: Optional[List[str]] = None,
+) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Build a profile from the Parquet footer without decoding data pages.
+
+    Returns (profile, untrusted) where untrusted lists the columns whose
+    footer statistics are missing or cannot be trusted (nested columns,
+    whose leaf null counts do not describe top-level nulls). With columns
+    given, only those columns are profiled.
+    """
+    with pq.ParquetFile(path) as pf:
+        metadata = pf.metadata
+        schema = pf.schema_arrow
+
+    rows = metadata.num_rows
+
+    # Leaf index of each top-level, non-nested column
+    leaf_index = {}
+    for i in range(metadata.num_columns):
+        leaf_path = metadata.schema.column(i).path
+        if "." not in leaf_path:
+            leaf_index[leaf_path] = i
+
+    pandas_meta = schema.pandas_metadata or {}
+    index_columns = {c for c in pandas_meta.get("index_columns", []) if isinstance(c, str)}
+
+    if columns is None:
+        fields = [field for field in schema if field.name not in index_columns]
+    else:
+        missing = [c for c in columns if c not in schema.names]
+        if missing:
+            raise ValueError(f"Columns not found in {path}: {missing}")
+        fields = [schema.field(name) for name in columns]
+
+    column_stats: Dict[str, Dict[str, Any]] = {}
+    untrusted: List[str] = []
+
+    for field in fields:
+        numeric = _is_numeric_type(field.type)
+        entry: Dict[str, Any] = {
+            "dtype": str(field.type),
+            "numeric": numeric,
+            "rows": rows,
+            "null_count": None,
+            "count": None,
+            "min": None,
+            "max": None,
+        }
+        column_stats[field.name] = entry
+
+        index = leaf_index.get(field.name)
+        if index is None:
+            untrusted.append(field.name)
+            continue
+
+        nulls, lo, hi = _column_footer_stats(metadata, index, numeric)
+        if nulls is None or (numeric and lo is None and nulls < rows):
+            untrusted.append(field.name)
+            continue
+
+        entry.update({
+            "null_count": nulls,
+            "count": rows - nulls,
+            "min": lo,
+            "max": hi,
+        })
+
+    profile: Dict[str, Any] = {
+        "df": None,
+        "rows": rows,
+        "columns": len(column_stats),
+        "column_names": list(column_stats),
+        "nulls": {col: s["null_count"] for col, s in column_stats.items()},
+        "numeric_stats": {
+            col: {"min": s["min"], "max": s["max"]}
+            for col, s in column_stats.items()
+            if s["numeric"] and s["count"]
+        },
+        "column_stats": column_stats,
+        "metadata_only": True,
+        "stats_source": "parquet_footer",
+        "path": path,
+    }
+
+    return profile, untrusted
+
+
+def _scan_columns(path: str, columns: List[str], chunksize: int) -> Dict[str, Tuple[int, Any, Any]]:
+    """Null count and min/max of a few columns, decoded batch by batch with pyarrow."""
+    import pyarrow.compute as pc
+
+    totals: Dict[str, Tuple[int, Any, Any]] = {col: (0, None, None) for col in columns}
+
+    with pq.ParquetFile(path) as pf:
+        for batch in pf.iter_batches(batch_size=chunksize, columns=columns):
+            for col in columns:
+                array = batch.column(col)
+                nulls, lo, hi = totals[col]
+                nulls += array.null_count
+
+                if _is_numeric_type(array.type) and array.null_count < len(array):
+                    minmax = pc.min_max(array)
+                    batch_lo, batch_hi = minmax["min"].as_py(), minmax["max"].as_py()
+                    lo = batch_lo if lo is None else min(lo, batch_lo)
+                    hi = batch_hi if hi is None else max(hi, batch_hi)
+
+                totals[col] = (nulls, lo, hi)
+
+    return totals
+
+
+def metadata_profile(
+    path: str,
+    *,
+    columns: Optional[List[str]] = None,
+    chunksize: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Footer-statistics profile for NonEmptyRule / NullRatioRule, of the
+    given columns or all of them.
+
+    Columns with missing or untrustworthy footer statistics are scanned
+    (only those columns, with pyarrow) and the fallback is recorded in
+    profile["notes"].
+    """
+    from .profiler import DEFAULT_CHUNKSIZE
+
+    profile, untrusted = footer_profile(path, columns)
+    if not untrusted:
+        return profile
+
+    scanned = _scan_columns(path, untrusted, chunksize or DEFAULT_CHUNKSIZE)
+
+    for col, (nulls, lo, hi) in scanned.items():
+        entry = profile["column_stats"][col]
+        entry.update({
+            "null_count": nulls,
+            "count": entry["rows"] - nulls,
+            "min": lo,
+            "max": hi,
+        })
+        profile["nulls"][col] = nulls
+
+    profile["numeric_stats"] = {
+        col: {"min": s["min"], "max": s["max"]}
+        for col, s in profile["column_stats"].items()
+        if s["numeric"] and s["count"]
+    }
+    profile["stats_source"] = "parquet_footer+scan"
+    profile.setdefault("notes", []).append(
+        "Parquet footer statistics missing or untrusted for "
+        f"{', '.join(untrusted)}; those columns were scanned"
+    )
+
+    return profile
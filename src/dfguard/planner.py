@@ -0,0 +1,173 @@
+# src/dfguard/planner.py
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional
+
+
+# Column statistics a rule can declare in BaseRule.requires:
+#
+#   null_count         nulls and non-null count
+#   moments            min / max / sum / mean / m2 of numeric columns
+#   quartiles          q1 / q3 / IQR outlier count of numeric columns
+#   whitespace         whitespace issue count of text columns
+#   numeric_coercible  values of non-numeric columns that parse as numbers
+#
+# null_count and moments are single vectorized passes and are computed for
+# every profiled column; the others only where a planned rule needs them.
+STATS = ("null_count", "moments", "quartiles", "whitespace", "numeric_coercible")
+BASE_STATS = frozenset({"null_count", "moments"})
+
+# Column kinds a rule can restrict itself to with BaseRule.dtypes
+DTYPE_KINDS = ("numeric", "text", "non_numeric")
+
+
+def dtype_kinds(dtype: Any) -> Optional[FrozenSet[str]]:
+    """
+    The DTYPE_KINDS a column dtype (a dtype or its pandas name) belongs to.
+
+      - numeric: numbers in the select_dtypes("number") sense, no bools
+      - text: object, string and categorical columns
+      - non_numeric: every dtype pandas does not call numeric
+
+    None when the dtype is not known to pandas.
+    """
+    import pandas as pd
+
+    from .profiler import _has_text, _is_numeric_column
+
+    try:
+        dtype = pd.api.types.pandas_dtype(dtype)
+    except TypeError:
+        return None
+
+    kinds = set()
+    if _is_numeric_column(dtype):
+        kinds.add("numeric")
+    if _has_text(dtype):
+        kinds.add("text")
+    if not pd.api.types.is_numeric_dtype(dtype):
+        kinds.add("non_numeric")
+    return frozenset(kinds)
+
+
+@dataclass(frozen=True)
+class Requirement:
+    """
+    The inputs one rule declares (see BaseRule.requirement()).
+
+    stats are computed on the columns matching columns (None: every column)
+    and dtypes (a DTYPE_KINDS entry, None: any dtype). values=True means the
+    rule reads those columns' values itself, as DuplicateRule hashes rows.
+    """
+    stats: FrozenSet[str] = frozenset()
+    columns: Optional[FrozenSet[str]] = None
+    dtypes: Optional[str] = None
+    values: bool = False
+
+    def matches(self, name: str, dtype: Any = None) -> bool:
+        """Whether the column is an input; an unknown dtype matches any kind."""
+        if self.columns is not None and name not in self.columns:
+            return False
+        if self.dtypes is None or dtype is None:
+            return True
+        kinds = dtype_kinds(dtype)
+        return kinds is None or self.dtypes in kinds
+
+
+@dataclass
+class StatsPlan:
+    """
+    What profiling must compute for a set of rules (see plan_stats()).
+
+    complete=True when some rule does not declare its inputs: every
+    statistic is then computed for every column, as without a plan.
+    """
+    requirements: List[Requirement] = field(default_factory=list)
+    complete: bool = False
+
+    def stats_for(self, name: str, dtype: Any = None) -> Optional[FrozenSet[str]]:
+        """Statistics to compute on a column; None means all of them."""
+        if self.complete:
+            return None
+        wanted = set(BASE_STATS)
+        for req in self.requirements:
+            if req.matches(name, dtype):
+                wanted |= req.stats
+        return frozenset(wanted)
+
+    def needs(self, name: str, dtype: Any = None) -> bool:
+        """Whether the column has to be read at all."""
+        if self.complete:
+            return True
+        return any(
+            (req.stats or req.values) and req.matches(name, dtype)
+            for req in self.requirements
+        )
+
+    def columns(self, dtypes: Dict[str, Any]) -> List[str]:
+        """Columns to read, from a name -> dtype mapping (dtype None when not known yet)."""
+        return [name for name, dtype in dtypes.items() if self.needs(name, dtype)]
+
+    @property
+    def reads_rows(self) -> bool:
+        """Whether some rule reads row values (duplicate detection)."""
+        return self.complete or any(req.values for req in self.requirements)
+
+
+def rule_requirement(rule: Any) -> Optional[Requirement]:
+    """A rule's declared inputs; None for rules that declare nothing."""
+    requirement = getattr(rule, "requirement", None)
+    return requirement() if requirement is not None else None
+
+
+def plan_stats(rules: Iterable[Any]) -> StatsPlan:
+    """
+    Plan the minimal statistics and column reads for the rules.
+
+    Raises ValueError for statistics or dtype kinds no profiler knows.
+    """
+    plan = StatsPlan()
+    for rule in rules:
+        req = rule_requirement(rule)
+        if req is None:
+            plan.complete = True
+            continue
+
+        name = getattr(rule, "name", rule.__class__.__name__)
+        unknown = sorted(req.stats - set(STATS))
+        if unknown:
+            raise ValueError(f"Rule '{name}' requires unknown statistics {unknown}, expected some of {STATS}")
+        if req.dtypes is not None and req.dtypes not in DTYPE_KINDS:
+            raise ValueError(f"Rule '{name}' applies to unknown dtypes '{req.dtypes}', expected one of {DTYPE_KINDS}")
+        plan.requirements.append(req)
+
+    return plan
+
+
+def rule_inputs(rule: Any, profile: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    The profile as one rule sees it.
+
+    A rule declaring statistics on some columns or dtypes gets a shallow
+    copy whose column_stats hold just those columns; any other rule gets
+    the profile itself. Declared columns missing from column_stats raise.
+    """
+    req = rule_requirement(rule)
+    stats = profile.get("column_stats")
+    if req is None or not req.stats or stats is None:
+        return profile
+    if req.columns is None and req.dtypes is None:
+        return profile
+
+    if req.columns is not None:
+        missing = sorted(req.columns - set(stats))
+        if missing:
+            raise ValueError(f"Columns not profiled: {missing}")
+
+    view = dict(profile)
+    view["column_stats"] = {
+        col: s for col, s in stats.items() if req.matches(col, s.get("dtype"))
+    }
+    return view
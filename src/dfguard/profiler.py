@@ -1,39 +1,323 @@
 # src/validator/profiler.py
 import os
-from typing import Any, Dict
+from typing import Any, Collection, Dict, Iterable, List, Optional, Union
 
+import numpy as np
 import pandas as pd
 
+from .defaults import DEFAULT_CHUNKSIZE
+from .planner import STATS, StatsPlan
 
-def profile_dataframe(df: pd.DataFrame, *, source: str | None = None) -> Dict[str, Any]:
+
+# One regex covering every whitespace issue WhitespaceRule reports:
+# leading/trailing whitespace, runs of 2+ whitespace, tabs and literal "\t".
+_WHITESPACE_PATTERN = r"^\s|\s\Z|\s{2}|\t|\\t"
+
+
+def _is_numeric_column(dtype) -> bool:
+    """Numeric in the select_dtypes("number") sense: no bools, no complex."""
+    return (
+        pd.api.types.is_numeric_dtype(dtype)
+        and not pd.api.types.is_bool_dtype(dtype)
+        and not pd.api.types.is_complex_dtype(dtype)
+    )
+
+
+def _has_text(dtype) -> bool:
+    """Only object/string/categorical columns can render with whitespace."""
+    return (
+        pd.api.types.is_object_dtype(dtype)
+        or pd.api.types.is_string_dtype(dtype)
+        or isinstance(dtype, pd.CategoricalDtype)
+    )
+
+
+def column_stats(series: pd.Series) -> Dict[str, Any]:
+    """
+    Fused column-statistics kernel.
+
+    Sweeps a single column once and returns every statistic the built-in
+    rules consume, so no rule has to touch the DataFrame again:
+
+      - null_count / count
+      - min, max, sum, mean, m2, q1, q3, outliers   (numeric columns)
+      - whitespace                               (text columns)
+      - numeric_coercible                        (non-numeric columns)
+
+    Statistics that do not apply to the column's dtype are None.
+    """
+    stats, _ = _column_pass(series)
+    return stats
+
+
+def _column_pass(
+    series: pd.Series,
+    *,
+    quartiles: bool = True,
+    stats: Optional[Collection[str]] = None,
+):
+    """
+    Shared body of column_stats() and the streaming accumulators.
+
+    Returns (stats, values) where values is the null-free numeric array for
+    numeric columns when their quartiles are wanted (None otherwise), so
+    callers can feed it to a sketch without extracting it a second time.
+
+    stats limits the optional statistics (quartiles, whitespace,
+    numeric_coercible, see planner.STATS) to compute; skipped ones are None.
+    """
+    wanted = STATS if stats is None else stats
+    quartiles = quartiles and "quartiles" in wanted
+
+    null_mask = series.isna().to_numpy()
+    null_count = int(null_mask.sum())
+    non_null = series[~null_mask] if null_count else series
+
+    result: Dict[str, Any] = {
+        "dtype": str(series.dtype),
+        "numeric": _is_numeric_column(series.dtype),
+        "rows": len(series),
+        "null_count": null_count,
+        "count": len(series) - null_count,
+        "min": None,
+        "max": None,
+        "sum": None,
+        "mean": None,
+        "m2": None,
+        "q1": None,
+        "q3": None,
+        "outliers": None,
+        "whitespace": 0,
+        "numeric_coercible": None,
+    }
+
+    if result["numeric"]:
+        np_dtype = getattr(series.dtype, "numpy_dtype", series.dtype)
+        values = non_null.to_numpy(dtype=np_dtype)
+        result.update(_numeric_stats(values, quartiles=quartiles))
+        return result, values if "quartiles" in wanted else None
+
+    if _has_text(series.dtype):
+        if "whitespace" not in wanted:
+            result["whitespace"] = None
+        elif len(non_null):
+            result["whitespace"] = int(
+                non_null.astype(str).str.contains(_WHITESPACE_PATTERN, regex=True).sum()
+            )
+
+    if not pd.api.types.is_numeric_dtype(series.dtype) and "numeric_coercible" in wanted:
+        coerced = pd.to_numeric(non_null, errors="coerce")
+        result["numeric_coercible"] = int(coerced.notna().sum())
+
+    return result, None
+
+
+def _numeric_stats(values: np.ndarray, *, quartiles: bool = True) -> Dict[str, Any]:
+    """Moments, quartiles and IQR outlier count of a null-free numeric array."""
+    if values.size == 0:
+        return {"outliers": 0} if quartiles else {}
+
+    as_float = values.astype(np.float64, copy=False)
+    mean = float(as_float.mean())
+    # Squared deviations from the mean (two-pass, compensated), not sum
+    # of squares minus squared sum, which cancels on large offsets
+    deviations = as_float - mean
+    m2 = float(np.dot(deviations, deviations)) - float(deviations.sum()) ** 2 / values.size
+    stats: Dict[str, Any] = {
+        "min": values.min(),
+        "max": values.max(),
+        "sum": float(as_float.sum()),
+        "mean": mean,
+        "m2": max(m2, 0.0),
+    }
+
+    if quartiles:
+        q1, q3 = np.quantile(as_float, [0.25, 0.75])
+        lower, upper = iqr_fences(q1, q3)
+        stats["q1"] = float(q1)
+        stats["q3"] = float(q3)
+        stats["outliers"] = int(np.count_nonzero((as_float < lower) | (as_float > upper)))
+
+    return stats
+
+
+def iqr_fences(q1: float, q3: float):
+    """Tukey fences used by NumericOutlierRule."""
+    iqr = q3 - q1
+    return q1 - 1.5 * iqr, q3 + 1.5 * iqr
+
+
+def sketch_quartiles(
+    values: np.ndarray,
+    *,
+    quantile_accuracy: float,
+    exact_outliers: bool = False,
+    chunksize: int = 100_000,
+) -> Dict[str, Any]:
+    """
+    Approximate q1 / q3 / outliers of a null-free numeric array.
+
+    Values are sketched chunk by chunk (see sketches.QuantileSketch) with a
+    rank error of at most quantile_accuracy; like the streaming profile,
+    columns of up to 50,000 values stay exact. The outlier count is the
+    sketch estimate unless exact_outliers, which counts the values outside
+    the sketch-derived fences exactly.
+    """
+    from .sketches import QuantileSketch, k_for_error
+
+    if not values.size:
+        return {"outliers": 0}
+
+    sketch = QuantileSketch(k=k_for_error(quantile_accuracy))
+    for start in range(0, values.size, chunksize):
+        sketch.update(values[start:start + chunksize])
+
+    q1, q3 = sketch.quantiles([0.25, 0.75])
+    lower, upper = iqr_fences(q1, q3)
+    if exact_outliers or sketch.is_exact:
+        as_float = values.astype(np.float64, copy=False)
+        outliers = int(np.count_nonzero((as_float < lower) | (as_float > upper)))
+    else:
+        outliers = sketch.count_outside(lower, upper)
+
+    return {
+        "q1": q1,
+        "q3": q3,
+        "outliers": outliers,
+        "quartiles_exact": sketch.is_exact,
+        "quantile_error": sketch.error_bound,
+        "outliers_exact": exact_outliers or sketch.is_exact,
+    }
+
+
+def compute_column_stats(
+    df: pd.DataFrame,
+    *,
+    quantile_accuracy: Optional[float] = None,
+    exact_outliers: bool = False,
+    plan: Optional[StatsPlan] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run the fused kernel over every column.
+
+    A column the kernel cannot process keeps its null count and gets an
+    "error" entry; rules that need the missing statistics then fail (and
+    are reported as rule warnings) instead of profiling crashing outright.
+
+    With quantile_accuracy set, quartiles and outliers come from
+    sketch_quartiles() instead of an exact sort of each column.
+
+    With a plan (see RuleEngine.plan()) only the columns and statistics
+    its rules need are computed.
+    """
+    result: Dict[str, Dict[str, Any]] = {}
+
+    for col in df.columns:
+        series = df[col]
+        wanted = None
+        if plan is not None:
+            if not plan.needs(col, series.dtype):
+                continue
+            wanted = plan.stats_for(col, series.dtype)
+        try:
+            if quantile_accuracy is None:
+                result[col], _ = _column_pass(series, stats=wanted)
+            else:
+                stats, values = _column_pass(series, quartiles=False, stats=wanted)
+                if values is not None:
+                    stats.update(sketch_quartiles(
+                        values, quantile_accuracy=quantile_accuracy, exact_outliers=exact_outliers
+                    ))
+                result[col] = stats
+        except Exception as exc:
+            result[col] = {
+                "dtype": str(series.dtype),
+                "numeric": False,
+                "rows": len(series),
+                "null_count": int(series.isna().sum()),
+                "error": str(exc),
+            }
+
+    return result
+
+
+def get_column_stats(profile: Dict[str, Any], strict: bool = True) -> Dict[str, Dict[str, Any]]:
+    """
+    Return the fused column statistics of a profile.
+
+    Profiles built by hand (without profile_dataframe) get them computed on
+    demand. With strict=True, a column the kernel failed on raises so the
+    calling rule is reported as failed.
+    """
+    stats = profile.get("column_stats")
+    if stats is None:
+        stats = compute_column_stats(profile["df"])
+        profile["column_stats"] = stats
+
+    if strict:
+        for col, col_stats in stats.items():
+            if "error" in col_stats:
+                raise ValueError(f"Column '{col}' could not be profiled: {col_stats['error']}")
+
+    return stats
+
+
+def numeric_summary(col_stats: Dict[str, Any]) -> Dict[str, float]:
+    """min/max/mean/std for the renderer, derived from the fused moments."""
+    count = col_stats["count"]
+    std = (col_stats["m2"] / (count - 1)) ** 0.5 if count > 1 else float("nan")
+
+    return {
+        "min": col_stats["min"],
+        "max": col_stats["max"],
+        "mean": col_stats["mean"],
+        "std": std,
+    }
+
+
+def profile_dataframe(
+    df: pd.DataFrame,
+    *,
+    source: str | None = None,
+    quantile_accuracy: Optional[float] = None,
+    exact_outliers: bool = False,
+    plan: Optional[StatsPlan] = None,
+) -> Dict[str, Any]:
     """
     Core profiling logic.
 
     Accepts a pandas DataFrame directly and returns the profile dict
-    used by the RuleEngine and renderers.
+    used by the RuleEngine and renderers. quantile_accuracy switches the
+    outlier quartiles to a quantile sketch (see sketch_quartiles()).
+    plan limits column_stats to what the planned rules need.
     """
-    numeric_cols = df.select_dtypes(include=["number"]).columns
-    numeric_stats: Dict[str, Dict[str, float]] = {}
+    stats = compute_column_stats(
+        df, quantile_accuracy=quantile_accuracy, exact_outliers=exact_outliers, plan=plan
+    )
+    return _dataframe_profile(df, stats, source=source)
 
-    for col in numeric_cols:
-        series = df[col].dropna()
-        if series.empty:
-            continue
 
-        numeric_stats[col] = {
-            "min": series.min(),
-            "max": series.max(),
-            "mean": series.mean(),
-            "std": series.std(),
-        }
+def _dataframe_profile(
+    df: pd.DataFrame,
+    stats: Dict[str, Dict[str, Any]],
+    *,
+    source: str | None = None,
+) -> Dict[str, Any]:
+    """Assemble the profile dict of an in-memory DataFrame from its column stats."""
+    numeric_stats: Dict[str, Dict[str, float]] = {
+        col: numeric_summary(s)
+        for col, s in stats.items()
+        if s.get("numeric") and s["count"]
+    }
 
     profile: Dict[str, Any] = {
         "df": df,
         "rows": len(df),
         "columns": len(df.columns),
         "column_names": list(df.columns),
-        "nulls": df.isna().sum().to_dict(),
+        "nulls": {col: s["null_count"] for col, s in stats.items()},
         "numeric_stats": numeric_stats,
+        "column_stats": stats,
     }
 
     # Preserve path information when available (for JSON output)
@@ -43,19 +327,313 @@ def profile_dataframe(df: pd.DataFrame, *, source: str | None = None) -> Dict[st
     return profile
 
 
-def quick_profile(path: str) -> Dict[str, Any]:
+def profile_chunks(
+    chunks: Iterable[pd.DataFrame],
+    *,
+    source: Optional[str] = None,
+    sketch_k: int = 4096,
+    column_names: Optional[List[str]] = None,
+    duplicates: Optional[Dict[str, Any]] = None,
+    plan: Optional[StatsPlan] = None,
+    dtypes: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    """
+    Streaming counterpart of profile_dataframe().
+
+    Feeds each chunk into mergeable accumulators and never holds more than
+    one chunk in memory. The profile has df=None; rules read everything
+    from column_stats / duplicate_count.
+
+    duplicates configures duplicate detection, see
+    duplicates.make_duplicate_accumulator(). plan limits the statistics
+    per column, and skips duplicate detection when no rule reads rows.
+    dtypes are the schema's all-null column dtypes (see _null_dtypes()).
+    """
+    from .accumulators import ProfileAccumulator
+
+    acc = ProfileAccumulator(
+        sketch_k=sketch_k, column_names=column_names, duplicates=duplicates, plan=plan,
+        dtypes=dtypes,
+    )
+    for chunk in chunks:
+        acc.update(chunk)
+
+    return acc.to_profile(source=source)
+
+
+def stream_profile(
+    path: str,
+    *,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    columns: Optional[List[str]] = None,
+    backend: str = "pandas",
+    duplicates: Optional[Dict[str, Any]] = None,
+    quantile_accuracy: Optional[float] = None,
+    exact_outliers: bool = False,
+    sample: Optional[Union[int, float]] = None,
+    sample_seed: Optional[int] = 0,
+    plan: Optional[StatsPlan] = None,
+) -> Dict[str, Any]:
+    """
+    Profile a file of any size in bounded memory.
+
+    - CSV files are read chunksize rows at a time
+    - Parquet files are read record batch by record batch, one row group
+      at a time
+
+    With columns given, only those columns are read and validated.
+    backend="arrow" reads and profiles with pyarrow instead of pandas.
+    duplicates takes key_columns / exact / memory_budget / spill_dir for
+    duplicate detection (see duplicates.make_duplicate_accumulator()).
+
+    Outlier quartiles are exact up to 50,000 values per column and come
+    from a quantile sketch beyond that; quantile_accuracy sets its rank
+    error (default about 0.07%). exact_outliers re-reads the sketched
+    numeric columns once more to count outliers against the sketch fences
+    exactly.
+
+    sample (rows, or a fraction of them) profiles a random sample instead:
+    reservoir (rows) or Bernoulli (fraction) sampling over the CSV chunks,
+    clusters of row groups for Parquet. profile["sample"] records how it
+    was drawn, and ratio rules then report confidence intervals. Duplicates
+    are then counted within the sample, over duplicates' key_columns.
+
+    plan (see RuleEngine.plan()) reads only the columns the planned rules
+    need and computes only their statistics; column_names still lists
+    every column. The arrow backend reads and computes everything.
+    """
+    from .sketches import k_for_error
+
+    if sample is not None:
+        return _sample_profile(
+            path, sample, sample_seed,
+            chunksize=chunksize, columns=columns, backend=backend, plan=plan,
+            duplicates=duplicates,
+            quantile_accuracy=quantile_accuracy, exact_outliers=exact_outliers,
+        )
+
+    ext = os.path.splitext(path)[1].lower()
+    sketch_k = k_for_error(quantile_accuracy) if quantile_accuracy is not None else 4096
+
+    if backend == "arrow":
+        from .arrow_backend import stream_profile_arrow
+        profile = stream_profile_arrow(
+            path, chunksize=chunksize, columns=columns, duplicates=duplicates, sketch_k=sketch_k
+        )
+    elif backend != "pandas":
+        raise ValueError(f"Unknown backend '{backend}'")
+    elif ext == ".csv":
+        names = planned = None
+        if plan is not None:
+            names = list(pd.read_csv(path, nrows=0, usecols=columns).columns)
+            # CSV dtypes are inferred per chunk: plan by column name only
+            planned = plan.columns(dict.fromkeys(names))
+        # With no column planned, the first one is read just to count rows
+        usecols = (planned or names[:1]) if planned is not None else columns
+        with pd.read_csv(path, chunksize=chunksize, usecols=usecols) as reader:
+            chunks = reader if planned is None else (chunk[planned] for chunk in reader)
+            profile = profile_chunks(
+                chunks, source=path, duplicates=duplicates, sketch_k=sketch_k,
+                column_names=planned, plan=plan,
+            )
+        if names is not None:
+            profile["column_names"] = names
+            profile["columns"] = len(names)
+    elif ext == ".parquet":
+        profile = _stream_parquet(
+            path, chunksize=chunksize, columns=columns, duplicates=duplicates,
+            sketch_k=sketch_k, plan=plan,
+        )
+    else:
+        raise ValueError(f"Unsupported format: {path}")
+
+    if exact_outliers:
+        recount_outliers(path, profile, chunksize=chunksize)
+
+    return profile
+
+
+def _sample_profile(
+    path: str,
+    sample: Union[int, float],
+    seed: Optional[int],
+    *,
+    chunksize: int,
+    columns: Optional[List[str]],
+    backend: str,
+    plan: Optional[StatsPlan] = None,
+    duplicates: Optional[Dict[str, Any]] = None,
+    **quantiles: Any,
+) -> Dict[str, Any]:
+    from .sampling import parse_sample, sample_file
+
+    frame, info = sample_file(
+        path, parse_sample(sample), chunksize=chunksize, columns=columns, seed=seed
+    )
+
+    if backend == "arrow":
+        from .arrow_backend import profile_dataframe_arrow
+        profile = profile_dataframe_arrow(frame, **quantiles)
+        profile["path"] = path
+    elif backend == "pandas":
+        profile = profile_dataframe(frame, source=path, plan=plan, **quantiles)
+    else:
+        raise ValueError(f"Unknown backend '{backend}'")
+
+    # The sample stays in profile["df"], where DuplicateRule compares rows
+    # exactly; validate_profile() picks its key columns up from here
+    key_columns = (duplicates or {}).get("key_columns")
+    missing = [c for c in key_columns or [] if c not in frame.columns]
+    if missing:
+        raise ValueError(f"Key columns not found: {missing}")
+    profile["duplicate_keys"] = list(key_columns) if key_columns else None
+
+    profile["sample"] = info
+    return profile
+
+
+def recount_outliers(path: str, profile: Dict[str, Any], *, chunksize: int = DEFAULT_CHUNKSIZE) -> None:
+    """
+    Second pass: exact outlier counts against the sketch-derived fences.
+
+    Only numeric columns whose outlier count is still an estimate are read
+    again; their column_stats are updated in place.
+    """
+    stats = profile["column_stats"]
+    pending = [
+        col for col, s in stats.items()
+        if s.get("numeric") and s.get("count") and not s.get("outliers_exact", True)
+    ]
+    if not pending:
+        return
+
+    fences = {col: iqr_fences(stats[col]["q1"], stats[col]["q3"]) for col in pending}
+    counts = dict.fromkeys(pending, 0)
+
+    def count(chunk: pd.DataFrame) -> None:
+        for col in pending:
+            lower, upper = fences[col]
+            values = pd.to_numeric(chunk[col]).to_numpy(dtype=np.float64, na_value=np.nan)
+            counts[col] += int(np.count_nonzero((values < lower) | (values > upper)))
+
+    if os.path.splitext(path)[1].lower() == ".csv":
+        with pd.read_csv(path, chunksize=chunksize, usecols=pending) as reader:
+            for chunk in reader:
+                count(chunk)
+    else:
+        import pyarrow.parquet as pq
+
+        with pq.ParquetFile(path) as pf:
+            for batch in pf.iter_batches(batch_size=chunksize, columns=pending):
+                count(batch.to_pandas())
+
+    for col in pending:
+        stats[col]["outliers"] = counts[col]
+        stats[col]["outliers_exact"] = True
+
+
+def _stream_parquet(
+    path: str,
+    *,
+    chunksize: int,
+    columns: Optional[List[str]],
+    duplicates: Optional[Dict[str, Any]] = None,
+    sketch_k: int = 4096,
+    plan: Optional[StatsPlan] = None,
+) -> Dict[str, Any]:
+    import pyarrow.parquet as pq
+
+    with pq.ParquetFile(path) as pf:
+        schema = pf.schema_arrow
+        if columns is None:
+            names = _data_columns(schema)
+        else:
+            missing = [c for c in columns if c not in schema.names]
+            if missing:
+                raise ValueError(f"Columns not found in {path}: {missing}")
+            names = list(columns)
+
+        read = names if columns is not None else None
+        if plan is not None:
+            read = plan.columns({name: _arrow_to_pandas_dtype(schema.field(name).type) for name in names})
+
+        batches = (
+            batch.to_pandas()
+            for batch in pf.iter_batches(batch_size=chunksize, columns=read)
+        )
+        profile = profile_chunks(
+            batches, source=path, column_names=read if read is not None else names,
+            duplicates=duplicates, sketch_k=sketch_k, plan=plan,
+            dtypes=_null_dtypes(schema, names),
+        )
+
+    profile["column_names"] = names
+    profile["columns"] = len(names)
+    return profile
+
+
+def _arrow_to_pandas_dtype(arrow_type) -> Any:
+    """The numpy dtype pandas gives an Arrow type, None when there is none."""
+    try:
+        return arrow_type.to_pandas_dtype()
+    except (NotImplementedError, TypeError):
+        return None
+
+
+def _null_dtypes(schema, names: List[str]) -> Dict[str, str]:
+    """
+    The dtype pandas gives each Arrow schema column when it holds only
+    nulls: float64 for integers, object for strings, bools and the rest.
+    """
+    import pyarrow as pa
+
+    dtypes = {}
+    for name in names:
+        try:
+            dtype = pa.nulls(1, schema.field(name).type).to_pandas().dtype
+        except (pa.ArrowNotImplementedError, NotImplementedError, TypeError):
+            dtype = None
+        # Non-numeric columns stream as object, with values or without
+        dtypes[name] = str(dtype) if dtype is not None and _is_numeric_column(dtype) else "object"
+    return dtypes
+
+
+def _data_columns(schema) -> List[str]:
+    """Column names of a Parquet schema, minus pandas-written index columns."""
+    metadata = schema.pandas_metadata or {}
+    index_columns = {c for c in metadata.get("index_columns", []) if isinstance(c, str)}
+    return [n for n in schema.names if n not in index_columns]
+
+
+def quick_profile(
+    path: str,
+    *,
+    metadata_only: bool = False,
+    columns: Optional[List[str]] = None,
+) -> Dict[str, Any]:
     """
     Backwards-compatible wrapper used by the CLI.
 
-    - Loads the file from disk
+    - Loads the whole file (or the given columns) from disk
     - Builds a profile using profile_dataframe(df)
+
+    With metadata_only=True (Parquet only) rows, nulls and numeric min/max
+    come from the file footer and no data pages are decoded.
+
+    Use stream_profile() for files that do not fit in memory.
     """
     ext = os.path.splitext(path)[1].lower()
 
+    if metadata_only:
+        if ext != ".parquet":
+            raise ValueError(f"Metadata-only profiling requires a Parquet file: {path}")
+        from .parquet_stats import metadata_profile
+        return metadata_profile(path, columns=columns)
+
     if ext == ".parquet":
-        df = pd.read_parquet(path)
+        df = pd.read_parquet(path, columns=columns)
     elif ext == ".csv":
-        df = pd.read_csv(path, nrows=50000)
+        df = pd.read_csv(path, usecols=columns)
     else:
         raise ValueError(f"Unsupported format: {path}")
 
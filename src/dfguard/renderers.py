@@ -1,6 +1,17 @@
-from rich.console import Console
+from functools import lru_cache
 
-console = Console()
+
+@lru_cache(maxsize=None)
+def _console():
+    # rich is imported on first render, not when the CLI starts
+    from rich.console import Console
+    return Console()
+
+
+def __getattr__(name):
+    if name == "console":
+        return _console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # ------------------------------------------------------------
 # Helpers
@@ -18,14 +29,14 @@ def frame(title: str, lines: list[str]):
 
     header = f"┌─ {title} "
     header += "─" * max(0, width - len(header))
-    console.print(header)
+    _console().print(header)
 
     for line in lines:
-        console.print(f"│ {line}")
+        _console().print(f"│ {line}")
 
     footer = "└" + "─" * (width - 1)
-    console.print(footer)
-    console.print()  # extra spacing
+    _console().print(footer)
+    _console().print()  # extra spacing
 
 
 def _split_zero_nonzero(details, zero_values=("0.0%", "0%")):
@@ -86,6 +97,7 @@ def render_console(report):
     _render_structural(report)
     _render_quality(report)
     _render_numeric(report)
+    _render_performance(report)
     _render_status(report)
 
 
@@ -95,6 +107,7 @@ def render_console(report):
 
 def _render_summary(report):
     p = report.profile
+    column_stats = p.get("column_stats")
     df = p.get("df")
     rows = p.get("rows", 0)
     cols = p.get("columns", 0)
@@ -102,7 +115,9 @@ def _render_summary(report):
 
     lines = [f"Rows: {rows:,}"]
 
-    if df is not None:
+    if column_stats is not None:
+        num_numeric = sum(1 for s in column_stats.values() if s.get("numeric"))
+    elif df is not None:
         num_numeric = len(df.select_dtypes(include=["number"]).columns)
     else:
         num_numeric = 0
@@ -121,6 +136,17 @@ def _render_summary(report):
 
     lines.append(f"Names: {names}")
 
+    sample = p.get("sample")
+    if sample:
+        lines.append(
+            f"Sample: {sample['rows']:,} of {sample['population_rows']:,} rows "
+            f"({sample['method']}); ratios are estimates, "
+            f"{sample['confidence']:.0%} intervals in --json"
+        )
+
+    for note in p.get("notes") or []:
+        lines.append(f"Note: {note}")
+
     frame("Data Summary", lines)
 
 
@@ -154,8 +180,14 @@ def _render_structural(report):
                 row_text = "1 duplicate row"
             else:
                 row_text = f"{count} duplicate rows"
+            if details.get("approximate"):
+                row_text = "~" + row_text
 
-            symbol = "⚠" if count > 0 else "•"
+            keys = details.get("key_columns")
+            if keys:
+                row_text += f" on {', '.join(keys)}"
+
+            symbol = "⚠" if res.warning else "•"
             lines.append(f"{symbol} Duplicate rows: {row_text} ({ratio})")
             continue
 
@@ -253,6 +285,12 @@ def _render_numeric(report):
 
         min_val = stats.get("min")
         max_val = stats.get("max")
+
+        # Footer-statistics profiles only know the range
+        if "mean" not in stats:
+            lines.append(f"• {col}: [{min_val} → {max_val}]")
+            continue
+
         mean = float(stats.get("mean", 0.0) or 0.0)
         median = float(stats.get("median", mean) or mean)
         outlier = _find_outlier_info(report.numeric_results, col)
@@ -265,7 +303,14 @@ def _render_numeric(report):
             count = outlier.get("count", 0)
             ratio = _fmt_ratio(outlier.get("ratio", "0.0%"))
             symbol = "⚠" if count > 0 else "•"
-            lines.append(f"   {symbol} {count} outliers ({ratio})")
+            if "quantile_error" in outlier:
+                approx = "" if outlier.get("outliers_exact") else "~"
+                lines.append(
+                    f"   {symbol} {approx}{count} outliers ({ratio}, "
+                    f"quartiles ±{outlier['quantile_error']} rank)"
+                )
+            else:
+                lines.append(f"   {symbol} {count} outliers ({ratio})")
 
         # Skew (only if meaningful)
         if median != 0:
@@ -280,18 +325,169 @@ def _render_numeric(report):
     frame("Numeric Distribution", lines)
 
 
+# ------------------------------------------------------------
+# Performance (Spark storage layout)
+# ------------------------------------------------------------
+
+def _render_performance(report):
+    results = getattr(report, "performance_results", None)
+    if not results:
+        return
+
+    lines = []
+    for res in results:
+        symbol = "⚠" if res.warning else "•"
+        lines.append(f"{symbol} {res.message}")
+        for k, v in (res.details or {}).items():
+            if isinstance(v, dict):
+                # Histograms: just the non-empty buckets
+                v = ", ".join(f"{label} {n}" for label, n in v.items() if n)
+            lines.append(f"   - {k}: {v}")
+
+    frame("Performance", lines)
+
+
 # ------------------------------------------------------------
 # Status
 # ------------------------------------------------------------
 
 def _render_status(report):
     if report.status == "error":
-        console.print("✗ Status: ERROR", style="bold red")
+        _console().print("✗ Status: ERROR", style="bold red")
     elif report.status == "warning":
-        console.print("⚠ Status: WARNING", style="bold yellow")
+        _console().print("⚠ Status: WARNING", style="bold yellow")
     else:
-        console.print("✓ Status: OK", style="bold green")
-    console.print()
+        _console().print("✓ Status: OK", style="bold green")
+    _console().print()
+
+
+# ------------------------------------------------------------
+# Batch (several files)
+# ------------------------------------------------------------
+
+_BATCH_STYLES = {
+    "ok": ("✓ ok", "green"),
+    "warning": ("⚠ warning", "yellow"),
+    "error": ("✗ error", "red"),
+    "failed": ("✗ failed", "bold red"),
+}
+
+
+def render_batch(batch):
+    """Per-file status table and aggregated summary of batch.batch_report()."""
+    from rich.table import Table
+
+    table = Table(show_edge=False, header_style="bold")
+    table.add_column("File", overflow="fold")
+    table.add_column("Status")
+    table.add_column("Rows", justify="right")
+    table.add_column("Warnings", justify="right")
+    table.add_column("Time", justify="right")
+
+    for entry in batch["files"]:
+        label, style = _BATCH_STYLES[entry["status"]]
+        rows = entry.get("rows")
+        warnings = entry.get("warnings")
+        table.add_row(
+            entry["file"],
+            f"[{style}]{label}[/{style}]",
+            f"{rows:,}" if rows is not None else "-",
+            str(warnings) if warnings is not None else "-",
+            f"{entry['seconds']:.2f}s",
+        )
+
+    _console().print(table)
+    _console().print()
+
+    failed = [e for e in batch["files"] if e["status"] == "failed"]
+    if failed:
+        frame("Failed", [f"{e['file']}: {e['error']}" for e in failed])
+
+    summary = batch["summary"]
+    frame("Batch Summary", [
+        f"Files: {summary['files']} ({summary['ok']} ok, {summary['warning']} warning, "
+        f"{summary['error']} error, {summary['failed']} failed)",
+        f"Rows: {summary['rows']:,}",
+        f"Time: {summary['seconds']:.2f}s",
+    ])
+
+
+# ------------------------------------------------------------
+# Rule timings (--profile-rules)
+# ------------------------------------------------------------
+
+def _fmt_bytes(n):
+    if n is None:
+        return "-"
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1024 or unit == "GB":
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+
+
+def _spark_cells(spark):
+    """Jobs, tasks, task time, input and shuffle read + write of one step."""
+    if not spark:
+        return ["-"] * 5
+    shuffle = None
+    if spark.get("shuffle_read_bytes") is not None:
+        shuffle = spark["shuffle_read_bytes"] + spark["shuffle_write_bytes"]
+    task_time = spark.get("task_seconds")
+    return [
+        str(spark["jobs"]),
+        str(spark["tasks"]),
+        f"{task_time:.3f}s" if task_time is not None else "-",
+        _fmt_bytes(spark.get("input_bytes")),
+        _fmt_bytes(shuffle),
+    ]
+
+
+def render_timings(timings, title="Rule Timings"):
+    """Ranked table of report.timings (or timing.aggregate() over a batch), slowest first."""
+    from rich.table import Table
+    from .timing import ranked
+
+    entries = ranked(timings)
+    total = sum(e["wall_seconds"] for e in entries) or 1.0
+    with_files = any("files" in e for e in entries)
+    with_spark = any(e.get("spark") for e in entries)
+    # Spark steps measure time only
+    with_memory = any(e.get("peak_memory_bytes") is not None for e in entries)
+
+    table = Table(title=title, show_edge=False, header_style="bold")
+    table.add_column("#", justify="right")
+    table.add_column("Step", no_wrap=True)
+    table.add_column("Wall", justify="right")
+    table.add_column("CPU", justify="right")
+    table.add_column("Share", justify="right")
+    if with_memory:
+        table.add_column("Memory", justify="right")
+    table.add_column("Rows", justify="right")
+    if with_files:
+        table.add_column("Files", justify="right")
+    if with_spark:
+        for name in ("Jobs", "Tasks", "Task time", "Input", "Shuffle"):
+            table.add_column(name, justify="right")
+
+    for i, e in enumerate(entries, 1):
+        row = [
+            str(i),
+            e["name"] or "?",
+            f"{e['wall_seconds']:.3f}s",
+            f"{e['cpu_seconds']:.3f}s",
+            f"{e['wall_seconds'] / total:.1%}",
+        ]
+        if with_memory:
+            row.append(_fmt_bytes(e.get("peak_memory_bytes")))
+        row.append(f"{e['rows']:,}" if e.get("rows") is not None else "-")
+        if with_files:
+            row.append(str(e.get("files", "")))
+        if with_spark:
+            row.extend(_spark_cells(e.get("spark")))
+        table.add_row(*row)
+
+    _console().print(table)
+    _console().print()
 
 
 # ------------------------------------------------------------
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 import json
@@ -22,6 +22,14 @@ class ValidationReport:
     structural_results: List[Optional[ValidationResult]]
     quality_results: List[Optional[ValidationResult]]
     numeric_results: List[Optional[ValidationResult]]
+    # Cost of profiling and of each rule, when measured (see timing.measure())
+    timings: Optional[Dict[str, Any]] = None
+    # Storage layout checks (Spark's SmallFileRule); empty for pandas
+    performance_results: List[Optional[ValidationResult]] = field(default_factory=list)
+
+    def add_profile_timing(self, cost: Dict[str, Any]) -> None:
+        """Record the profiling phase ahead of the rule timings."""
+        self.timings = {"profile": cost, **(self.timings or {})}
 
     @property
     def all_results(self) -> List[ValidationResult]:
@@ -32,6 +40,7 @@ class ValidationReport:
                 self.structural_results
                 + self.quality_results
                 + self.numeric_results
+                + self.performance_results
             )
             if r is not None
         ]
@@ -63,12 +72,17 @@ class ValidationReport:
 
     def _serialize_result(self, r: ValidationResult) -> Dict[str, Any]:
         """Convert a single ValidationResult into a JSON-serializable dict."""
-        return {
+        result = {
             "name": getattr(r, "name", None),
             "message": r.message,
             "warning": r.warning,
             "details": r.details,
         }
+        # Ratios measured on a sample carry their confidence intervals
+        if r.estimate is not None:
+            result["estimated"] = True
+            result["estimate"] = r.estimate
+        return result
 
     def to_dict(self) -> Dict[str, Any]:
         """Full structured dict used by to_json()."""
@@ -87,8 +101,13 @@ class ValidationReport:
             for r in self.numeric_results
             if r is not None
         ]
+        performance = [
+            self._serialize_result(r)
+            for r in self.performance_results
+            if r is not None
+        ]
 
-        return {
+        result = {
             "validator_version": __version__,
             "file": self.profile.get("path"),
             "summary": {
@@ -110,6 +129,24 @@ class ValidationReport:
             "status": self.status,
         }
 
+        if performance:
+            result["performance"] = performance
+            result["results"]["performance"] = performance
+
+        # Only present when profiling took a shortcut or a fallback
+        if self.profile.get("stats_source"):
+            result["stats_source"] = self.profile["stats_source"]
+        if self.profile.get("sample"):
+            result["sample"] = dict(self.profile["sample"])
+        if self.profile.get("persist"):
+            result["persist"] = dict(self.profile["persist"])
+        if self.profile.get("notes"):
+            result["notes"] = list(self.profile["notes"])
+        if self.timings:
+            result["timings"] = self.timings
+
+        return result
+
     def to_json(self) -> str:
         """JSON string used by CLI --json and API clients."""
         return json.dumps(self.to_dict(), indent=2)
@@ -1,9 +1,11 @@
 # src/dfguard/rules/base.py
 
 from dataclasses import dataclass
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import numpy as np
 
+from ..planner import Requirement
+
 
 def _to_native(value):
     """Convert numpy types to Python-native JSON-serializable types."""
@@ -24,6 +26,8 @@ class ValidationResult:
     warning: bool
     message: str
     details: Optional[Dict[str, Any]] = None
+    # Confidence intervals when the rule ran on a sample (see sampling.estimate())
+    estimate: Optional[Dict[str, Any]] = None
 
     # NOTE:
     # A 'name' attribute will be attached dynamically by the RuleEngine.
@@ -38,19 +42,50 @@ class ValidationResult:
             k: _to_native(v)
             for k, v in (self.details or {}).items()
         }
-        return {
+        result = {
             "warning": self.warning,
             "message": self.message,
             "details": native_details,
         }
+        if self.estimate is not None:
+            result["estimated"] = True
+            result["estimate"] = self.estimate
+        return result
 
 
 class BaseRule:
     """
     Abstract rule interface.
     Concrete rules must implement apply().
+
+    Rules declare their inputs so RuleEngine.plan() can skip everything no
+    rule needs:
+
+      - requires: column statistics read from column_stats (planner.STATS);
+        None means undeclared, and everything is computed
+      - dtypes: the column kind the rule applies to (planner.DTYPE_KINDS)
+      - columns: restricts the rule to these columns (constructor argument)
+
+    A rule declaring dtypes or columns sees only those columns in
+    profile["column_stats"].
     """
     name: str = "rule"
+    requires: Optional[Tuple[str, ...]] = None
+    dtypes: Optional[str] = None
+    columns: Optional[List[str]] = None
+
+    def __init__(self, columns: Optional[List[str]] = None):
+        self.columns = list(columns) if columns else None
+
+    def requirement(self) -> Optional[Requirement]:
+        """The declared inputs for the planner; None if undeclared."""
+        if self.requires is None:
+            return None
+        return Requirement(
+            stats=frozenset(self.requires),
+            columns=frozenset(self.columns) if self.columns is not None else None,
+            dtypes=self.dtypes,
+        )
 
     def apply(self, profile: Dict[str, Any]) -> Optional[ValidationResult]:
         raise NotImplementedError("Rules must implement apply()")
@@ -1,41 +1,45 @@
 from .base import BaseRule, ValidationResult
-import pandas as pd
+from ..profiler import get_column_stats
+from ..sampling import estimate
 
 
 class NumericOutlierRule(BaseRule):
     name = "numeric_outliers"
+    requires = ("quartiles",)
+    dtypes = "numeric"
 
     def apply(self, profile: dict) -> ValidationResult:
-        df = profile["df"]
-        numeric_cols = df.select_dtypes(include=["number"]).columns
-
         result = {}
+        counts = {}
 
-        for col in numeric_cols:
-            s = df[col].dropna()
-            if s.empty:
-                result[col] = {"count": 0, "ratio": "0.0%"}
+        for col, stats in get_column_stats(profile).items():
+            if not stats["numeric"]:
                 continue
 
-            q1 = s.quantile(0.25)
-            q3 = s.quantile(0.75)
-            iqr = q3 - q1
-            lower = q1 - 1.5 * iqr
-            upper = q3 + 1.5 * iqr
+            if not stats["count"]:
+                result[col] = {"count": 0, "ratio": "0.0%"}
+                continue
 
-            mask = (s < lower) | (s > upper)
-            count = int(mask.sum())
-            ratio = count / len(s)
+            # IQR fences and the outlier count come from the fused profiling pass
+            count = stats["outliers"]
+            ratio = count / stats["count"]
+            counts[col] = (count, stats["count"])
 
             result[col] = {
                 "count": count,
                 "ratio": f"{ratio:.1%}",
             }
 
+            # Sketched quartiles: record the rank error the fences carry
+            if stats.get("quartiles_exact") is False:
+                result[col]["quantile_error"] = f"{stats['quantile_error']:.2%}"
+                result[col]["outliers_exact"] = stats["outliers_exact"]
+
         warning = any(info["count"] > 0 for info in result.values())
 
         return ValidationResult(
             warning=warning,
             message="Numeric outliers",
             details=result,
+            estimate=estimate(profile, counts),
         )
@@ -1,23 +1,17 @@
-import pandas as pd
 from .base import BaseRule, ValidationResult
+from ..profiler import get_column_stats
+from ..sampling import estimate
 
 
 class WhitespaceRule(BaseRule):
     name = "whitespace_issues"
+    requires = ("whitespace",)
 
     def apply(self, profile: dict) -> ValidationResult:
-        df = profile["df"]
-
-        details = {}
-        for col in df.columns:
-            s = df[col].astype(str)
-            mask = (
-                (s.str.strip() != s) |
-                s.str.contains(r"\s{2,}") |
-                s.str.contains("\t") |
-                s.str.contains(r"\\t")
-            )
-            details[col] = int(mask.sum())
+        details = {
+            col: stats["whitespace"]
+            for col, stats in get_column_stats(profile).items()
+        }
 
         warning = any(v > 0 for v in details.values())
 
@@ -30,16 +24,18 @@ class WhitespaceRule(BaseRule):
 
 class NullRatioRule(BaseRule):
     name = "null_ratio"
+    requires = ("null_count",)
 
     def apply(self, profile: dict) -> ValidationResult:
-        df = profile["df"]
-        rows = len(df)
+        rows = profile["rows"]
 
         details = {}
-        for col in df.columns:
-            count = df[col].isna().sum()
+        counts = {}
+        for col, stats in get_column_stats(profile, strict=False).items():
+            count = stats["null_count"]
             ratio = (count / rows) if rows else 0.0
             details[col] = f"{ratio:.1%}"
+            counts[col] = (count, rows)
 
         warning = any((float(v.strip('%')) / 100) >= 0.5 for v in details.values())
 
@@ -47,26 +43,27 @@ class NullRatioRule(BaseRule):
             warning=warning,
             message="Null ratio",
             details=details,
+            estimate=estimate(profile, counts),
         )
 
 
 class TypeMismatchRule(BaseRule):
     name = "type_consistency"
+    requires = ("numeric_coercible",)
+    dtypes = "non_numeric"
 
     def apply(self, profile: dict) -> ValidationResult:
-        df = profile["df"]
-        rows = len(df)
+        rows = profile["rows"]
 
         issues = {}
+        counts = {}
 
-        for col in df.columns:
-            s = df[col]
-
-            if pd.api.types.is_numeric_dtype(s.dtype):
+        for col, stats in get_column_stats(profile).items():
+            # None for numeric (and bool) dtypes, which cannot mismatch
+            numeric_count = stats["numeric_coercible"]
+            if numeric_count is None:
                 continue
-
-            coerced = pd.to_numeric(s, errors="coerce")
-            numeric_count = coerced.notna().sum()
+            counts[col] = (numeric_count, rows)
 
             if numeric_count == 0:
                 issues[col] = "0.0%"
@@ -85,4 +82,5 @@ class TypeMismatchRule(BaseRule):
             warning=warning,
             message="Type mismatch",
             details=issues,
+            estimate=estimate(profile, counts),
         )
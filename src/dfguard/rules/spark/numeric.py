@@ -0,0 +1,62 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pyspark.sql import DataFrame
+from dfguard.rules.base import BaseRule, ValidationResult
+
+
+class SparkNumericOutlierRule(BaseRule):
+    """
+    IQR outliers of every numeric column, counted in one Spark job.
+
+    The quartiles come from the profiling job (percentile_approx, see
+    validate_spark()); the values outside the resulting Tukey fences are
+    then counted exactly for all columns in a single agg(). Nothing is
+    collected to the driver but the counts.
+    """
+
+    name = "spark_numeric_outliers"
+
+    def apply(self, profile: dict) -> ValidationResult:
+        from pyspark.sql import functions as F
+
+        from dfguard.profiler import iqr_fences
+        from dfguard.spark.validate_spark import _quoted, non_nan
+
+        df: DataFrame = profile["df_spark"]
+        schema = df.schema
+
+        result = {}
+        aggs = []
+        pending = []
+        for col, stats in profile["column_stats"].items():
+            if not stats["numeric"]:
+                continue
+            if not stats["count"]:
+                result[col] = {"count": 0, "ratio": "0.0%"}
+                continue
+
+            lower, upper = iqr_fences(stats["q1"], stats["q3"])
+            value = non_nan(F.col(_quoted(col)), schema[col].dataType)
+            aggs.append(F.count(F.when((value < lower) | (value > upper), 1)).alias(f"c{len(pending)}"))
+            pending.append(col)
+
+        counts = df.agg(*aggs).collect()[0] if aggs else []
+        for i, col in enumerate(pending):
+            stats = profile["column_stats"][col]
+            count = int(counts[i])
+            result[col] = {
+                "count": count,
+                "ratio": f"{count / stats['count']:.1%}",
+                # Fences carry the quartiles' rank error; the count against them is exact
+                "quantile_error": f"{stats['quantile_error']:.2%}",
+                "outliers_exact": True,
+            }
+
+        warning = any(info["count"] > 0 for info in result.values())
+
+        return ValidationResult(
+            warning=warning,
+            message="Numeric outliers",
+            details=result,
+        )
@@ -1,15 +1,35 @@
 # src/dfguard/rules/spark/performance.py
 
-from pyspark.sql import DataFrame
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from pyspark.sql import DataFrame
+    from dfguard.spark.listing import FileListing
 from dfguard.rules.base import BaseRule, ValidationResult
-import os
+
 
 class SmallFileRule(BaseRule):
+    """
+    Many small input files.
+
+    Sizes come from one listing per parent directory (see FileListing),
+    not one stat per file, and work for any filesystem Spark reads. Pass a
+    shared listing to reuse its directory cache across validations.
+    """
+
     name = "spark_small_file_problem"
 
+    def __init__(self, listing: Optional["FileListing"] = None):
+        self.listing = listing
+
     def apply(self, profile: dict) -> ValidationResult:
-        df: DataFrame = profile["df_spark"]
-        input_files = df.inputFiles()
+        from dfguard.spark.listing import MB, FileListing, size_histogram
+
+        df: Optional[DataFrame] = profile.get("df_spark")
+        # validate_spark() lists them before a checkpoint can hide them
+        input_files = profile.get("input_files")
+        if input_files is None:
+            input_files = df.inputFiles()
         num_files = len(input_files)
 
         if num_files == 0:
@@ -19,23 +39,42 @@ class SmallFileRule(BaseRule):
                 details={"num_files": num_files},
             )
 
-        total_bytes = sum([os.path.getsize(f) for f in input_files])
-        avg_mb = (total_bytes / num_files) / (1024 * 1024)
+        if self.listing is None:
+            self.listing = FileListing(df.sparkSession if df is not None else None)
+        found = [s for s in self.listing.sizes(input_files).values() if s is not None]
+
+        if not found:
+            # Nothing to average: a 0 MB mean would read as a small file problem
+            return ValidationResult(
+                warning=False,
+                message="File sizes unavailable",
+                details={"num_files": num_files, "unlisted_files": num_files},
+            )
+
+        # Averages cover the listed files only
+        total_bytes = sum(found)
+        avg_mb = (total_bytes / len(found)) / MB
+        details = {
+            "num_files": num_files,
+            "avg_size_mb": round(avg_mb, 2),
+            "size_histogram": size_histogram(found),
+        }
+        if len(found) < num_files:
+            details["unlisted_files"] = num_files - len(found)
 
         if num_files > 100 and avg_mb < 10:
+            details.update({
+                "total_size_mb": round(total_bytes / MB, 2),
+                "recommendation": "Consider optimizing the dataset.",
+            })
             return ValidationResult(
                 warning=True,
                 message="Small file problem detected",
-                details={
-                    "num_files": num_files,
-                    "avg_size_mb": round(avg_mb, 2),
-                    "total_size_mb": round(total_bytes / (1024 * 1024), 2),
-                    "recommendation": "Consider optimizing the dataset.",
-                },
+                details=details,
             )
 
         return ValidationResult(
             warning=False,
             message="No small file problem detected",
-            details={"num_files": num_files, "avg_size_mb": round(avg_mb, 2)},
+            details=details,
         )
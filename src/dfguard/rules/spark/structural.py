@@ -1,16 +1,20 @@
-from pyspark.sql import DataFrame
+import math
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from pyspark.sql import DataFrame
 from dfguard.rules.base import BaseRule, ValidationResult
 
+# Two-sided 95% normal quantile
+_Z95 = 1.959964
+
 
 class SparkNonEmptyRule(BaseRule):
     name = "spark_non_empty"
 
     def apply(self, profile: dict) -> ValidationResult:
-        df: DataFrame = profile["df_spark"]
-        rows = df.count()
-
-        # Debug: Print the number of rows to verify if the rule is applied
-        print(f"Checking if dataset is empty: {rows} rows")
+        # Counted by the profiling job
+        rows = profile["rows"]
 
         if rows == 0:
             return ValidationResult(
@@ -26,19 +30,46 @@ class SparkNonEmptyRule(BaseRule):
 
 
 class SparkDuplicateRule(BaseRule):
+    """
+    Duplicate rows, or rows sharing key_columns.
+
+    By default the count is estimated from the approximate distinct count
+    of a row hash that the profiling job aggregates (see validate_spark()):
+    no shuffle, at a relative error of rsd on the distinct count. It warns
+    only when duplicates remain at the low end of the 95% interval, so
+    duplicates far below rsd x distinct rows go unnoticed.
+
+    exact=True counts with dropDuplicates(), which shuffles every row.
+    """
+
     name = "spark_duplicate_rows"
 
+    def __init__(
+        self,
+        key_columns: Optional[List[str]] = None,
+        exact: bool = False,
+        rsd: Optional[float] = None,
+    ):
+        self.key_columns = list(key_columns) if key_columns else None
+        self.exact = exact
+        self.rsd = rsd
+
     def apply(self, profile: dict) -> ValidationResult:
-        df: DataFrame = profile["df_spark"]
+        # The total comes from the profiling job
+        rows = profile["rows"]
 
-        # Count the total rows
-        rows = df.count()
+        approximate = (
+            not self.exact
+            and "approx_distinct_rows" in profile
+            and profile.get("duplicate_keys") == self.key_columns
+        )
+        if approximate:
+            return self._estimated(profile, rows)
 
-        # Use dropDuplicates() to find duplicate rows (this removes duplicates)
-        df_dedup = df.dropDuplicates()
+        df: DataFrame = profile["df_spark"]
 
-        # Count the rows after dropping duplicates
-        dedup_rows = df_dedup.count()
+        # dropDuplicates() shuffles every row by the key columns
+        dedup_rows = df.dropDuplicates(self.key_columns).count()
 
         # Calculate the number of duplicate rows
         dup_count = rows - dedup_rows
@@ -47,10 +78,45 @@ class SparkDuplicateRule(BaseRule):
         return ValidationResult(
             warning=(dup_count > 0),
             message="Duplicate rows",
-            details={
-                "count": dup_count,
-                "ratio": f"{ratio:.1%}",
-                "total_rows": rows,
-            },
+            details=self._details(dup_count, ratio, rows),
         )
 
+    def _details(self, count: int, ratio: float, rows: int) -> Dict[str, Any]:
+        details = {
+            "count": count,
+            "ratio": f"{ratio:.1%}",
+            "total_rows": rows,
+        }
+        if self.key_columns:
+            details["key_columns"] = self.key_columns
+        return details
+
+    def _estimated(self, profile: dict, rows: int) -> ValidationResult:
+        distinct = profile["approx_distinct_rows"]
+        rsd = profile["duplicate_rsd"]
+
+        # 95% interval of the distinct count, turned into one of duplicates
+        margin = _Z95 * rsd * distinct
+        high_cap = max(rows - 1, 0)
+        dup_count = min(max(rows - distinct, 0), high_cap)
+        low = rows - distinct - margin
+        high = rows - distinct + margin
+        ratio = dup_count / rows if rows else 0.0
+
+        details = self._details(dup_count, ratio, rows)
+        details["approximate"] = True
+
+        return ValidationResult(
+            warning=low > 0,
+            message="Duplicate rows",
+            details=details,
+            estimate={
+                "method": "approx_count_distinct of a 64-bit row hash",
+                "relative_error": rsd,
+                "confidence": 0.95,
+                "intervals": {"count": [
+                    min(max(math.floor(low), 0), high_cap),
+                    min(max(math.ceil(high), 0), high_cap),
+                ]},
+            },
+        )
@@ -1,9 +1,16 @@
+from typing import Any, Dict, List, Optional
+
 import pandas as pd
 from .base import BaseRule, ValidationResult
+from ..planner import Requirement
+from ..duplicates import make_duplicate_accumulator
+from ..sampling import estimate
 
 
 class NonEmptyRule(BaseRule):
     name = "non_empty"
+    # Only the row count
+    requires = ()
 
     def apply(self, profile: dict) -> ValidationResult:
         rows = profile.get("rows", 0)
@@ -24,22 +31,89 @@ class NonEmptyRule(BaseRule):
 
 
 class DuplicateRule(BaseRule):
+    """
+    Counts fully duplicated rows, or rows sharing key_columns.
+
+    In-memory DataFrames are counted with df.duplicated(). Streamed
+    profiles compare rows by 64-bit hash by default; exact=True compares
+    the rows themselves. memory_budget (bytes) bounds the memory used
+    before the comparison spills to disk, in-memory frames included (see
+    duplicates.make_duplicate_accumulator()).
+    """
+
     name = "duplicate_rows"
+    requires = ()
+
+    def __init__(
+        self,
+        key_columns: Optional[List[str]] = None,
+        exact: bool = False,
+        memory_budget: Optional[int] = None,
+    ):
+        self.key_columns = list(key_columns) if key_columns else None
+        self.exact = exact
+        self.memory_budget = memory_budget
+
+    def accumulator_options(self) -> Dict[str, Any]:
+        """Keyword arguments for make_duplicate_accumulator() / stream_profile(duplicates=...)."""
+        return {
+            "key_columns": self.key_columns,
+            "exact": self.exact,
+            "memory_budget": self.memory_budget,
+        }
+
+    def requirement(self) -> Requirement:
+        """Reads the values of the key columns (all columns by default), no statistics."""
+        columns = frozenset(self.key_columns) if self.key_columns else None
+        return Requirement(columns=columns, values=True)
+
+    def _count(self, profile: dict) -> int:
+        # Streamed / Arrow profiles carry the count from their accumulator
+        if "duplicate_count" in profile and profile.get("duplicate_keys") == self.key_columns:
+            return int(profile["duplicate_count"])
+
+        df = profile.get("df")
+        if df is None:
+            raise ValueError(
+                f"Profile has no duplicate count for key columns {self.key_columns}; "
+                "pass the same duplicate options when profiling"
+            )
+
+        if self.memory_budget is None:
+            try:
+                return int(df.duplicated(subset=self.key_columns).sum())
+            except TypeError:
+                # Unhashable values (dicts, lists): the accumulator hashes their repr
+                pass
+
+        acc = make_duplicate_accumulator(**self.accumulator_options())
+        try:
+            acc.update(df)
+            return int(acc.duplicates)
+        finally:
+            acc.close()
 
     def apply(self, profile: dict) -> ValidationResult:
-        df = profile["df"]
-        rows = len(df)
+        rows = profile["rows"]
 
-        dup_count = int(df.duplicated().sum())
+        dup_count = self._count(profile)
         ratio = dup_count / rows if rows else 0.0
 
+        details = {
+            "count": dup_count,
+            "ratio": f"{ratio:.1%}",
+            "total_rows": rows,
+        }
+        if self.key_columns:
+            details["key_columns"] = self.key_columns
+
         return ValidationResult(
             warning=(dup_count > 0),
             message="Duplicate rows",
-            details={
-                "count": dup_count,
-                "ratio": f"{ratio:.1%}",
-                "total_rows": rows,
-            },
+            details=details,
+            # Copies of a row are rarely sampled together
+            estimate=estimate(
+                profile, {"ratio": (dup_count, rows)},
+                note="measured within the sample; the full dataset may hold more duplicates",
+            ),
         )
-
@@ -0,0 +1,411 @@
+# src/dfguard/sampling.py
+
+from __future__ import annotations
+
+import math
+import os
+from statistics import NormalDist
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_CONFIDENCE = 0.95
+
+SampleSpec = Union[int, float]
+
+
+def parse_sample(value: Union[str, int, float]) -> SampleSpec:
+    """
+    A sample size: an int is a row count, a float in (0, 1) a fraction.
+
+    Strings are accepted as "10000", "0.01" or "1%".
+    """
+    if isinstance(value, str):
+        text = value.strip()
+        try:
+            if text.endswith("%"):
+                value = float(text[:-1]) / 100
+            elif text.isdigit():
+                value = int(text)
+            else:
+                value = float(text)
+        except ValueError:
+            raise ValueError(f"Invalid sample size '{text}': expected rows (10000) or a fraction (0.01, 1%)")
+
+    if isinstance(value, bool):
+        raise ValueError("Sample size must be a row count or a fraction")
+    if isinstance(value, int):
+        if value < 1:
+            raise ValueError("Sample size must be at least 1 row")
+        return value
+    if not 0 < value < 1:
+        raise ValueError("Sample fraction must be between 0 and 1")
+    return float(value)
+
+
+# ------------------------------------------------------------
+# Samplers
+# ------------------------------------------------------------
+
+def reservoir_sample(
+    chunks: Iterable[pd.DataFrame],
+    size: int,
+    *,
+    seed: Optional[int] = 0,
+) -> Tuple[pd.DataFrame, int]:
+    """
+    Uniform sample of size rows from a stream of chunks, in one pass.
+
+    Every row draws a random key and the size smallest keys are kept, so
+    only size rows are ever held beyond the current chunk. Returns the
+    sample in input order and the number of rows seen.
+    """
+    rng = np.random.default_rng(seed)
+    kept: Optional[pd.DataFrame] = None
+    keys = np.empty(0)
+    order = np.empty(0, dtype=np.int64)
+    seen = 0
+
+    for chunk in chunks:
+        n = len(chunk)
+        chunk_keys = rng.random(n)
+        chunk_order = np.arange(seen, seen + n)
+        seen += n
+
+        # Once full, only rows beating the current threshold can enter
+        if kept is not None and len(keys) >= size:
+            mask = chunk_keys < keys.max()
+            chunk, chunk_keys, chunk_order = chunk[mask], chunk_keys[mask], chunk_order[mask]
+
+        if kept is None:
+            kept, keys, order = chunk, chunk_keys, chunk_order
+        else:
+            kept = pd.concat([kept, chunk], ignore_index=True)
+            keys = np.concatenate([keys, chunk_keys])
+            order = np.concatenate([order, chunk_order])
+
+        if len(keys) > size:
+            best = np.argpartition(keys, size - 1)[:size]
+            kept = kept.iloc[best].reset_index(drop=True)
+            keys, order = keys[best], order[best]
+
+    if kept is None:
+        return pd.DataFrame(), 0
+
+    restore = np.argsort(order, kind="stable")
+    return kept.iloc[restore].reset_index(drop=True), seen
+
+
+def bernoulli_sample(
+    chunks: Iterable[pd.DataFrame],
+    fraction: float,
+    *,
+    seed: Optional[int] = 0,
+) -> Tuple[pd.DataFrame, int]:
+    """Keep each row with probability fraction; returns the sample and rows seen."""
+    rng = np.random.default_rng(seed)
+    parts: List[pd.DataFrame] = []
+    seen = 0
+
+    for chunk in chunks:
+        seen += len(chunk)
+        parts.append(chunk[rng.random(len(chunk)) < fraction])
+
+    if not parts:
+        return pd.DataFrame(), 0
+    return pd.concat(parts, ignore_index=True), seen
+
+
+def _allocate(sizes: List[int], total: int, rng: np.random.Generator) -> List[int]:
+    """Proportional allocation of total rows to strata, remainders drawn at random."""
+    population = sum(sizes)
+    exact = [total * s / population for s in sizes]
+    alloc = [min(int(e), s) for e, s in zip(exact, sizes)]
+
+    short = total - sum(alloc)
+    if short > 0:
+        weights = np.array([e - a if a < s else 0.0 for e, a, s in zip(exact, alloc, sizes)])
+        if weights.sum() > 0:
+            picks = rng.choice(
+                len(sizes), size=min(short, int(np.count_nonzero(weights))),
+                replace=False, p=weights / weights.sum(),
+            )
+            for i in picks:
+                alloc[i] += 1
+    return alloc
+
+
+# Fewest row groups a Parquet sample reads, so the spread between them can
+# be measured (and intervals widened by it)
+MIN_ROW_GROUPS = 4
+
+
+def cluster_design_effect(sample: pd.DataFrame, clusters: np.ndarray) -> float:
+    """
+    Design effect of a cluster sample: the variance of each column's null
+    ratio across clusters over its variance under simple random sampling
+    of as many rows, the largest over the columns, at least 1.
+
+    With a single cluster the spread is unknown, and the conservative
+    bound, its row count, is returned.
+    """
+    n = len(sample)
+    labels, sizes = np.unique(clusters, return_counts=True)
+    m = len(labels)
+    if n == 0:
+        return 1.0
+    if m < 2:
+        return float(n)
+
+    index = np.searchsorted(labels, clusters)
+    weights = sizes / n
+    deff = 1.0
+    for col in sample.columns:
+        nulls = sample[col].isna().to_numpy()
+        p = nulls.mean()
+        if p in (0.0, 1.0):
+            continue
+        cluster_p = np.bincount(index, weights=nulls, minlength=m) / sizes
+        # Linearized variance of the ratio estimator across clusters
+        var_cluster = m / (m - 1) * np.sum(weights ** 2 * (cluster_p - p) ** 2)
+        deff = max(deff, var_cluster / (p * (1 - p) / n))
+    return float(deff)
+
+
+def cluster_parquet_sample(
+    path: str,
+    size: SampleSpec,
+    *,
+    columns: Optional[List[str]] = None,
+    seed: Optional[int] = 0,
+) -> Tuple[pd.DataFrame, int, Dict[str, Any]]:
+    """
+    Sample a Parquet file with its row groups as clusters.
+
+    Row groups are drawn at random until they hold size rows (at least
+    MIN_ROW_GROUPS of them), and the rows are drawn from those groups in
+    proportion to their row counts (known from the footer, so size may be
+    a fraction). Only the drawn row groups are read, so the cost follows
+    the sample size rather than the file size. Returns the sample, the
+    file's row count and the design: row groups drawn and in the file, and
+    the design effect (see cluster_design_effect(); 1 when every row group
+    was drawn) that the sample's intervals are widened by.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from .profiler import _data_columns
+
+    rng = np.random.default_rng(seed)
+
+    with pq.ParquetFile(path) as pf:
+        if columns is None:
+            columns = _data_columns(pf.schema_arrow)
+        else:
+            missing = [c for c in columns if c not in pf.schema_arrow.names]
+            if missing:
+                raise ValueError(f"Columns not found in {path}: {missing}")
+
+        meta = pf.metadata
+        sizes = [meta.row_group(i).num_rows for i in range(meta.num_row_groups)]
+        population = sum(sizes)
+        if isinstance(size, float):
+            size = max(1, round(size * population))
+        size = min(size, population)
+
+        drawn: List[int] = []
+        held = 0
+        for i in rng.permutation(len(sizes)) if population else []:
+            if held >= size and len(drawn) >= MIN_ROW_GROUPS:
+                break
+            if sizes[i]:
+                drawn.append(int(i))
+                held += sizes[i]
+        drawn.sort()
+
+        tables = []
+        clusters = []
+        for i, take in zip(drawn, _allocate([sizes[i] for i in drawn], size, rng) if drawn else []):
+            if not take:
+                continue
+            group = pf.read_row_group(i, columns=columns)
+            rows = np.sort(rng.choice(sizes[i], size=take, replace=False))
+            tables.append(group.take(pa.array(rows)))
+            clusters.append(np.full(take, i))
+
+        if tables:
+            sample = pa.concat_tables(tables).to_pandas()
+        else:
+            sample = pf.schema_arrow.empty_table().select(columns).to_pandas()
+
+    every_group = len(drawn) == sum(1 for s in sizes if s)
+    design = {
+        "row_groups": len(drawn),
+        "row_groups_total": len(sizes),
+        "design_effect": 1.0 if every_group else cluster_design_effect(
+            sample, np.concatenate(clusters) if clusters else np.empty(0, dtype=np.int64)
+        ),
+    }
+    return sample, population, design
+
+
+def sample_frame(
+    data: Any,
+    size: SampleSpec,
+    *,
+    seed: Optional[int] = 0,
+) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Uniform sample without replacement of a pandas DataFrame or
+    pyarrow.Table, rows kept in order; returns it and its sample_info().
+    """
+    population = len(data)
+    rows = max(1, round(size * population)) if isinstance(size, float) else size
+    rows = min(rows, population)
+
+    rng = np.random.default_rng(seed)
+    index = np.sort(rng.choice(population, size=rows, replace=False))
+
+    if isinstance(data, pd.DataFrame):
+        sample = data.iloc[index]
+    else:
+        sample = data.take(index)
+    return sample, sample_info("uniform", rows, population, seed)
+
+
+def sample_file(
+    path: str,
+    size: SampleSpec,
+    *,
+    chunksize: int,
+    columns: Optional[List[str]] = None,
+    seed: Optional[int] = 0,
+) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    Sample a CSV (reservoir or Bernoulli over the chunks) or Parquet file
+    (clusters of row groups); returns the sample and its sample_info().
+    """
+    ext = os.path.splitext(path)[1].lower()
+
+    if ext == ".parquet":
+        sample, population, design = cluster_parquet_sample(path, size, columns=columns, seed=seed)
+        return sample, sample_info("cluster", len(sample), population, seed, **design)
+
+    if ext != ".csv":
+        raise ValueError(f"Unsupported format: {path}")
+
+    with pd.read_csv(path, chunksize=chunksize, usecols=columns) as reader:
+        if isinstance(size, float):
+            sample, population = bernoulli_sample(reader, size, seed=seed)
+            method = "bernoulli"
+        else:
+            sample, population = reservoir_sample(reader, size, seed=seed)
+            method = "reservoir"
+
+    return sample, sample_info(method, len(sample), population, seed)
+
+
+def sample_info(
+    method: str,
+    rows: int,
+    population: int,
+    seed: Optional[int],
+    confidence: float = DEFAULT_CONFIDENCE,
+    **design: Any,
+) -> Dict[str, Any]:
+    """
+    profile["sample"]: how the rows the rules see were drawn. design holds
+    method-specific details, such as a cluster sample's design_effect.
+    """
+    return {
+        "method": method,
+        "rows": rows,
+        "population_rows": population,
+        "fraction": rows / population if population else 1.0,
+        "seed": seed,
+        "confidence": confidence,
+        **design,
+    }
+
+
+# ------------------------------------------------------------
+# Error bounds
+# ------------------------------------------------------------
+
+def proportion_interval(
+    count: int,
+    n: int,
+    *,
+    population: Optional[int] = None,
+    confidence: float = DEFAULT_CONFIDENCE,
+) -> Tuple[float, float]:
+    """
+    Wilson score interval for the proportion count / n.
+
+    With the population size known, the finite population correction is
+    applied, so a sample of everything has zero width.
+    """
+    if n <= 0:
+        return 0.0, 1.0
+
+    p = count / n
+    if population is not None and population > 1:
+        if n >= population:
+            return p, p
+        # Finite population correction as an effective sample size
+        n = n * (population - 1) / (population - n)
+
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    denom = 1 + z * z / n
+    center = (p + z * z / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+def estimate(
+    profile: Dict[str, Any],
+    counts: Dict[str, Tuple[int, int]],
+    **extra: Any,
+) -> Optional[Dict[str, Any]]:
+    """
+    ValidationResult.estimate for ratio rules on a sampled profile.
+
+    counts maps a key (column name or "ratio") to (count, n) as measured on
+    the sample; None when the profile was not sampled.
+    """
+    info = profile.get("sample")
+    if not info:
+        return None
+
+    population = info["population_rows"]
+    fraction = info["fraction"]
+    # Clustered rows carry less information than independent ones
+    deff = info.get("design_effect", 1.0)
+    intervals = {}
+    for key, (count, n) in counts.items():
+        # n is scaled by the sampling fraction for per-column subsets
+        # (e.g. non-null values), estimating that subset's population
+        low, high = proportion_interval(
+            count / deff, n / deff,
+            population=round(n / fraction / deff) if fraction else population,
+            confidence=info["confidence"],
+        )
+        intervals[key] = [f"{low:.1%}", f"{high:.1%}"]
+
+    method = info["method"]
+    if "design_effect" in info:
+        method = (
+            f"{method} sample of {info['row_groups']} of {info['row_groups_total']} "
+            f"row groups, intervals widened by design effect {deff:.2f}"
+        )
+
+    return {
+        "method": method,
+        "confidence": info["confidence"],
+        "sample_rows": info["rows"],
+        "population_rows": population,
+        "intervals": intervals,
+        **extra,
+    }
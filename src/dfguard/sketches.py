@@ -0,0 +1,150 @@
+# src/dfguard/sketches.py
+
+from __future__ import annotations
+
+import math
+from typing import List, Sequence
+
+import numpy as np
+
+
+def normalized_rank_error(k: int) -> float:
+    """
+    Approximate rank error of a compacted sketch with parameter k.
+
+    Uses the empirical KLL fit from Apache DataSketches (single quantile,
+    ~99% confidence): k=200 gives about 1.3%, k=4096 about 0.07%.
+    """
+    return 2.296 / k ** 0.9723
+
+
+def k_for_error(error: float) -> int:
+    """Smallest k whose normalized_rank_error() is at most error."""
+    if not 0 < error < 1:
+        raise ValueError("Quantile accuracy must be between 0 and 1")
+    k = max(8, math.ceil((2.296 / error) ** (1 / 0.9723)))
+    while normalized_rank_error(k) > error:
+        k += 1
+    return k
+
+
+class QuantileSketch:
+    """
+    Mergeable KLL-style quantile sketch over float values.
+
+    Values are buffered as-is until a level grows past its capacity; that
+    level is then sorted and every other item is promoted to the next level
+    with double weight. Until the first compaction the sketch holds every
+    value and answers quantile / outlier queries exactly; the first
+    compaction happens once more than exact_limit values have been seen.
+    """
+
+    def __init__(self, k: int = 4096, exact_limit: int = 50_000, seed: int = 0):
+        if k < 8:
+            raise ValueError("QuantileSketch needs k >= 8")
+        self.k = k
+        self.exact_limit = exact_limit
+        self.n = 0
+        self._levels: List[np.ndarray] = [np.empty(0, dtype=np.float64)]
+        self._rng = np.random.default_rng(seed)
+
+    # ------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------
+
+    def update(self, values: np.ndarray) -> None:
+        """Add a batch of null-free values."""
+        values = np.asarray(values, dtype=np.float64)
+        if not values.size:
+            return
+        self.n += values.size
+        self._levels[0] = np.concatenate([self._levels[0], values])
+        self._compress()
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Fold another sketch (built with the same k) into this one."""
+        if other.k != self.k:
+            raise ValueError(f"Cannot merge sketches with k={self.k} and k={other.k}")
+        for h, level in enumerate(other._levels):
+            if h == len(self._levels):
+                self._levels.append(np.empty(0, dtype=np.float64))
+            self._levels[h] = np.concatenate([self._levels[h], level])
+        self.n += other.n
+        self._compress()
+
+    def _capacity(self, h: int) -> int:
+        if len(self._levels) == 1:
+            return max(self.k, self.exact_limit)
+        # Lower levels shrink geometrically, so retained size stays ~3k.
+        depth = len(self._levels) - h - 1
+        return max(8, int(self.k * (2 / 3) ** depth))
+
+    def _compress(self) -> None:
+        h = 0
+        while h < len(self._levels):
+            level = self._levels[h]
+            if level.size > self._capacity(h):
+                if h + 1 == len(self._levels):
+                    self._levels.append(np.empty(0, dtype=np.float64))
+                items = np.sort(level)
+                # An odd item stays behind so weights remain exact powers of two
+                held = items.size % 2
+                pairs = items[held:]
+                offset = int(self._rng.integers(2))
+                self._levels[h + 1] = np.concatenate([self._levels[h + 1], pairs[offset::2]])
+                self._levels[h] = items[:held]
+            h += 1
+
+    # ------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------
+
+    @property
+    def is_exact(self) -> bool:
+        """True while every value is still retained uncompacted."""
+        return len(self._levels) == 1
+
+    @property
+    def error_bound(self) -> float:
+        """Rank error of quantiles() / count_outside(): 0.0 while exact."""
+        return 0.0 if self.is_exact else normalized_rank_error(self.k)
+
+    @property
+    def retained(self) -> int:
+        return sum(level.size for level in self._levels)
+
+    def _weighted(self):
+        values = np.concatenate(self._levels)
+        weights = np.concatenate([
+            np.full(level.size, 2 ** h, dtype=np.int64)
+            for h, level in enumerate(self._levels)
+        ])
+        order = np.argsort(values, kind="stable")
+        return values[order], weights[order]
+
+    def quantiles(self, qs: Sequence[float]) -> List[float]:
+        """Quantiles with pandas' linear interpolation when exact."""
+        if not self.n:
+            return [float("nan") for _ in qs]
+
+        if self.is_exact:
+            return [float(v) for v in np.quantile(self._levels[0], list(qs))]
+
+        values, weights = self._weighted()
+        cumulative = np.cumsum(weights)
+        result = []
+        for q in qs:
+            rank = q * (self.n - 1)
+            idx = int(np.searchsorted(cumulative, rank, side="right"))
+            result.append(float(values[min(idx, values.size - 1)]))
+        return result
+
+    def count_outside(self, lower: float, upper: float) -> int:
+        """(Estimated) number of values below lower or above upper."""
+        if self.is_exact:
+            level = self._levels[0]
+            return int(np.count_nonzero((level < lower) | (level > upper)))
+
+        values, weights = self._weighted()
+        mask = (values < lower) | (values > upper)
+        return int(weights[mask].sum())
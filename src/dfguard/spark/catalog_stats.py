@@ -0,0 +1,158 @@
+# src/dfguard/spark/catalog_stats.py
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from pyspark.sql import DataFrame as SparkDataFrame
+    from pyspark.sql import SparkSession
+
+
+# Spark rules that can finish from catalog statistics alone
+CATALOG_RULES = (
+    "spark_non_empty",
+    "spark_null_ratio",
+    "spark_type_mismatch",
+    "spark_small_file_problem",
+)
+
+# The "Statistics" row of DESCRIBE TABLE EXTENDED, e.g. "4096 bytes, 100 rows"
+_STATISTICS = re.compile(r"(\d+)\s+bytes(?:,\s*(\d+)\s+rows)?")
+
+
+def _number(value: Optional[str]) -> Optional[int]:
+    # DESCRIBE shows missing column statistics as NULL
+    if value is None or value == "NULL":
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+# Table identifier of a relation node, e.g. "Relation spark_catalog.db.t[id#0L,ts#1] parquet"
+# or "HiveTableRelation [`spark_catalog`.`db`.`t`, org.apache...]"
+_RELATION_TABLE = re.compile(r"^\s*(?:Relation\s+([^\[\s]+)\[|HiveTableRelation\s+\[([^,\s]+),)")
+
+_NAME_PART = re.compile(r"`((?:[^`]|``)*)`|([^.`]+)")
+
+
+def _name_parts(name: str) -> List[str]:
+    """Parts of a dotted, optionally backquoted identifier, unquoted and lowercased."""
+    return [
+        (quoted.replace("``", "`") if quoted else plain.strip()).lower()
+        for quoted, plain in _NAME_PART.findall(name)
+    ]
+
+
+def _relation_table(plan: str) -> Optional[List[str]]:
+    """Identifier parts of the table a one-node plan reads; None for file or local relations."""
+    match = _RELATION_TABLE.match(plan.splitlines()[0] if plan else "")
+    if match is None:
+        return None
+    return _name_parts(match.group(1) or match.group(2))
+
+
+def _qualified_name(parts: List[str], catalog: str, database: str) -> List[str]:
+    """catalog.database.table parts, filling in the session's current ones."""
+    if len(parts) == 1:
+        return [catalog.lower(), database.lower()] + parts
+    if len(parts) == 2:
+        return [catalog.lower()] + parts
+    return parts
+
+
+def reads_table(df: SparkDataFrame, table_name: str) -> bool:
+    """
+    Whether df is the whole of table_name, unfiltered and unchanged, so
+    the table's statistics describe it. Both names are compared in full,
+    resolved against the session's current catalog and database.
+    """
+    from dfguard.spark.persist import _optimized_plan, plan_nodes
+
+    plan = _optimized_plan(df)
+    if plan is None:
+        return False
+    nodes = plan_nodes(plan)
+    if nodes != ["Relation"] and nodes != ["HiveTableRelation"]:
+        return False
+    relation = _relation_table(plan)
+    if relation is None:
+        return False
+
+    catalog_api = df.sparkSession.catalog
+    # currentCatalog() is Spark 3.4+
+    catalog = catalog_api.currentCatalog() if hasattr(catalog_api, "currentCatalog") else "spark_catalog"
+    database = catalog_api.currentDatabase()
+    return (
+        _qualified_name(relation, catalog, database)
+        == _qualified_name(_name_parts(table_name), catalog, database)
+    )
+
+
+def _column_statistics(spark: SparkSession, table_name: str, column: str) -> Dict[str, Any]:
+    from dfguard.spark.validate_spark import _quoted
+
+    rows = spark.sql(f"DESCRIBE TABLE EXTENDED {table_name} {_quoted(column)}").collect()
+    info = {row[0]: row[1] for row in rows}
+    return {
+        "null_count": _number(info.get("num_nulls")),
+        "distinct_count": _number(info.get("distinct_count")),
+        "min": None if info.get("min") in (None, "NULL") else info["min"],
+        "max": None if info.get("max") in (None, "NULL") else info["max"],
+    }
+
+
+def read_table_statistics(spark: SparkSession, table_name: str, columns: List[str]) -> Dict[str, Any]:
+    """
+    Statistics the catalog holds for a table: size_in_bytes, rows and per
+    column null_count / distinct_count / min / max (strings), each None
+    when not computed. Metadata queries only, no Spark job.
+    """
+    size = rows = None
+    for row in spark.sql(f"DESCRIBE TABLE EXTENDED {table_name}").collect():
+        if row[0] == "Statistics":
+            match = _STATISTICS.search(row[1] or "")
+            if match:
+                size = int(match.group(1))
+                rows = _number(match.group(2))
+            break
+
+    stats: Dict[str, Any] = {"size_in_bytes": size, "rows": rows, "columns": {}}
+    if rows is not None:
+        # Column statistics only exist next to a row count
+        stats["columns"] = {col: _column_statistics(spark, table_name, col) for col in columns}
+    return stats
+
+
+def complete(stats: Dict[str, Any], columns: List[str]) -> bool:
+    """Whether stats hold the row count and every column's null count."""
+    if stats["rows"] is None:
+        return False
+    return all(
+        stats["columns"].get(col, {}).get("null_count") is not None
+        for col in columns
+    )
+
+
+def table_statistics(
+    spark: SparkSession,
+    table_name: str,
+    columns: List[str],
+    *,
+    compute: bool = False,
+) -> Dict[str, Any]:
+    """
+    read_table_statistics(), first running ANALYZE TABLE ... COMPUTE
+    STATISTICS FOR ALL COLUMNS when compute=True and they are incomplete.
+    ANALYZE scans the table once; the statistics it stores in the catalog
+    serve every later validation until the table changes.
+    """
+    stats = read_table_statistics(spark, table_name, columns)
+    if compute and not complete(stats, columns):
+        spark.sql(f"ANALYZE TABLE {table_name} COMPUTE STATISTICS FOR ALL COLUMNS")
+        stats = read_table_statistics(spark, table_name, columns)
+        stats["computed"] = True
+    return stats
@@ -0,0 +1,173 @@
+# src/dfguard/spark/distributed.py
+
+from __future__ import annotations
+
+import pickle
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    from pyspark.sql import DataFrame as SparkDataFrame
+
+    from dfguard.engine import RuleEngine
+    from dfguard.planner import StatsPlan
+    from dfguard.report import ValidationReport
+
+
+# Schema of the one-row-per-partition output of the executor pass
+STATE_SCHEMA = "state binary"
+
+
+def _new_accumulator(
+    column_names: List[str],
+    sketch_k: int,
+    duplicates: Optional[Dict[str, Any]],
+    plan: Optional[StatsPlan],
+    dtypes: Optional[Dict[str, str]],
+):
+    from dfguard.accumulators import ProfileAccumulator
+
+    return ProfileAccumulator(
+        sketch_k=sketch_k, column_names=column_names, duplicates=duplicates, plan=plan,
+        dtypes=dtypes,
+    )
+
+
+def partition_state(
+    batches: Iterable[Any],
+    column_names: List[str],
+    *,
+    sketch_k: int = 4096,
+    duplicates: Optional[Dict[str, Any]] = None,
+    plan: Optional[StatsPlan] = None,
+    dtypes: Optional[Dict[str, str]] = None,
+) -> bytes:
+    """
+    Pickled ProfileAccumulator of one partition.
+
+    batches are pyarrow RecordBatches (mapInArrow) or pandas DataFrames
+    (mapInPandas). This is the executor side of validate_spark_distributed();
+    it runs as-is without Spark.
+    """
+    acc = _new_accumulator(column_names, sketch_k, duplicates, plan, dtypes)
+    for batch in batches:
+        if hasattr(batch, "schema") and hasattr(batch, "num_rows"):
+            acc.update_arrow(batch)
+        else:
+            acc.update(batch)
+    return pickle.dumps(acc, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def merge_states(
+    states: Iterable[bytes],
+    column_names: List[str],
+    *,
+    sketch_k: int = 4096,
+    duplicates: Optional[Dict[str, Any]] = None,
+    plan: Optional[StatsPlan] = None,
+    dtypes: Optional[Dict[str, str]] = None,
+    source: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Merge partition states (see partition_state()) into one streamed profile."""
+    merged = _new_accumulator(column_names, sketch_k, duplicates, plan, dtypes)
+    for state in states:
+        merged.merge(pickle.loads(state))
+    return merged.to_profile(source=source)
+
+
+def _null_dtypes(df: SparkDataFrame) -> Optional[Dict[str, str]]:
+    """pandas dtypes of df's all-null columns, as toPandas() gives them."""
+    from pyspark.sql.pandas.types import to_arrow_schema
+
+    from dfguard.profiler import _null_dtypes as arrow_null_dtypes
+
+    try:
+        schema = to_arrow_schema(df.schema)
+    except TypeError:
+        # A type without an Arrow mapping: keep the streaming default
+        return None
+    return arrow_null_dtypes(schema, schema.names)
+
+
+def _executor_pass(df: SparkDataFrame, **options: Any) -> SparkDataFrame:
+    """One row per partition holding its pickled accumulator."""
+    column_names = list(df.columns)
+
+    def arrow_states(batches: Iterator[Any]) -> Iterator[Any]:
+        import pyarrow as pa
+
+        state = partition_state(batches, column_names, **options)
+        yield pa.RecordBatch.from_arrays([pa.array([state], pa.binary())], names=["state"])
+
+    def pandas_states(frames: Iterator[Any]) -> Iterator[Any]:
+        import pandas as pd
+
+        yield pd.DataFrame({"state": [partition_state(frames, column_names, **options)]})
+
+    # mapInArrow (Spark 3.3+) hands over Arrow batches without a pandas conversion
+    if hasattr(df, "mapInArrow"):
+        return df.mapInArrow(arrow_states, STATE_SCHEMA)
+    return df.mapInPandas(pandas_states, STATE_SCHEMA)
+
+
+def validate_spark_distributed(
+    df: SparkDataFrame,
+    table_name: Optional[str] = None,
+    *,
+    engine: Optional[RuleEngine] = None,
+    check_duplicates: bool = True,
+    duplicate_keys: Optional[List[str]] = None,
+    exact_duplicates: bool = False,
+    quantile_accuracy: Optional[float] = None,
+) -> ValidationReport:
+    """
+    Run the pandas rule set on a Spark DataFrame without collecting it.
+
+    Every partition is profiled on its executor by the same chunk
+    accumulators stream_profile() uses, fed the partition's Arrow batches
+    through mapInArrow (mapInPandas before Spark 3.3). Only the pickled
+    partial states reach the driver, where they are merged into one
+    streamed profile and checked by engine (the default pandas rule set
+    when None), so the report matches validate() / stream_profile() on
+    the same data. dfguard must be installed on the executors.
+
+    Profiling is planned from the engine's rules (see RuleEngine.plan()).
+    Quartiles come from a mergeable sketch with rank error
+    quantile_accuracy (about 0.07% by default), exact until a partition
+    outgrows it.
+
+    Duplicate detection ships each partition's distinct 64-bit row hashes
+    (over duplicate_keys, all columns by default) to the driver: 8 bytes
+    per distinct row, or the rows themselves with exact_duplicates. On
+    tables too large for that, pass check_duplicates=False and use
+    validate_spark()'s sketch estimate instead.
+    """
+    from dfguard.core import _build_default_engine
+    from dfguard.sketches import k_for_error
+
+    if duplicate_keys:
+        missing = [c for c in duplicate_keys if c not in df.columns]
+        if missing:
+            raise ValueError(f"Key columns not found: {missing}")
+
+    duplicates = {"key_columns": duplicate_keys, "exact": exact_duplicates}
+    if engine is None:
+        engine = _build_default_engine(duplicates=duplicates)
+        if not check_duplicates:
+            engine.structural_rules = [
+                r for r in engine.structural_rules if r.name != "duplicate_rows"
+            ]
+
+    options = {
+        "sketch_k": k_for_error(quantile_accuracy) if quantile_accuracy is not None else 4096,
+        "duplicates": duplicates,
+        "plan": engine.plan(),
+        "dtypes": _null_dtypes(df),
+    }
+    states = [row["state"] for row in _executor_pass(df, **options).collect()]
+    profile = merge_states(states, list(df.columns), source=table_name, **options)
+
+    profile["backend"] = "spark"
+    profile["types"] = {f.name: f.dataType.simpleString() for f in df.schema.fields}
+    profile["partitions"] = len(states)
+
+    return engine.run(profile)
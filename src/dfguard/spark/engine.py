@@ -1,24 +1,42 @@
 # src/dfguard/spark/engine.py
 
-from typing import Dict
+import time
+from typing import Any, Dict, List, Optional
 from dfguard.rules.base import ValidationResult
 from dfguard.report import ValidationReport
 from dfguard.rules.spark.structural import SparkNonEmptyRule, SparkDuplicateRule
 from dfguard.rules.spark.quality import SparkNullRatioRule, SparkTypeMismatchRule
+from dfguard.rules.spark.numeric import SparkNumericOutlierRule
 from dfguard.rules.spark.performance import SmallFileRule
+from dfguard.spark.job_metrics import SparkJobTracker
 
 
 class SparkRuleEngine:
     """
     Spark-specific rule engine.
     Mirrors the pandas RuleEngine but rules are Spark-native.
+
+    duplicates holds SparkDuplicateRule options (key_columns, exact, rsd).
+    metadata_only keeps the rules catalog statistics can answer (see
+    catalog_stats.CATALOG_RULES).
+
+    Every rule runs under its own Spark job group (see SparkJobTracker).
+    job_metrics=True attributes each rule's jobs, stages, tasks, task time
+    and input / shuffle bytes to it, reported under report.timings.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        duplicates: Optional[Dict[str, Any]] = None,
+        metadata_only: bool = False,
+        job_metrics: bool = False,
+    ):
+        self.job_metrics = job_metrics
+
         # List of Spark-specific structural rules
         self.structural_rules = [
             SparkNonEmptyRule(),
-            SparkDuplicateRule(),
+            SparkDuplicateRule(**(duplicates or {})),
         ]
 
         # List of Spark-specific quality rules
@@ -27,20 +45,52 @@ class SparkRuleEngine:
             SparkTypeMismatchRule(),
         ]
 
+        # Numeric rules (IQR outliers from the profile's quartiles)
+        self.numeric_rules = [
+            SparkNumericOutlierRule(),
+        ]
+
         # Performance rule for detecting small files
         self.performance_rules = [
             SmallFileRule(),
         ]
 
-    def _run_bucket(self, rules, profile: Dict) -> list:
+        if metadata_only:
+            from dfguard.spark.catalog_stats import CATALOG_RULES
+
+            def keep(rules):
+                return [r for r in rules if r.name in CATALOG_RULES]
+
+            self.structural_rules = keep(self.structural_rules)
+            self.quality_rules = keep(self.quality_rules)
+            self.numeric_rules = keep(self.numeric_rules)
+            self.performance_rules = keep(self.performance_rules)
+
+    def _run_bucket(
+        self,
+        rules,
+        profile: Dict,
+        tracker: Optional[SparkJobTracker] = None,
+        bucket: Optional[str] = None,
+        timings: Optional[List[Dict[str, Any]]] = None,
+    ) -> list:
         """
         Run a list of rules and collect results.
         This handles both structural, quality, numeric, and performance rules.
+
+        With a tracker each rule runs under its own job group; the cost of
+        each rule is appended to timings when it measures them.
         """
         results = []
         for rule in rules:
+            name = getattr(rule, "name", rule.__class__.__name__)
             try:
-                result = rule.apply(profile)
+                if tracker is None:
+                    result = rule.apply(profile)
+                else:
+                    result, cost = tracker.run(name, lambda: rule.apply(profile), f"dfguard rule: {name}")
+                    if cost is not None and timings is not None:
+                        timings.append({"name": name, "bucket": bucket, **cost})
 
                 # If the rule returns None (no issues), continue
                 if result is None:
@@ -66,19 +116,40 @@ class SparkRuleEngine:
         """
         Run all Spark-specific rules and return a ValidationReport.
         """
+        df = profile.get("df_spark")
+        tracker = None
+        if df is not None:
+            tracker = SparkJobTracker(df.sparkSession, collect=self.job_metrics)
+        rule_timings: List[Dict[str, Any]] = []
+        start = time.perf_counter()
+
+        def run_bucket(rules, bucket):
+            return self._run_bucket(rules, profile, tracker, bucket, rule_timings)
+
         # Run structural rules (non-empty, duplicates)
-        structural_results = self._run_bucket(self.structural_rules, profile)
+        structural_results = run_bucket(self.structural_rules, "structural")
 
         # Run quality rules (null ratio, type mismatch)
-        quality_results = self._run_bucket(self.quality_rules, profile)
+        quality_results = run_bucket(self.quality_rules, "quality")
+
+        # Run numeric rules (outliers)
+        numeric_results = run_bucket(self.numeric_rules, "numeric")
 
         # Run performance rule (small file detection)
-        performance_results = self._run_bucket(self.performance_rules, profile)
+        performance_results = run_bucket(self.performance_rules, "performance")
+
+        timings = None
+        if self.job_metrics:
+            timings = {
+                "rules": rule_timings,
+                "rules_wall_seconds": round(time.perf_counter() - start, 6),
+            }
 
         return ValidationReport(
             profile=profile,
             structural_results=[r for r in structural_results if r is not None],
             quality_results=[r for r in quality_results if r is not None],
-            numeric_results=[],  # Can be added later
+            numeric_results=[r for r in numeric_results if r is not None],
             performance_results=[r for r in performance_results if r is not None],
+            timings=timings,
         )
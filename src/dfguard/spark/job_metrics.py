@@ -0,0 +1,131 @@
+# src/dfguard/spark/job_metrics.py
+
+from __future__ import annotations
+
+import json
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.request import urlopen
+
+
+# Stage fields of the Spark UI REST API summed into a step's metrics
+_STAGE_METRICS = {
+    "executorRunTime": "task_seconds",          # milliseconds
+    "inputBytes": "input_bytes",
+    "shuffleReadBytes": "shuffle_read_bytes",
+    "shuffleWriteBytes": "shuffle_write_bytes",
+}
+
+
+class SparkJobTracker:
+    """
+    Runs each validation step under its own Spark job group and attributes
+    the jobs it launched to it.
+
+    Every step gets the group dfguard-<run>-<step> with a readable
+    description, which is all the Spark UI needs. With collect=True, run()
+    also returns the step's cost: wall and CPU time as timing.measure()
+    reports them, plus under "spark" the step's jobs, stages and tasks
+    (SparkContext.statusTracker()) and its task time, input and shuffle
+    bytes (the Spark UI REST API, None when the UI is disabled).
+    """
+
+    def __init__(self, spark: Any, collect: bool = False, timeout: float = 2.0):
+        try:
+            self.context = spark.sparkContext if spark is not None else None
+        except Exception:
+            # Spark Connect sessions have no SparkContext
+            self.context = None
+        self.collect = collect
+        self.timeout = timeout
+        self.run_id = uuid.uuid4().hex[:8]
+
+    def run(
+        self,
+        step: str,
+        fn: Callable[[], Any],
+        description: Optional[str] = None,
+    ) -> Tuple[Any, Optional[Dict[str, Any]]]:
+        """Call fn() under the step's job group; returns (result, cost or None)."""
+        from dfguard.timing import measure
+
+        sc = self.context
+        if sc is None:
+            # Spark Connect: no job groups or status tracker on the client
+            if not self.collect:
+                return fn(), None
+            result, cost = measure(fn, memory=None)
+            return result, {**cost, "spark": None}
+
+        group = f"dfguard-{self.run_id}-{step}"
+        previous = {
+            key: sc.getLocalProperty(key)
+            for key in ("spark.jobGroup.id", "spark.job.description")
+        }
+        sc.setJobGroup(group, description or f"dfguard: {step}")
+        try:
+            if not self.collect:
+                return fn(), None
+            result, cost = measure(fn, memory=None)
+        finally:
+            for key, value in previous.items():
+                sc.setLocalProperty(key, value)
+
+        cost["spark"] = self._group_metrics(group)
+        return result, cost
+
+    def _group_metrics(self, group: str) -> Dict[str, Any]:
+        tracker = self.context.statusTracker()
+        job_ids = tracker.getJobIdsForGroup(group)
+
+        # Job end events reach the status store asynchronously
+        deadline = time.monotonic() + self.timeout
+        jobs = [tracker.getJobInfo(j) for j in job_ids]
+        while any(j is not None and j.status == "RUNNING" for j in jobs) and time.monotonic() < deadline:
+            time.sleep(0.01)
+            jobs = [tracker.getJobInfo(j) for j in job_ids]
+
+        metrics: Dict[str, Any] = {
+            "jobs": len(job_ids),
+            "stages": 0,
+            "skipped_stages": 0,
+            "tasks": 0,
+            "failed_tasks": 0,
+        }
+        ran = []
+        for stage_id in sorted({s for j in jobs if j is not None for s in j.stageIds}):
+            info = tracker.getStageInfo(stage_id)
+            # Stages whose shuffle output or cache was reused launch no task
+            if info is None or not (info.numCompletedTasks or info.numFailedTasks or info.numActiveTasks):
+                metrics["skipped_stages"] += 1
+                continue
+            ran.append(stage_id)
+            metrics["stages"] += 1
+            metrics["tasks"] += info.numCompletedTasks
+            metrics["failed_tasks"] += info.numFailedTasks
+
+        metrics.update(self._stage_totals(ran))
+        return metrics
+
+    def _stage_totals(self, stage_ids: List[int]) -> Dict[str, Any]:
+        totals: Dict[str, Any] = {name: None for name in _STAGE_METRICS.values()}
+        url = self.context.uiWebUrl
+        if not url:
+            return totals
+
+        totals = {name: 0 for name in totals}
+        base = f"{url}/api/v1/applications/{self.context.applicationId}/stages"
+        for stage_id in stage_ids:
+            try:
+                with urlopen(f"{base}/{stage_id}", timeout=self.timeout) as response:
+                    attempts = json.load(response)
+            except (OSError, ValueError):
+                # Stage evicted from the UI store (spark.ui.retainedStages)
+                continue
+            for attempt in attempts:
+                for field, name in _STAGE_METRICS.items():
+                    totals[name] += attempt.get(field) or 0
+
+        totals["task_seconds"] = round(totals["task_seconds"] / 1000, 3)
+        return totals
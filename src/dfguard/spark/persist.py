@@ -0,0 +1,108 @@
+# src/dfguard/spark/persist.py
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from pyspark.sql import DataFrame as SparkDataFrame
+
+
+# How validate_spark() keeps its input between Spark jobs:
+#
+#   none             recompute the lineage for every job
+#   auto             memory_and_disk when more than one job reads the input
+#   memory           persist(MEMORY_ONLY)
+#   memory_and_disk  persist(MEMORY_AND_DISK)
+#   checkpoint       eager checkpoint (local checkpoint without a checkpoint dir)
+PERSIST_POLICIES = ("none", "auto", "memory", "memory_and_disk", "checkpoint")
+
+# Optimized-plan nodes that cost no more to recompute than to read from a cache
+_CHEAP_NODES = {"Project", "Filter", "Relation", "LocalRelation", "Range", "SubqueryAlias"}
+
+_NODE = re.compile(r"^[\s:+\-|!]*([A-Za-z]\w*)")
+
+
+def _optimized_plan(df: SparkDataFrame) -> Optional[str]:
+    # None when the plan is not reachable from Python (Spark Connect)
+    try:
+        return df._jdf.queryExecution().optimizedPlan().toString()
+    except Exception:
+        return None
+
+
+def plan_nodes(plan: str) -> List[str]:
+    """Node names of a plan's tree string, root first."""
+    nodes = []
+    for line in plan.splitlines():
+        match = _NODE.match(line)
+        if match:
+            nodes.append(match.group(1))
+    return nodes
+
+
+def is_cheap_scan(df: SparkDataFrame) -> bool:
+    """
+    Whether df is a plain scan of files or local data, at most projected
+    and filtered: no joins, aggregations, UDFs, JDBC or other sources.
+    Unknown plans are not cheap.
+    """
+    plan = _optimized_plan(df)
+    if plan is None or "JDBCRelation" in plan:
+        return False
+    nodes = plan_nodes(plan)
+    return bool(nodes) and all(node in _CHEAP_NODES for node in nodes)
+
+
+def persist_input(
+    df: SparkDataFrame,
+    policy: str = "auto",
+    passes: int = 1,
+) -> Tuple[SparkDataFrame, Dict[str, Any]]:
+    """
+    Apply the persist policy before profiling.
+
+    passes is how many Spark jobs will read df. Returns the DataFrame the
+    rules should read and a record of what was done, with a reason when
+    nothing was: a cheap scan or an already cached df is never persisted,
+    and policy auto needs at least two passes. Hand both to
+    release_input() once the rules ran.
+    """
+    from pyspark import StorageLevel
+
+    if policy not in PERSIST_POLICIES:
+        raise ValueError(f"Unknown persist policy '{policy}', expected one of {PERSIST_POLICIES}")
+
+    info: Dict[str, Any] = {"policy": policy, "applied": None}
+    if policy == "none":
+        return df, info
+    if df.is_cached:
+        info["reason"] = "already cached"
+        return df, info
+    if policy == "auto" and passes < 2:
+        info["reason"] = "single pass"
+        return df, info
+    if is_cheap_scan(df):
+        info["reason"] = "cheap scan"
+        return df, info
+
+    if policy == "checkpoint":
+        context = df.sparkSession.sparkContext
+        if context.getCheckpointDir():
+            info["applied"] = "checkpoint"
+            return df.checkpoint(eager=True), info
+        # Executor-local storage, released with the DataFrame
+        info["applied"] = "local_checkpoint"
+        return df.localCheckpoint(eager=True), info
+
+    level = "memory" if policy == "memory" else "memory_and_disk"
+    info["applied"] = level
+    storage = StorageLevel.MEMORY_ONLY if level == "memory" else StorageLevel.MEMORY_AND_DISK
+    return df.persist(storage), info
+
+
+def release_input(df: SparkDataFrame, info: Dict[str, Any]) -> None:
+    """Unpersist what persist_input() persisted; checkpoints are left to Spark's cleaner."""
+    if info.get("applied") in ("memory", "memory_and_disk"):
+        df.unpersist(blocking=False)
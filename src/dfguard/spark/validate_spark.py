@@ -2,50 +2,426 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
-
-from pyspark.sql import DataFrame as SparkDataFrame
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from dfguard.spark.engine import SparkRuleEngine
+from dfguard.spark.persist import PERSIST_POLICIES, persist_input, release_input
+
+if TYPE_CHECKING:
+    from pyspark.sql import DataFrame as SparkDataFrame
+
+
+# Relative standard deviation of approx_count_distinct (HyperLogLog++)
+DEFAULT_DISTINCT_RSD = 0.05
+# Tighter for the row hash: its error becomes the duplicate count's error
+DEFAULT_DUPLICATE_RSD = 0.01
+# Rank error of percentile_approx quartiles (its accuracy is the inverse)
+DEFAULT_QUANTILE_ACCURACY = 0.001
+
+
+def _quoted(name: str) -> str:
+    """Column reference that survives dots, spaces and backticks in the name."""
+    return "`" + name.replace("`", "``") + "`"
+
+
+def _float(value: Any) -> float:
+    # Decimal columns aggregate to Decimal; empty aggregates to None
+    return float(value) if value is not None else float("nan")
 
 
-def _profile_spark_dataframe(df: SparkDataFrame, table_name: Optional[str] = None) -> Dict[str, Any]:
+def non_nan(col: Any, dtype: Any) -> Any:
     """
-    Minimal Spark profiling, analogous to pandas profile_dataframe().
-    This profile must satisfy the renderer + JSON builder expectations.
+    A float column with NaN turned into null.
+
+    Spark orders NaN above every number, so NaN would otherwise become the
+    max, poison the mean and land beyond any upper fence.
+    """
+    from pyspark.sql import functions as F
+    from pyspark.sql import types as T
+
+    if isinstance(dtype, (T.FloatType, T.DoubleType)):
+        return F.when(~F.isnan(col), col)
+    return col
+
+
+def _row_hash(columns: List[str]) -> Any:
+    """
+    xxhash64 of the given columns of a row.
+
+    xxhash64 skips null arguments, so each value is preceded by its null
+    flag: (NULL, 1) and (1, NULL) then hash differently.
     """
-    cols = df.columns
-    rows = df.count()  # expensive, but expected at validation time
+    from pyspark.sql import functions as F
+
+    args = []
+    for name in columns:
+        col = F.col(_quoted(name))
+        args.extend([col.isNull(), col])
+    return F.xxhash64(*args)
+
+
+def _profile_aggregates(
+    df: SparkDataFrame,
+    distinct_rsd: float,
+    duplicates: Optional[Dict[str, Any]] = None,
+    quantile_accuracy: float = DEFAULT_QUANTILE_ACCURACY,
+    catalog: Optional[Dict[str, Dict[str, Any]]] = None,
+    full: bool = True,
+) -> List[Any]:
+    """
+    Every aggregate of the profile, aliased by column position.
+
+    Null counts include NaN for float columns, as in the pandas profile.
+    Nested columns (arrays, maps, structs) get a null count only. Numeric
+    columns get q1 / median / q3 from percentile_approx with rank error
+    quantile_accuracy. Unless duplicates asks for exact=True, the
+    approximate distinct count of the row hash over key_columns (all
+    columns by default) is aggregated too.
+
+    catalog holds per-column catalog statistics (see catalog_stats):
+    distinct counts found there are not aggregated. full=False keeps just
+    the row count and the null counts the catalog lacks.
+    """
+    from pyspark.sql import functions as F
+    from pyspark.sql import types as T
+
+    duplicates = duplicates or {}
+    catalog = catalog or {}
+    aggs = [F.count(F.lit(1)).alias("rows")]
+    if full and not duplicates.get("exact"):
+        keys = duplicates.get("key_columns") or df.columns
+        rsd = duplicates.get("rsd") or DEFAULT_DUPLICATE_RSD
+        aggs.append(F.approx_count_distinct(_row_hash(keys), rsd=rsd).alias("row_hash_distinct"))
+
+    for i, field in enumerate(df.schema.fields):
+        col = F.col(_quoted(field.name))
+        dtype = field.dataType
+        known = catalog.get(field.name, {})
+
+        if full or known.get("null_count") is None:
+            is_null = col.isNull()
+            if isinstance(dtype, (T.FloatType, T.DoubleType)):
+                is_null = is_null | F.isnan(col)
+            aggs.append(F.count(F.when(is_null, 1)).alias(f"c{i}_nulls"))
+
+        if not full or isinstance(dtype, (T.ArrayType, T.MapType, T.StructType)):
+            continue
+        if known.get("distinct_count") is None:
+            aggs.append(F.approx_count_distinct(col, rsd=distinct_rsd).alias(f"c{i}_distinct"))
+
+        if isinstance(dtype, T.NumericType):
+            value = non_nan(col, dtype)
+            aggs.extend([
+                F.min(value).alias(f"c{i}_min"),
+                F.max(value).alias(f"c{i}_max"),
+                F.mean(value).alias(f"c{i}_mean"),
+                F.stddev_samp(value).alias(f"c{i}_std"),
+                F.percentile_approx(
+                    value, [0.25, 0.5, 0.75], max(int(round(1 / quantile_accuracy)), 1)
+                ).alias(f"c{i}_quartiles"),
+            ])
+
+    return aggs
+
+
+def _cataloged_distinct_aggregates(
+    df: SparkDataFrame,
+    distinct_rsd: float,
+    catalog: Dict[str, Any],
+) -> List[Any]:
+    """The approx_count_distinct aggregates _profile_aggregates() left to catalog."""
+    from pyspark.sql import functions as F
+    from pyspark.sql import types as T
+
+    aggs = []
+    for i, field in enumerate(df.schema.fields):
+        if isinstance(field.dataType, (T.ArrayType, T.MapType, T.StructType)):
+            continue
+        if catalog.get(field.name, {}).get("distinct_count") is not None:
+            col = F.col(_quoted(field.name))
+            aggs.append(F.approx_count_distinct(col, rsd=distinct_rsd).alias(f"c{i}_distinct"))
+    return aggs
+
+
+def _profile_spark_dataframe(
+    df: SparkDataFrame,
+    table_name: Optional[str] = None,
+    *,
+    distinct_rsd: float = DEFAULT_DISTINCT_RSD,
+    duplicates: Optional[Dict[str, Any]] = None,
+    quantile_accuracy: float = DEFAULT_QUANTILE_ACCURACY,
+    catalog: Optional[Dict[str, Any]] = None,
+    metadata_only: bool = False,
+) -> Dict[str, Any]:
+    """
+    Spark counterpart of profile_dataframe(), in a single Spark job.
+
+    Row count, per-column null counts, min/max/mean/stddev and approximate
+    quartiles of numeric columns and approximate distinct counts
+    (approx_count_distinct with relative error distinct_rsd) all come from
+    one agg() over df, so the lineage is evaluated once. Spark rules read from this profile instead
+    of running their own count() actions.
+
+    duplicates (key_columns / exact / rsd, see SparkDuplicateRule) adds the
+    approximate distinct row count to the same job, unless exact.
+
+    catalog (see catalog_stats.table_statistics()) supplies distinct
+    counts, trusted while its row count matches the scan's; stale ones
+    are recounted in a second job. With
+    metadata_only, only what CATALOG_RULES read is profiled: row and null
+    counts come from the catalog, and nothing is scanned unless it lacks
+    some of them.
+    """
+    from pyspark.sql import types as T
+
+    fields = df.schema.fields
+    known = (catalog or {}).get("columns") or {}
+    aggs = _profile_aggregates(
+        df, distinct_rsd, duplicates, quantile_accuracy, catalog=known, full=not metadata_only
+    )
+
+    notes: List[str] = []
+    scan = not metadata_only or len(aggs) > 1 or not catalog or catalog["rows"] is None
+    row = df.agg(*aggs).collect()[0].asDict() if scan else {}
+    rows = int(row["rows"]) if scan else catalog["rows"]
+
+    if catalog and scan and catalog["rows"] != rows:
+        notes.append(
+            f"Catalog statistics are stale ({catalog['rows']:,} rows recorded, "
+            f"{rows:,} scanned); they were not used"
+        )
+        if metadata_only:
+            # The partial scan skipped the null counts the catalog claimed
+            row = df.agg(*_profile_aggregates(df, distinct_rsd, full=False)).collect()[0].asDict()
+        else:
+            # ... and the distinct counts it claimed
+            recount = _cataloged_distinct_aggregates(df, distinct_rsd, known)
+            if recount:
+                row.update(df.agg(*recount).collect()[0].asDict())
+        known = {}
+    elif metadata_only and catalog and any(
+        isinstance(f.dataType, (T.FloatType, T.DoubleType)) for f in fields
+    ):
+        notes.append("Catalog null counts of float columns do not include NaN")
+
+    column_stats: Dict[str, Dict[str, Any]] = {}
+    numeric_stats: Dict[str, Dict[str, float]] = {}
+    for i, field in enumerate(fields):
+        numeric = isinstance(field.dataType, T.NumericType)
+        cataloged = known.get(field.name, {})
+        null_count = row.get(f"c{i}_nulls")
+        if null_count is None:
+            null_count = cataloged.get("null_count") or 0
+        stats: Dict[str, Any] = {
+            "dtype": field.dataType.simpleString(),
+            "numeric": numeric,
+            "rows": rows,
+            "null_count": int(null_count),
+            "count": rows - int(null_count),
+            "approx_distinct": row.get(f"c{i}_distinct", cataloged.get("distinct_count")),
+        }
+        if metadata_only:
+            if numeric and cataloged.get("min") is not None and cataloged.get("max") is not None:
+                summary = {"min": _float(cataloged["min"]), "max": _float(cataloged["max"])}
+                stats.update(summary)
+                numeric_stats[field.name] = summary
+        elif numeric and stats["count"]:
+            q1, median, q3 = (_float(q) for q in row[f"c{i}_quartiles"])
+            summary = {
+                "min": row[f"c{i}_min"],
+                "max": row[f"c{i}_max"],
+                "mean": _float(row[f"c{i}_mean"]),
+                "std": _float(row[f"c{i}_std"]),
+                "median": median,
+            }
+            stats.update(summary)
+            stats.update({
+                "q1": q1,
+                "q3": q3,
+                "quartiles_exact": False,
+                "quantile_error": quantile_accuracy,
+            })
+            numeric_stats[field.name] = summary
+        column_stats[field.name] = stats
 
     profile = {
         "df": None,               # indicates non-pandas backend
         "df_spark": df,           # Spark-native handle
+        "backend": "spark",
         "rows": rows,
-        "columns": len(cols),
-        "column_names": cols,
-        "types": {c: str(t) for c, t in df.dtypes},
-        "numeric_stats": {},      # will be populated properly in Step 3 (numeric rules)
+        "columns": len(fields),
+        "column_names": [f.name for f in fields],
+        "types": {f.name: f.dataType.simpleString() for f in fields},
+        "nulls": {col: s["null_count"] for col, s in column_stats.items()},
+        "numeric_stats": numeric_stats,
+        "column_stats": column_stats,
+        "distinct_rsd": distinct_rsd,
     }
 
+    if "row_hash_distinct" in row:
+        duplicates = duplicates or {}
+        profile["approx_distinct_rows"] = int(row["row_hash_distinct"])
+        profile["duplicate_keys"] = duplicates.get("key_columns")
+        profile["duplicate_rsd"] = duplicates.get("rsd") or DEFAULT_DUPLICATE_RSD
+
+    if catalog:
+        profile["size_in_bytes"] = catalog["size_in_bytes"]
+        if known:
+            profile["stats_source"] = "catalog+scan" if scan else "catalog"
+    if metadata_only:
+        profile["metadata_only"] = True
+    if notes:
+        profile["notes"] = notes
+
     if table_name:
         profile["path"] = table_name
 
     return profile
 
 
-from dfguard.spark.engine import SparkRuleEngine
+def _catalog_statistics(
+    df: SparkDataFrame,
+    table_name: str,
+    whole_table: bool,
+    compute: bool,
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Usable catalog statistics of table_name for df, or None and why not."""
+    from dfguard.spark.catalog_stats import reads_table, table_statistics
+
+    if not whole_table and not reads_table(df, table_name):
+        return None, f"Catalog statistics of {table_name} not used: the DataFrame is not a plain read of it"
+    try:
+        stats = table_statistics(df.sparkSession, table_name, df.columns, compute=compute)
+    except Exception as e:
+        # Temporary views, or ANALYZE unsupported by the table format
+        reason = str(e).strip().splitlines()[0] if str(e).strip() else type(e).__name__
+        return None, f"Catalog statistics of {table_name} unavailable: {reason}"
+    if stats["rows"] is None:
+        return None, f"No catalog statistics for {table_name}; use compute_stats=True to compute them once"
+    return stats, None
+
 
-def validate_spark(df: SparkDataFrame, table_name: Optional[str] = None):
+def validate_spark(
+    df: Optional[SparkDataFrame] = None,
+    table_name: Optional[str] = None,
+    *,
+    distinct_rsd: float = DEFAULT_DISTINCT_RSD,
+    duplicate_keys: Optional[List[str]] = None,
+    exact_duplicates: bool = False,
+    duplicate_rsd: float = DEFAULT_DUPLICATE_RSD,
+    quantile_accuracy: float = DEFAULT_QUANTILE_ACCURACY,
+    persist: str = "auto",
+    catalog_stats: bool = True,
+    compute_stats: bool = False,
+    metadata_only: bool = False,
+    job_metrics: bool = False,
+):
     """
     Public Spark API.
     Returns a ValidationReport (same object used by pandas engine).
+
+    The dataset is profiled in one Spark job (see _profile_spark_dataframe());
+    rules then read the profile.
+
+    Duplicates are estimated in that job from the approximate distinct
+    count of a 64-bit row hash over duplicate_keys (all columns by
+    default), with relative error duplicate_rsd. exact_duplicates=True
+    counts them with dropDuplicates() instead: exact, but a shuffle of
+    every row by the key columns.
+
+    Numeric quartiles come from percentile_approx with rank error
+    quantile_accuracy; SparkNumericOutlierRule then counts the values
+    outside the IQR fences of every numeric column in one more job.
+
+    persist (see spark.persist.PERSIST_POLICIES) keeps the input between
+    those jobs, so an expensive upstream lineage (joins, JDBC scans) runs
+    once: persisted before profiling, read by every rule, unpersisted
+    afterwards. The default, auto, persists to memory and disk when more
+    than one job reads the input; plain file scans and DataFrames the
+    caller already cached are left alone. What was done is reported under
+    "persist" in to_dict().
+
+    With table_name (df defaults to that table), the catalog's table and
+    column statistics (DESCRIBE TABLE EXTENDED) are used when df reads the
+    whole table: compute_stats=True first runs ANALYZE TABLE ... COMPUTE
+    STATISTICS FOR ALL COLUMNS if they are missing, storing them for later
+    runs. metadata_only keeps just the rules the catalog can answer
+    (catalog_stats.CATALOG_RULES), so a table with statistics is validated
+    without any Spark job. Otherwise the scan still runs for duplicates and
+    outliers but takes distinct counts from the catalog; stale statistics
+    (row counts disagreeing) are ignored. The source is reported under
+    "stats_source", fallbacks under "notes".
+
+    Profiling and every rule run under their own Spark job group.
+    job_metrics=True reports the jobs, stages, tasks, task time and input
+    / shuffle bytes of each under report.timings (see SparkJobTracker).
     """
-    profile = _profile_spark_dataframe(df, table_name)
+    from dfguard.spark.job_metrics import SparkJobTracker
+    from pyspark.sql import types as T
+
+    if df is None:
+        if not table_name:
+            raise ValueError("validate_spark() needs a DataFrame or a table_name")
+        from pyspark.sql import SparkSession
+        df = SparkSession.builder.getOrCreate().table(table_name)
+        whole_table = True
+    else:
+        whole_table = False
+
+    if not distinct_rsd > 0 or not duplicate_rsd > 0:
+        raise ValueError("distinct_rsd and duplicate_rsd must be positive")
+    if not 0 < quantile_accuracy < 1:
+        raise ValueError("quantile_accuracy must be between 0 and 1")
+    if persist not in PERSIST_POLICIES:
+        raise ValueError(f"Unknown persist policy '{persist}', expected one of {PERSIST_POLICIES}")
+    if duplicate_keys:
+        missing = [c for c in duplicate_keys if c not in df.columns]
+        if missing:
+            raise ValueError(f"Key columns not found: {missing}")
+
+    duplicates = {
+        "key_columns": list(duplicate_keys) if duplicate_keys else None,
+        "exact": exact_duplicates,
+        "rsd": duplicate_rsd,
+    }
+    # The profiling job, the outlier count and an exact duplicate count
+    numeric = any(isinstance(f.dataType, T.NumericType) for f in df.schema.fields)
+    passes = 1 if metadata_only else 1 + numeric + exact_duplicates
+    # Listed before persisting: a checkpointed DataFrame has no input files
+    input_files = df.inputFiles()
 
-    print(profile)
+    catalog = None
+    notes: List[str] = []
+    if table_name and catalog_stats:
+        catalog, note = _catalog_statistics(df, table_name, whole_table, compute_stats)
+        if note:
+            notes.append(note)
 
-    # Initialize the engine with the rules (not empty lists)
-    engine = SparkRuleEngine()  # This will use the rules defined in the SparkRuleEngine class
+    data, persisted = persist_input(df, persist, passes)
+    try:
+        tracker = SparkJobTracker(df.sparkSession, collect=job_metrics)
+        profile, profile_cost = tracker.run("profile", lambda: _profile_spark_dataframe(
+            data, table_name,
+            distinct_rsd=distinct_rsd,
+            duplicates=duplicates,
+            quantile_accuracy=quantile_accuracy,
+            catalog=catalog,
+            metadata_only=metadata_only,
+        ), "dfguard profiling")
+        profile["input_files"] = input_files
+        profile["persist"] = persisted
+        if notes:
+            profile["notes"] = notes + profile.get("notes", [])
 
-    return engine.run(profile)
+        # Initialize the engine with the rules (not empty lists)
+        engine = SparkRuleEngine(
+            duplicates=duplicates, metadata_only=metadata_only, job_metrics=job_metrics
+        )
 
+        report = engine.run(profile)
+        if profile_cost is not None:
+            profile_cost["rows"] = profile["rows"]
+            report.add_profile_timing(profile_cost)
+        return report
+    finally:
+        release_input(data, persisted)
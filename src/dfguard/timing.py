@@ -0,0 +1,143 @@
+# src/dfguard/timing.py
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+MEMORY_METHODS = ("tracemalloc", "rss")
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+class _RssSampler:
+    """Peak resident set size above the starting one, sampled on a thread."""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.base = _rss()
+        self.peak = self.base
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="dfguard-rss", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, _rss())
+
+    def stop(self) -> int:
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, _rss())
+        return self.peak - self.base
+
+
+def _rss() -> int:
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * _PAGE_SIZE
+    except OSError:
+        # No procfs: the peak so far, which only shows growth past it
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def measure(
+    fn: Callable[[], Any],
+    *,
+    rows: Optional[int] = None,
+    memory: Optional[str] = "tracemalloc",
+) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Call fn() and return (its result, its cost).
+
+    The cost holds wall_seconds, cpu_seconds (CPU time of the calling
+    thread), peak_memory_bytes, the memory method and rows. Peak memory is
+    measured above what was in use at the start:
+
+      - "tracemalloc": exact Python and numpy allocations (not Arrow
+        buffers), but slows allocation-heavy code such as CSV parsing
+        several times; if already tracing, its peak is reset
+      - "rss": resident set size sampled every 5 ms, cheap and covering
+        every allocator, but process-wide and coarse
+      - None: not measured
+    """
+    if memory not in MEMORY_METHODS + (None,):
+        raise ValueError(f"Unknown memory method '{memory}', expected one of {MEMORY_METHODS}")
+
+    peak = None
+    started = False
+    sampler = None
+    if memory == "tracemalloc":
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        else:
+            tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+    elif memory == "rss":
+        sampler = _RssSampler()
+
+    wall = time.perf_counter()
+    cpu = time.thread_time()
+    try:
+        result = fn()
+    finally:
+        cpu = time.thread_time() - cpu
+        wall = time.perf_counter() - wall
+        if memory == "tracemalloc":
+            peak = max(tracemalloc.get_traced_memory()[1] - base, 0)
+            if started:
+                tracemalloc.stop()
+        elif sampler is not None:
+            peak = max(sampler.stop(), 0)
+
+    return result, {
+        "wall_seconds": round(wall, 6),
+        "cpu_seconds": round(cpu, 6),
+        "peak_memory_bytes": peak,
+        "memory_method": memory,
+        "rows": rows,
+    }
+
+
+def ranked(timings: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Profiling and rule entries of a report's timings, slowest first."""
+    entries = []
+    if timings.get("profile"):
+        entries.append({"name": "(profiling)", "bucket": "profile", **timings["profile"]})
+    entries.extend(timings.get("rules", []))
+    return sorted(entries, key=lambda e: e["wall_seconds"], reverse=True)
+
+
+def aggregate(all_timings: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Sum the timings of several reports per rule (for batch runs)."""
+    total: Dict[str, Dict[str, Any]] = {}
+
+    def add(key: str, bucket: str, entry: Dict[str, Any]) -> None:
+        acc = total.setdefault(key, {
+            "name": key, "bucket": bucket, "wall_seconds": 0.0, "cpu_seconds": 0.0,
+            "peak_memory_bytes": None, "rows": 0, "files": 0,
+        })
+        acc["wall_seconds"] += entry["wall_seconds"]
+        acc["cpu_seconds"] += entry["cpu_seconds"]
+        acc["rows"] += entry.get("rows") or 0
+        acc["files"] += 1
+        if entry.get("peak_memory_bytes") is not None:
+            acc["peak_memory_bytes"] = max(acc["peak_memory_bytes"] or 0, entry["peak_memory_bytes"])
+
+    for timings in all_timings:
+        if timings.get("profile"):
+            add("(profiling)", "profile", timings["profile"])
+        for entry in timings.get("rules", []):
+            add(entry["name"], entry["bucket"], entry)
+
+    entries = sorted(total.values(), key=lambda e: e["wall_seconds"], reverse=True)
+    for entry in entries:
+        entry["wall_seconds"] = round(entry["wall_seconds"], 6)
+        entry["cpu_seconds"] = round(entry["cpu_seconds"], 6)
+    return {"rules": entries}
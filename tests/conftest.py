@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_result_cache(tmp_path_factory, monkeypatch):
+    """Keep CLI runs from reading or writing the user's result cache."""
+    monkeypatch.setenv("DFGUARD_CACHE_DIR", str(tmp_path_factory.mktemp("dfguard-cache")))
@@ -0,0 +1,162 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+from typer.testing import CliRunner
+
+from dfguard import validate
+from dfguard.arrow_backend import arrow_column_pass, arrow_row_hashes
+from dfguard.cli import app
+from dfguard.core import validate_profile
+from dfguard.profiler import column_stats, stream_profile
+
+
+def _results(report):
+    return [(r.name, r.warning, r.details) for r in report.all_results]
+
+
+def _frame(n=2000, seed=0):
+    rng = np.random.default_rng(seed)
+    text = np.array([" a", "b ", "c  d", "e\tf", "1", "2.5", "1e5", "inf", "x", None], dtype=object)
+    df = pd.DataFrame({
+        "num": rng.normal(size=n),
+        "count": rng.integers(0, 10, n),
+        "sparse": np.where(rng.random(n) < 0.2, np.nan, rng.integers(0, 100, n)),
+        "text": rng.choice(text, n),
+        "flag": rng.random(n) < 0.5,
+    })
+    return pd.concat([df, df.iloc[:25]], ignore_index=True)
+
+
+class TestArrowBackend:
+
+    def test_same_report_as_pandas(self):
+        df = _frame()
+        expected = _results(validate(df))
+
+        assert _results(validate(df, backend="arrow")) == expected
+        assert _results(validate(pa.Table.from_pandas(df), backend="arrow")) == expected
+
+    def test_string_kernel_matches_pandas(self):
+        series = pd.Series([" a", "a", "a  b", "x\ty", "q\\tz", "1", " 2 ", "1_000", None, "　z"])
+        arrow_stats, _ = arrow_column_pass(pa.array(series, from_pandas=True))
+        pandas_stats = column_stats(series)
+
+        assert arrow_stats["whitespace"] == pandas_stats["whitespace"]
+        assert arrow_stats["numeric_coercible"] == pandas_stats["numeric_coercible"]
+        assert arrow_stats["null_count"] == pandas_stats["null_count"]
+
+    def test_row_hashes_find_duplicates(self):
+        table = pa.table({"a": [1, 2, 1, None, None], "b": ["x", "y", "x", "z", "z"]})
+        hashes = arrow_row_hashes(table)
+
+        assert hashes[0] == hashes[2]
+        assert hashes[3] == hashes[4]
+        assert len(set(hashes.tolist())) == 3
+
+    @pytest.mark.parametrize("ext", ["csv", "parquet"])
+    def test_streamed_files_match_pandas(self, tmp_path, ext):
+        df = _frame()
+        p = tmp_path / f"data.{ext}"
+        if ext == "csv":
+            df.to_csv(p, index=False)
+            expected = _results(validate(pd.read_csv(p)))
+        else:
+            df.to_parquet(p, index=False, row_group_size=300)
+            expected = _results(validate(pd.read_parquet(p)))
+
+        profile = stream_profile(str(p), chunksize=500, backend="arrow")
+        assert _results(validate_profile(profile)) == expected
+
+    def test_csv_type_drift_rereads_column_as_text(self, tmp_path):
+        p = tmp_path / "drift.csv"
+        pd.DataFrame({"v": list(range(5000)) + ["two"]}).to_csv(p, index=False)
+
+        profile = stream_profile(str(p), chunksize=1000, backend="arrow")
+        stats = profile["column_stats"]["v"]
+        assert stats["numeric"] is False
+        assert stats["numeric_coercible"] == 5000
+
+    def test_mistyped_columns_reread_once(self, tmp_path, monkeypatch):
+        import dfguard.arrow_backend as arrow_backend
+
+        p = tmp_path / "drift.csv"
+        n = 20_000
+        pd.DataFrame({
+            "a": list(range(n)) + ["x"],
+            "b": [1.5] * n + ["y"],
+            "c": [True] * n + ["z"],
+            "d": range(n + 1),
+        }).to_csv(p, index=False)
+        opened = []
+        original = arrow_backend._open_csv
+        monkeypatch.setattr(
+            arrow_backend, "_open_csv", lambda *args: opened.append(dict(args[2])) or original(*args)
+        )
+
+        profile = stream_profile(str(p), chunksize=1000, backend="arrow")
+        assert [profile["column_stats"][c]["numeric"] for c in "abcd"] == [False, False, False, True]
+        # First read, one pass as strings, one re-read with every override
+        assert len(opened) == 3
+        assert set(opened[-1]) == {"a", "b", "c"}
+        assert _results(validate_profile(profile)) == _results(validate(pd.read_csv(p)))
+
+    def test_int64_beyond_float_precision(self):
+        from dfguard.accumulators import ProfileAccumulator
+
+        ids = np.arange(100, dtype=np.int64) + 1450000000000000001
+        df = pd.DataFrame({"id": ids})
+        report = validate(df, backend="arrow")
+        stats = report.profile["column_stats"]["id"]
+        assert stats["min"] == ids[0] and stats["max"] == ids[-1]
+        dup = next(r for r in report.all_results if r.name == "duplicate_rows")
+        assert dup.details["count"] == 0
+
+        acc = ProfileAccumulator()
+        acc.update_arrow(pa.RecordBatch.from_pandas(df, preserve_index=False))
+        assert acc.to_profile()["duplicate_count"] == 0
+
+    def test_csv_blocks_follow_chunksize(self, tmp_path, monkeypatch):
+        import dfguard.accumulators as accumulators
+
+        p = tmp_path / "data.csv"
+        pd.DataFrame({"x": range(200_000), "y": "abc"}).to_csv(p, index=False)
+        sizes = []
+        original = accumulators.ProfileAccumulator.update_arrow
+        monkeypatch.setattr(
+            accumulators.ProfileAccumulator, "update_arrow",
+            lambda self, batch: sizes.append(batch.num_rows) or original(self, batch),
+        )
+
+        profile = stream_profile(str(p), chunksize=20_000, backend="arrow")
+        assert profile["rows"] == 200_000
+        assert len(sizes) >= 5 and max(sizes) < 100_000
+
+    def test_indexed_parquet(self, tmp_path):
+        p = tmp_path / "indexed.parquet"
+        df = pd.DataFrame({"x": [1.0, 2.0, None], "s": ["a", "b", "c"]}, index=[10, 20, 30])
+        df.to_parquet(p)
+
+        profile = stream_profile(str(p), chunksize=2, backend="arrow")
+        assert profile["column_names"] == ["x", "s"]
+        assert _results(validate_profile(profile)) == _results(validate(pd.read_parquet(p)))
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            validate(pd.DataFrame({"x": [1]}), backend="polars")
+
+    def test_cli_backend_option(self, tmp_path):
+        p = tmp_path / "data.csv"
+        _frame(n=100).to_csv(p, index=False)
+
+        result = CliRunner().invoke(app, [str(p), "--json", "--backend", "arrow"])
+        assert result.exit_code == 0
+        assert '"status"' in result.stdout
+
+    def test_cli_rejects_unknown_backend(self, tmp_path):
+        p = tmp_path / "data.csv"
+        _frame(n=100).to_csv(p, index=False)
+
+        result = CliRunner().invoke(app, [str(p), "--backend", "bogus"])
+        assert result.exit_code == 2
+        assert "failed to read file" not in result.output
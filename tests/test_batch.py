@@ -0,0 +1,70 @@
+import json
+
+import pandas as pd
+from typer.testing import CliRunner
+
+from dfguard.batch import batch_summary, expand_paths, validate_file, validate_files
+from dfguard.cli import app
+
+
+def _tree(tmp_path):
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    pd.DataFrame({"x": [1, 1], "y": ["a", "a"]}).to_csv(tmp_path / "a" / "dups.csv", index=False)
+    pd.DataFrame({"x": [1, 2]}).to_csv(tmp_path / "b" / "clean.csv", index=False)
+    pd.DataFrame({"x": [1.0, 2.0]}).to_parquet(tmp_path / "b" / "clean.parquet")
+    (tmp_path / "b" / "notes.txt").write_text("skip me")
+    return tmp_path
+
+
+class TestExpandPaths:
+
+    def test_directories_are_searched_recursively(self, tmp_path):
+        root = _tree(tmp_path)
+        paths = expand_paths([str(root)])
+
+        assert [p.replace(str(root), "") for p in paths] == [
+            "/a/dups.csv", "/b/clean.csv", "/b/clean.parquet",
+        ]
+
+    def test_globs_and_duplicates(self, tmp_path):
+        root = _tree(tmp_path)
+        paths = expand_paths([str(root / "**" / "*.csv"), str(root / "a" / "dups.csv")])
+
+        assert len(paths) == 2
+
+    def test_missing_paths_are_kept(self, tmp_path):
+        missing = str(tmp_path / "missing.csv")
+        assert expand_paths([missing]) == [missing]
+
+
+class TestValidateFiles:
+
+    def test_entries_keep_order_and_status(self, tmp_path):
+        root = _tree(tmp_path)
+        paths = expand_paths([str(root)]) + [str(root / "missing.csv")]
+
+        entries = validate_files(paths, jobs=2)
+
+        assert [e["file"] for e in entries] == paths
+        assert [e["status"] for e in entries] == ["warning", "ok", "ok", "failed"]
+        assert all(e["seconds"] >= 0 for e in entries)
+        assert "not found" in entries[-1]["error"]
+
+    def test_summary_exit_code(self, tmp_path):
+        ok = validate_file(str(_tree(tmp_path) / "b" / "clean.csv"))
+        failed = validate_file(str(tmp_path / "missing.csv"))
+
+        assert batch_summary([ok], 1.0)["exit_code"] == 0
+        summary = batch_summary([ok, failed], 1.0)
+        assert summary["exit_code"] == 1
+        assert (summary["ok"], summary["failed"], summary["rows"]) == (1, 1, 2)
+
+    def test_cli_batch_json(self, tmp_path):
+        root = _tree(tmp_path)
+        result = CliRunner().invoke(app, [str(root / "a"), str(root / "b" / "*.csv"), "--json"])
+
+        assert result.exit_code == 0
+        batch = json.loads(result.stdout)
+        assert batch["summary"]["files"] == 2
+        assert batch["files"][0]["report"]["status"] == "warning"
@@ -0,0 +1,37 @@
+import json
+
+import pandas as pd
+
+from benchmarks.compare import compare
+from benchmarks.generators import SHAPES, generate, generate_chunks
+from benchmarks.run import run
+
+
+class TestBenchmarks:
+
+    def test_generators_are_seeded_and_chunkable(self):
+        for shape in SHAPES:
+            df = generate(shape, 500, seed=3)
+            assert len(df) == 500
+            pd.testing.assert_frame_equal(df, generate(shape, 500, seed=3))
+
+        chunks = pd.concat(list(generate_chunks("mixed", 500, chunk_rows=500)), ignore_index=True)
+        pd.testing.assert_frame_equal(chunks, generate("mixed", 500))
+
+    def test_suite_reports_every_rule(self, tmp_path):
+        doc = run(["mixed"], [200], ["profile", "rules", "validate", "cli"], repeat=1, workdir=str(tmp_path))
+        json.dumps(doc)
+
+        names = {(r["target"], r["name"]) for r in doc["results"]}
+        assert ("profile", "profile_dataframe") in names
+        assert ("rules", "numeric_outliers") in names
+        assert ("cli", "dfguard --json") in names
+        assert all(r["peak_memory_bytes"] >= 0 for r in doc["results"])
+
+    def test_compare_flags_regressions(self):
+        base = {"results": [{"shape": "s", "rows": 1, "target": "t", "name": "n",
+                             "seconds_median": 1.0, "peak_memory_bytes": 100}]}
+        slow = {"results": [dict(base["results"][0], seconds_median=1.5)]}
+
+        assert compare(base, slow, 0.1)[0]["regression"] is True
+        assert compare(base, base, 0.1)[0]["regression"] is False
@@ -0,0 +1,72 @@
+import os
+
+import pandas as pd
+from typer.testing import CliRunner
+
+from dfguard.batch import validate_path
+from dfguard.cache import ResultCache
+from dfguard.cli import app
+
+
+def _csv(tmp_path, name="data.csv", values=(1, 1, 2)):
+    p = tmp_path / name
+    pd.DataFrame({"x": list(values), "y": [" a"] * len(values)}).to_csv(p, index=False)
+    return str(p)
+
+
+class TestResultCache:
+
+    def test_hit_returns_identical_report(self, tmp_path):
+        path = _csv(tmp_path)
+        cache = ResultCache(str(tmp_path / "cache"))
+
+        first = validate_path(path, cache=cache)
+        second = validate_path(path, cache=cache)
+
+        assert not first.profile.get("cached")
+        assert second.profile["cached"] is True
+        assert second.to_dict() == first.to_dict()
+
+    def test_changed_file_or_options_miss(self, tmp_path):
+        path = _csv(tmp_path)
+        cache = ResultCache(str(tmp_path / "cache"))
+        validate_path(path, cache=cache)
+
+        assert not validate_path(path, {"chunksize": 1}, cache=cache).profile.get("cached")
+
+        _csv(tmp_path, values=(1, 2, 3, 4))
+        report = validate_path(path, cache=cache)
+        assert not report.profile.get("cached")
+        assert report.profile["rows"] == 4
+
+    def test_content_hash_catches_same_size_and_mtime(self, tmp_path):
+        path = _csv(tmp_path, values=(1, 1, 2))
+        cache = ResultCache(str(tmp_path / "cache"), content_hash=True)
+        validate_path(path, cache=cache)
+
+        st = os.stat(path)
+        _csv(tmp_path, values=(1, 2, 3))
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        assert not validate_path(path, cache=cache).profile.get("cached")
+
+    def test_lru_eviction(self, tmp_path):
+        cache = ResultCache(str(tmp_path / "cache"), max_bytes=1)
+        paths = [_csv(tmp_path, f"f{i}.csv") for i in range(3)]
+        for path in paths:
+            validate_path(path, cache=cache)
+
+        # Every store overflows a 1-byte budget, so nothing survives
+        assert cache._entries() == []
+
+    def test_cli_no_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("DFGUARD_CACHE_DIR", str(tmp_path / "cache"))
+        path = _csv(tmp_path)
+
+        CliRunner().invoke(app, [path, "--json", "--no-cache"])
+        assert not (tmp_path / "cache").exists()
+
+        result = CliRunner().invoke(app, [path, "--json"])
+        assert result.exit_code == 0
+        assert (tmp_path / "cache").exists()
+        assert CliRunner().invoke(app, [path, "--json"]).stdout == result.stdout
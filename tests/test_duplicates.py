@@ -0,0 +1,126 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+from typer.testing import CliRunner
+
+from dfguard import validate
+from dfguard.cli import app
+from dfguard.core import validate_profile
+from dfguard.duplicates import DuplicateAccumulator, ExactDuplicateAccumulator
+from dfguard.profiler import profile_dataframe, stream_profile
+from dfguard.rules.structural import DuplicateRule
+
+
+def _dup_frame(n=20_000, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "id": rng.integers(0, n // 2, n),
+        "grp": rng.choice(["a", "b", "c"], n),
+        "v": rng.integers(0, 3, n).astype(float),
+    })
+
+
+class TestDuplicateAccumulators:
+
+    def test_spill_matches_in_memory(self, tmp_path):
+        df = _dup_frame()
+        expected = int(df.duplicated().sum())
+
+        acc = DuplicateAccumulator(memory_budget=4096, spill_dir=str(tmp_path))
+        for start in range(0, len(df), 1000):
+            acc.update(df.iloc[start:start + 1000])
+
+        assert acc.spilled
+        assert acc.duplicates == expected
+        assert acc.rows == len(df)
+
+        acc.close()
+        assert os.listdir(tmp_path) == []
+
+    def test_merge_with_spilled_partner(self, tmp_path):
+        df = _dup_frame()
+        left = DuplicateAccumulator(key_columns=["id"])
+        right = DuplicateAccumulator(key_columns=["id"], memory_budget=2048, spill_dir=str(tmp_path))
+        left.update(df.iloc[:5000])
+        right.update(df.iloc[5000:])
+        left.merge(right)
+
+        assert left.duplicates == int(df.duplicated(subset=["id"]).sum())
+
+    def test_exact_spill_matches_in_memory(self, tmp_path):
+        df = _dup_frame()
+        acc = ExactDuplicateAccumulator(key_columns=["id", "grp"], memory_budget=50_000, spill_dir=str(tmp_path))
+        for start in range(0, len(df), 3000):
+            acc.update(df.iloc[start:start + 3000])
+
+        assert acc.spilled
+        assert acc.duplicates == int(df.duplicated(subset=["id", "grp"]).sum())
+
+    def test_arrow_key_columns(self):
+        df = _dup_frame(n=2000)
+        acc = DuplicateAccumulator(key_columns=["grp", "v"])
+        acc.update_arrow(pa.Table.from_pandas(df, preserve_index=False))
+
+        assert acc.duplicates == int(df.duplicated(subset=["grp", "v"]).sum())
+
+
+class TestDuplicateRule:
+
+    def test_key_columns(self):
+        df = pd.DataFrame({"id": [1, 1, 2], "v": [1, 2, 3]})
+        report = validate(df, duplicate_keys=["id"])
+        dup = next(r for r in report.all_results if r.name == "duplicate_rows")
+
+        assert dup.details["count"] == 1
+        assert dup.details["key_columns"] == ["id"]
+
+    def test_large_int64_ids_are_not_duplicates(self):
+        ids = np.arange(100, dtype=np.int64) + 1450000000000000001
+        df = pd.DataFrame({"id": ids, "v": 1})
+        for options in ({}, {"duplicate_keys": ["id"]}):
+            report = validate(df, **options)
+            dup = next(r for r in report.all_results if r.name == "duplicate_rows")
+            assert dup.details["count"] == 0
+
+        assert DuplicateRule(memory_budget=1 << 20).apply(profile_dataframe(df)).details["count"] == 0
+
+    def test_unhashable_values_fall_back_to_hashing(self):
+        df = pd.DataFrame({"tags": [["a"], ["a"], ["b"]]})
+        assert DuplicateRule().apply(profile_dataframe(df)).details["count"] == 1
+
+    def test_exact_and_hash_agree(self):
+        df = _dup_frame(n=5000)
+        for exact in (False, True):
+            result = DuplicateRule(key_columns=["id"], exact=exact).apply(profile_dataframe(df))
+            assert result.details["count"] == int(df.duplicated(subset=["id"]).sum())
+
+    def test_streamed_profile_carries_keys(self, tmp_path):
+        p = tmp_path / "data.csv"
+        df = _dup_frame(n=3000)
+        df.to_csv(p, index=False)
+
+        profile = stream_profile(str(p), chunksize=500, duplicates={"key_columns": ["id"], "exact": True})
+        report = validate_profile(profile)
+        dup = next(r for r in report.all_results if r.name == "duplicate_rows")
+        assert dup.details["count"] == int(df.duplicated(subset=["id"]).sum())
+
+    def test_mismatched_keys_without_df(self, tmp_path):
+        p = tmp_path / "data.csv"
+        _dup_frame(n=100).to_csv(p, index=False)
+
+        profile = stream_profile(str(p))
+        with pytest.raises(ValueError, match="duplicate count"):
+            DuplicateRule(key_columns=["id"]).apply(profile)
+
+    def test_cli_key_columns(self, tmp_path):
+        p = tmp_path / "data.csv"
+        pd.DataFrame({"id": [1, 1, 2], "v": [1, 2, 3]}).to_csv(p, index=False)
+
+        result = CliRunner().invoke(
+            app, [str(p), "--json", "--key-columns", "id", "--duplicates-memory", "1"]
+        )
+        assert result.exit_code == 0
+        assert '"key_columns": [' in result.stdout
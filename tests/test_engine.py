@@ -0,0 +1,75 @@
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dfguard import validate
+from dfguard.engine import RuleEngine
+from dfguard.profiler import profile_dataframe
+from dfguard.rules.base import BaseRule, ValidationResult
+
+
+def _results(report):
+    return [(r.name, r.warning, r.message, r.details) for r in report.all_results]
+
+
+def _frame(n=2000, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "num": rng.normal(size=n),
+        "text": rng.choice([" a", "b", None], n),
+        "dup": rng.integers(0, 10, n),
+    })
+
+
+class SlowRule(BaseRule):
+    def __init__(self, name, delay):
+        self.name = name
+        self.delay = delay
+
+    def apply(self, profile):
+        time.sleep(self.delay)
+        return ValidationResult(warning=False, message=self.name)
+
+
+class BrokenRule(BaseRule):
+    name = "broken"
+
+    def apply(self, profile):
+        raise RuntimeError("boom")
+
+
+class TestParallelEngine:
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_matches_sequential(self, executor):
+        df = _frame()
+        expected = _results(validate(df))
+        assert _results(validate(df, workers=4, executor=executor)) == expected
+
+    def test_order_is_deterministic(self):
+        # Later rules finish first; results must still follow rule order
+        rules = [SlowRule(f"r{i}", 0.05 * (4 - i)) for i in range(4)]
+        engine = RuleEngine(quality_rules=rules, workers=4)
+
+        report = engine.run(profile_dataframe(_frame(n=10)))
+        assert [r.name for r in report.quality_results] == ["r0", "r1", "r2", "r3"]
+
+    def test_failures_become_warnings(self):
+        engine = RuleEngine(
+            structural_rules=[BrokenRule()],
+            numeric_rules=[SlowRule("ok", 0)],
+            workers=2,
+        )
+        report = engine.run(profile_dataframe(_frame(n=10)))
+
+        failed = report.structural_results[0]
+        assert failed.warning is True
+        assert failed.name == "broken"
+        assert failed.details == {"error": "boom"}
+        assert report.numeric_results[0].name == "ok"
+
+    def test_rejects_unknown_executor(self):
+        with pytest.raises(ValueError, match="executor"):
+            RuleEngine(executor="gpu")
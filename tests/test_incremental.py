@@ -0,0 +1,122 @@
+import numpy as np
+import pandas as pd
+from typer.testing import CliRunner
+
+from dfguard import validate
+from dfguard.cli import app
+from dfguard.incremental import load_state, validate_incremental
+
+
+def _results(report):
+    return [(r.name, r.warning, r.details) for r in report.all_results]
+
+
+def _frame(n, seed):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "id": rng.integers(0, 50, n),
+        "text": rng.choice([" a", "b", None], n),
+        "value": rng.normal(size=n).round(2),
+    })
+
+
+class TestIncremental:
+
+    def test_appended_csv_matches_full_validation(self, tmp_path):
+        log = str(tmp_path / "log.csv")
+        state = str(tmp_path / "state.pkl")
+        _frame(500, 0).to_csv(log, index=False)
+        validate_incremental([log], state, chunksize=128)
+
+        with open(log, "a") as fh:
+            fh.write(_frame(300, 1).to_csv(index=False, header=False))
+            fh.write("7, a")  # half-written line
+
+        report = validate_incremental([log], state, chunksize=128)
+        assert report.profile["rows"] == 800
+        assert report.profile["incremental"]["new_rows"] == 300
+
+        with open(log, "a") as fh:
+            fh.write(",1.5\n")
+
+        report = validate_incremental([log], state, chunksize=128)
+        assert report.profile["incremental"]["new_rows"] == 1
+        assert _results(report) == _results(validate(pd.read_csv(log)))
+
+    def test_quoted_newlines_are_not_cut(self, tmp_path):
+        log = str(tmp_path / "log.csv")
+        state = str(tmp_path / "state.pkl")
+        _frame(50, 0).to_csv(log, index=False)
+        validate_incremental([log], state)
+
+        with open(log, "a") as fh:
+            fh.write('7,"two\nlines",1.5\n')
+            fh.write('8,"half\nwritten')
+
+        report = validate_incremental([log], state)
+        assert report.profile["incremental"]["new_rows"] == 1
+
+        with open(log, "a") as fh:
+            fh.write(' ""quoted"" text",2.5\n')
+
+        report = validate_incremental([log], state)
+        assert report.profile["incremental"]["new_rows"] == 1
+        assert report.profile["rows"] == 52
+        assert _results(report) == _results(validate(pd.read_csv(log)))
+
+    def test_new_partitions_only(self, tmp_path):
+        state = str(tmp_path / "state.pkl")
+        paths = []
+        for i in range(3):
+            path = str(tmp_path / f"part-{i}.parquet")
+            _frame(200, i).to_parquet(path, index=False)
+            paths.append(path)
+            report = validate_incremental(paths, state)
+            assert report.profile["incremental"]["processed_files"] == 1
+
+        full = pd.concat([pd.read_parquet(p) for p in paths], ignore_index=True)
+        assert _results(report) == _results(validate(full))
+        assert len(load_state(state)["watermark"]) == 3
+
+    def test_rewritten_file_rebuilds(self, tmp_path):
+        state = str(tmp_path / "state.pkl")
+        path = str(tmp_path / "part.parquet")
+        _frame(200, 0).to_parquet(path, index=False)
+        validate_incremental([path], state)
+
+        _frame(10, 1).to_parquet(path, index=False)
+        report = validate_incremental([path], state)
+
+        assert report.profile["rows"] == 10
+        assert any("rebuilt" in note for note in report.profile["notes"])
+
+    def test_rewritten_csv_rebuilds_even_if_larger(self, tmp_path):
+        log = str(tmp_path / "log.csv")
+        state = str(tmp_path / "state.pkl")
+        _frame(500, 0).to_csv(log, index=False)
+        validate_incremental([log], state, chunksize=128)
+
+        # Same rows per chunk read differently: not a reason to rebuild
+        report = validate_incremental([log], state, chunksize=64)
+        assert report.profile["incremental"]["new_rows"] == 0
+        assert not any("rebuilt" in note for note in report.profile["notes"])
+
+        _frame(600, 1).to_csv(log, index=False)
+        report = validate_incremental([log], state, chunksize=128)
+
+        assert report.profile["rows"] == 600
+        assert any("was modified" in note for note in report.profile["notes"])
+        assert _results(report) == _results(validate(pd.read_csv(log)))
+
+    def test_cli_state(self, tmp_path):
+        log = tmp_path / "log.csv"
+        state = str(tmp_path / "state.pkl")
+        _frame(20, 0).to_csv(log, index=False)
+
+        result = CliRunner().invoke(app, [str(log), "--json", "--state", state])
+        assert result.exit_code == 0
+        with open(log, "a") as fh:
+            fh.write("1,b,2.0\n")
+
+        result = CliRunner().invoke(app, [str(log), "--json", "--state", state])
+        assert '"Incremental: 1 new rows from 1 of 1 files"' in result.stdout
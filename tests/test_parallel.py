@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dfguard import validate
+from dfguard.parallel import profile_dataframe_parallel
+
+
+def _results(report):
+    return [(r.name, r.warning, r.message, r.details) for r in report.all_results]
+
+
+class TestParallelProfiling:
+
+    def _wide_frame(self, n=500):
+        rng = np.random.default_rng(1)
+        return pd.DataFrame({
+            "num": rng.normal(size=n),
+            "int": rng.integers(0, 9, n),
+            "text": rng.choice([" a", "b  c", "1", None], n),
+            "mixed": pd.Series(rng.choice([1, "x", 2.5, None], n), dtype=object),
+            "when": pd.to_datetime(rng.integers(0, 10**9, n), unit="s"),
+            "cat": pd.Categorical(rng.choice(["a", "b"], n)),
+            "nullable": pd.array(rng.integers(0, 5, n), dtype="Int64"),
+            "flag": rng.random(n) < 0.5,
+        })
+
+    @pytest.mark.parametrize("backend", ["pandas", "arrow"])
+    def test_matches_single_process(self, backend):
+        df = self._wide_frame()
+        expected = _results(validate(df, backend=backend))
+        assert _results(validate(df, backend=backend, profile_workers=2)) == expected
+
+    def test_profile_keeps_column_order_and_dtypes(self):
+        df = self._wide_frame(n=50)
+        profile = profile_dataframe_parallel(df, workers=2)
+
+        assert list(profile["column_stats"]) == list(df.columns)
+        assert [s["dtype"] for s in profile["column_stats"].values()] == [str(t) for t in df.dtypes]
+        assert profile["df"] is df
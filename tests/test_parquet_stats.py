@@ -0,0 +1,91 @@
+import json
+
+import pandas as pd
+import pytest
+from typer.testing import CliRunner
+
+from dfguard import validate
+from dfguard.cli import app
+from dfguard.core import validate_profile
+from dfguard.parquet_stats import footer_profile
+from dfguard.profiler import quick_profile
+
+
+def _frame():
+    return pd.DataFrame({
+        "id": [1, 2, 3, 4, 5, 6],
+        "score": [0.5, None, None, None, 2.5, -1.0],
+        "name": ["a", None, "c", None, None, None],
+    })
+
+
+class TestFooterStatistics:
+
+    def test_footer_profile_matches_data(self, tmp_path):
+        p = tmp_path / "data.parquet"
+        _frame().to_parquet(p, index=False, row_group_size=4)
+
+        profile, untrusted = footer_profile(str(p))
+
+        assert untrusted == []
+        assert profile["rows"] == 6
+        assert profile["nulls"] == {"id": 0, "score": 3, "name": 4}
+        assert profile["numeric_stats"]["score"] == {"min": -1.0, "max": 2.5}
+        assert profile["numeric_stats"]["id"] == {"min": 1, "max": 6}
+
+    def test_metadata_only_rules(self, tmp_path):
+        p = tmp_path / "data.parquet"
+        _frame().to_parquet(p, index=False)
+
+        report = validate_profile(quick_profile(str(p), metadata_only=True))
+        names = [r.name for r in report.all_results]
+        null_ratio = next(r for r in report.quality_results if r.name == "null_ratio")
+
+        assert names == ["non_empty", "null_ratio"]
+        expected = next(r for r in validate(_frame()).quality_results if r.name == "null_ratio")
+        assert null_ratio.details == expected.details
+        assert report.to_dict()["stats_source"] == "parquet_footer"
+
+    def test_untrusted_columns_fall_back_to_scan(self, tmp_path):
+        p = tmp_path / "nested.parquet"
+        pd.DataFrame({"x": [1, 2, 3], "tags": [[1], None, [2, 3]]}).to_parquet(p, index=False)
+
+        profile = quick_profile(str(p), metadata_only=True)
+
+        assert profile["nulls"] == {"x": 0, "tags": 1}
+        assert profile["stats_source"] == "parquet_footer+scan"
+        assert "tags" in profile["notes"][0]
+        assert "notes" in validate_profile(profile).to_dict()
+
+    def test_metadata_only_requires_parquet(self, tmp_path):
+        p = tmp_path / "data.csv"
+        _frame().to_csv(p, index=False)
+
+        with pytest.raises(ValueError):
+            quick_profile(str(p), metadata_only=True)
+
+    def test_metadata_only_columns(self, tmp_path):
+        p = tmp_path / "data.parquet"
+        _frame().to_parquet(p, index=False)
+
+        profile = quick_profile(str(p), metadata_only=True, columns=["name", "id"])
+        assert profile["column_names"] == ["name", "id"]
+        assert profile["nulls"] == {"name": 4, "id": 0}
+
+        with pytest.raises(ValueError, match="Columns not found"):
+            quick_profile(str(p), metadata_only=True, columns=["missing"])
+
+    def test_cli_metadata_only(self, tmp_path):
+        p = tmp_path / "data.parquet"
+        _frame().to_parquet(p, index=False)
+
+        result = CliRunner().invoke(app, [str(p), "--metadata-only"])
+        assert result.exit_code == 0
+        assert "Null ratio" in result.stdout
+        assert "Whitespace" not in result.stdout
+
+        result = CliRunner().invoke(app, [str(p), "--metadata-only", "--columns", "id", "--json", "--no-cache"])
+        assert result.exit_code == 0
+        doc = json.loads(result.stdout)
+        assert doc["summary"]["column_names"] == ["id"]
+        assert doc["quality"][0]["details"] == {"id": "0.0%"}
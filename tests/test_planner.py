@@ -0,0 +1,113 @@
+import pandas as pd
+import pytest
+
+from dfguard.core import _build_default_engine
+from dfguard.engine import RuleEngine
+from dfguard.planner import plan_stats
+from dfguard.profiler import profile_chunks, profile_dataframe
+from dfguard.rules.base import BaseRule, ValidationResult
+from dfguard.rules.numeric import NumericOutlierRule
+from dfguard.rules.quality import NullRatioRule, TypeMismatchRule, WhitespaceRule
+from dfguard.rules.structural import DuplicateRule, NonEmptyRule
+
+
+def _frame():
+    return pd.DataFrame({
+        "n": [1, 2, 3, 100, None],
+        "s": [" a", "b", "1", "2", None],
+        "flag": [True, False, True, True, False],
+    })
+
+
+class _Undeclared(BaseRule):
+    name = "undeclared"
+
+    def apply(self, profile):
+        return ValidationResult(warning=False, message="ok", details={})
+
+
+class TestPlan:
+
+    def test_default_engine_plan_matches_unplanned_profile(self):
+        df = _frame()
+        plan = _build_default_engine().plan()
+
+        planned = profile_dataframe(df, plan=plan)
+        assert planned["column_stats"] == profile_dataframe(df)["column_stats"]
+
+        chunks = [df[:2], df[2:]]
+        streamed = profile_chunks(chunks, plan=plan)
+        assert streamed["column_stats"] == profile_chunks(chunks)["column_stats"]
+        assert streamed["duplicate_count"] == 0
+
+    def test_only_required_stats_are_computed(self):
+        engine = RuleEngine(quality_rules=[NullRatioRule()])
+        stats = engine.profile(_frame())["column_stats"]
+
+        assert stats["n"]["null_count"] == 1
+        assert stats["n"]["sum"] == 106.0
+        assert stats["n"]["q1"] is None and stats["n"]["outliers"] is None
+        assert stats["s"]["whitespace"] is None
+        assert stats["s"]["numeric_coercible"] is None
+
+    def test_dtype_restricted_rules_skip_other_columns(self):
+        engine = RuleEngine(numeric_rules=[NumericOutlierRule()])
+        profile = engine.profile(_frame())
+
+        assert list(profile["column_stats"]) == ["n"]
+        assert profile["column_names"] == ["n", "s", "flag"]
+        assert profile["column_stats"]["n"]["outliers"] == 1
+
+    def test_rule_columns_restrict_inputs_and_output(self):
+        engine = RuleEngine(quality_rules=[NullRatioRule(columns=["s"]), WhitespaceRule()])
+        report = engine.validate(_frame())
+        quality = {r.name: r for r in report.quality_results}
+
+        assert quality["null_ratio"].details == {"s": "20.0%"}
+        assert set(quality["whitespace_issues"].details) == {"n", "s", "flag"}
+
+    def test_missing_rule_columns_fail_the_rule(self):
+        report = RuleEngine(quality_rules=[NullRatioRule(columns=["nope"])]).validate(_frame())
+        assert "nope" in report.quality_results[0].details["error"]
+
+    def test_undeclared_rule_computes_everything(self):
+        plan = plan_stats([NullRatioRule(), _Undeclared()])
+        assert plan.complete
+        assert plan.stats_for("x") is None
+
+        stats = RuleEngine(quality_rules=[_Undeclared()]).profile(_frame())["column_stats"]
+        assert stats["s"]["whitespace"] == 1
+
+    def test_unknown_declarations_raise(self):
+        rule = NullRatioRule()
+        rule.requires = ("median",)
+        with pytest.raises(ValueError, match="median"):
+            plan_stats([rule])
+
+    def test_hand_built_profile_gets_planned_stats(self):
+        df = _frame()
+        profile = {"df": df, "rows": len(df)}
+        report = RuleEngine(quality_rules=[TypeMismatchRule()]).run(profile)
+
+        assert report.quality_results[0].details == {"s": "40.0%"}
+        assert list(profile["column_stats"]) == ["s"]
+
+
+class TestPlannedStreaming:
+
+    @pytest.mark.parametrize("ext", ["csv", "parquet"])
+    def test_unneeded_columns_are_not_read(self, tmp_path, ext):
+        path = tmp_path / f"data.{ext}"
+        df = _frame()
+        df.to_csv(path, index=False) if ext == "csv" else df.to_parquet(path)
+
+        profile = RuleEngine(structural_rules=[NonEmptyRule()]).profile(str(path))
+        assert profile["rows"] == 5
+        assert profile["column_stats"] == {}
+        assert "duplicate_count" not in profile
+
+        engine = RuleEngine(structural_rules=[DuplicateRule(key_columns=["flag"])])
+        profile = engine.profile(str(path))
+        assert list(profile["column_stats"]) == ["flag"]
+        assert profile["duplicate_count"] == 3
+        assert engine.run(profile).structural_results[0].details["count"] == 3
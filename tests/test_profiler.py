@@ -56,3 +56,41 @@ class TestProfiler:
         # Data should not get mangled
         assert profile["df"].iloc[0]["name"] == " a"
         assert profile["rows"] == 2
+
+
+class TestColumnStats:
+
+    def test_numeric_column_stats(self):
+        df = pd.DataFrame({"v": [10, 12, 11, 9999, None]})
+        stats = profile_dataframe(df)["column_stats"]["v"]
+
+        assert stats["null_count"] == 1
+        assert stats["count"] == 4
+        assert stats["min"] == 10
+        assert stats["max"] == 9999
+        assert stats["sum"] == 10032
+        assert stats["outliers"] == 1
+        assert stats["numeric_coercible"] is None
+
+    def test_text_column_stats(self):
+        df = pd.DataFrame({"s": [" a", "b", "c  d", "1", None]})
+        stats = profile_dataframe(df)["column_stats"]["s"]
+
+        assert stats["numeric"] is False
+        assert stats["null_count"] == 1
+        assert stats["whitespace"] == 2
+        assert stats["numeric_coercible"] == 1
+
+    def test_rules_do_not_rescan_dataframe(self):
+        """Rules must run from the fused stats alone."""
+        from dfguard.core import validate_profile
+
+        df = pd.DataFrame({"x": [1, 2, 3], "y": ["a ", "b", None]})
+        profile = profile_dataframe(df)
+        profile["df"] = df.iloc[0:0]  # any rescan would now see zero rows
+
+        report = validate_profile(profile)
+        quality = {r.name: r.details for r in report.quality_results}
+
+        assert quality["whitespace_issues"]["y"] == 1
+        assert quality["null_ratio"]["y"] == "33.3%"
@@ -0,0 +1,152 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from dfguard import validate
+from dfguard.profiler import stream_profile
+from dfguard.sampling import (
+    cluster_parquet_sample,
+    parse_sample,
+    proportion_interval,
+    reservoir_sample,
+)
+
+
+def _frame(n=20_000, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "value": rng.normal(size=n),
+        "text": rng.choice([" a", "b", None, None], n),
+        "mixed": rng.choice(["1", "2", "x"], n),
+    })
+
+
+def _result(report, name):
+    doc = report.to_dict()
+    return next(r for r in doc["structural"] + doc["quality"] + doc["numeric"] if r["name"] == name)
+
+
+class TestSampling:
+
+    def test_parse_sample(self):
+        assert parse_sample("10000") == 10000
+        assert parse_sample("1%") == pytest.approx(0.01)
+        assert parse_sample(0.25) == 0.25
+        with pytest.raises(ValueError):
+            parse_sample("1.5")
+        with pytest.raises(ValueError):
+            parse_sample(0)
+
+    def test_reservoir_is_uniform_and_ordered(self):
+        chunks = (pd.DataFrame({"i": np.arange(s, s + 1000)}) for s in range(0, 100_000, 1000))
+        sample, seen = reservoir_sample(chunks, 2000, seed=1)
+
+        assert seen == 100_000
+        assert len(sample) == 2000
+        assert sample["i"].is_monotonic_increasing
+        assert sample["i"].is_unique
+        # Early and late rows are equally likely
+        assert abs(sample["i"].mean() - 50_000) < 3000
+
+    def test_parquet_sample_reads_few_row_groups(self, tmp_path, monkeypatch):
+        import pyarrow.parquet as pq
+
+        path = str(tmp_path / "d.parquet")
+        pd.DataFrame({"i": np.arange(100_000)}).to_parquet(path, row_group_size=1000, index=False)
+        read = []
+        original = pq.ParquetFile.read_row_group
+        monkeypatch.setattr(
+            pq.ParquetFile, "read_row_group", lambda self, i, **kw: read.append(i) or original(self, i, **kw)
+        )
+
+        sample, population, design = cluster_parquet_sample(path, 2000, seed=0)
+        assert population == 100_000
+        assert len(sample) == 2000
+        assert sample["i"].is_monotonic_increasing
+        # Only the drawn clusters are decoded, not all 100 row groups
+        assert len(read) == design["row_groups"] == 4
+        assert set(sample["i"] // 1000) == set(read)
+        assert design["row_groups_total"] == 100
+
+        read.clear()
+        sample, _, design = cluster_parquet_sample(path, 0.5, seed=0)
+        assert len(sample) == 50_000 and len(read) == 50
+
+    def test_clustered_nulls_widen_intervals(self, tmp_path):
+        from dfguard.core import validate_profile
+
+        # Nulls live in a few row groups only: a cluster sample is less sure of their ratio
+        values = np.where(np.arange(100_000) // 1000 % 10 == 0, np.nan, 1.0)
+        path = str(tmp_path / "d.parquet")
+        pd.DataFrame({"v": values}).to_parquet(path, row_group_size=1000, index=False)
+
+        profile = stream_profile(path, sample=4000, sample_seed=0)
+        info = profile["sample"]
+        assert info["method"] == "cluster"
+        assert info["design_effect"] > 10
+
+        estimate = _result(validate_profile(profile), "null_ratio")["estimate"]
+        assert estimate["method"].startswith("cluster sample of 4 of 100 row groups")
+        low, high = (float(v.strip("%")) / 100 for v in estimate["intervals"]["v"])
+        assert low < 0.1 < high
+
+        # Every row group drawn: no clustering to correct for
+        _, _, design = cluster_parquet_sample(path, 0.995, seed=0)
+        assert design["row_groups"] == 100 and design["design_effect"] == 1.0
+
+    def test_interval_covers_truth_and_collapses_on_census(self):
+        low, high = proportion_interval(250, 1000)
+        assert low < 0.25 < high
+        assert proportion_interval(250, 1000, population=1000) == pytest.approx((0.25, 0.25))
+
+    def test_validate_marks_ratios_estimated(self):
+        df = _frame()
+        report = validate(df, sample=2000)
+
+        assert report.profile["rows"] == 2000
+        assert report.to_dict()["sample"]["population_rows"] == 20_000
+
+        nulls = _result(report, "null_ratio")
+        assert nulls["estimated"] is True
+        low, high = (float(v.strip("%")) / 100 for v in nulls["estimate"]["intervals"]["text"])
+        assert low < df["text"].isna().mean() < high
+
+        for name in ("duplicate_rows", "type_consistency", "numeric_outliers"):
+            assert _result(report, name)["estimated"] is True
+        assert "estimated" not in _result(report, "whitespace_issues")
+        assert "estimated" not in _result(validate(df), "null_ratio")
+
+    def test_arrow_table_and_streamed_files(self, tmp_path):
+        df = _frame()
+        report = validate(pa.Table.from_pandas(df), backend="arrow", sample=0.1)
+        assert report.profile["rows"] == 2000
+
+        path = str(tmp_path / "d.csv")
+        df.to_csv(path, index=False)
+        profile = stream_profile(path, chunksize=3000, sample=500)
+        assert profile["sample"]["method"] == "reservoir"
+        assert profile["rows"] == 500
+        assert stream_profile(path, sample="10%")["sample"]["method"] == "bernoulli"
+
+    def test_streamed_sample_keeps_duplicate_options(self, tmp_path):
+        from dfguard.core import validate_profile
+
+        df = pd.DataFrame({"id": np.arange(1000) % 10, "value": np.arange(1000)})
+        path = str(tmp_path / "d.csv")
+        df.to_csv(path, index=False)
+
+        for backend in ("pandas", "arrow"):
+            profile = stream_profile(
+                path, sample=200, backend=backend,
+                duplicates={"key_columns": ["id"], "exact": True},
+            )
+            details = _result(validate_profile(profile), "duplicate_rows")["details"]
+            assert details["key_columns"] == ["id"]
+            assert details["count"] == 190
+
+        profile = stream_profile(path, sample=200)
+        assert _result(validate_profile(profile), "duplicate_rows")["details"]["count"] == 0
+
+        with pytest.raises(ValueError, match="Key columns not found"):
+            stream_profile(path, sample=200, duplicates={"key_columns": ["nope"]})
@@ -0,0 +1,610 @@
+import pytest
+
+from dfguard.report import ValidationReport
+from dfguard.rules.base import ValidationResult
+from dfguard.rules.spark.quality import SparkNullRatioRule, SparkTypeMismatchRule
+from dfguard.rules.spark.structural import SparkDuplicateRule, SparkNonEmptyRule
+
+
+def _profile(rows=10):
+    return {
+        "rows": rows,
+        "columns": 3,
+        "column_names": ["id", "score", "tags"],
+        "types": {"id": "int", "score": "double", "tags": "array<string>"},
+        "nulls": {"id": 0, "score": 4, "tags": 1},
+    }
+
+
+class TestSparkRulesReadProfile:
+    """The rules need no Spark action, so they run without a session."""
+
+    def test_non_empty(self, capsys):
+        assert SparkNonEmptyRule().apply(_profile()).warning is False
+        assert SparkNonEmptyRule().apply(_profile(rows=0)).warning is True
+        assert capsys.readouterr().out == ""
+
+    def test_null_ratio_from_profile_counts(self):
+        result = SparkNullRatioRule().apply(_profile())
+        assert result.details == {"null_ratio": "20.0%", "total_nulls": 4, "total_cells": 20}
+        assert result.warning is True
+
+    def test_type_mismatch_from_profile_types(self):
+        result = SparkTypeMismatchRule().apply(_profile())
+        assert result.details == {"columns": ["tags"]}
+
+    def test_approximate_duplicates_need_a_significant_excess(self):
+        profile = {"rows": 10**9, "approx_distinct_rows": 1_003_000_000,
+                   "duplicate_keys": None, "duplicate_rsd": 0.01}
+        clean = SparkDuplicateRule().apply(profile)
+        assert clean.warning is False
+        assert clean.details["count"] == 0 and clean.details["approximate"] is True
+
+        profile.update(rows=10**6, approx_distinct_rows=500_000)
+        dirty = SparkDuplicateRule().apply(profile)
+        assert dirty.warning is True
+        low, high = dirty.estimate["intervals"]["count"]
+        assert low < dirty.details["count"] == 500_000 < high
+        assert dirty.to_dict()["estimated"] is True
+
+    def test_report_serializes_performance_results(self):
+        perf = ValidationResult(warning=True, message="Small file problem detected", details={})
+        report = ValidationReport(
+            profile=_profile(), structural_results=[], quality_results=[],
+            numeric_results=[], performance_results=[perf],
+        )
+        assert report.status == "warning"
+        assert report.to_dict()["performance"][0]["message"] == "Small file problem detected"
+
+
+class TestSparkProfile:
+
+    @pytest.fixture(scope="class")
+    def spark(self):
+        pyspark = pytest.importorskip("pyspark")
+        session = (
+            pyspark.sql.SparkSession.builder.master("local[1]")
+            .appName("dfguard-tests").getOrCreate()
+        )
+        yield session
+        session.stop()
+
+    def test_profile_is_one_job(self, spark):
+        from dfguard.spark.validate_spark import _profile_spark_dataframe
+
+        df = spark.createDataFrame(
+            [(1, 2.0, "a"), (2, float("nan"), None), (3, None, "a")],
+            "id int, `score.x` double, name string",
+        )
+        tracker = spark.sparkContext.statusTracker()
+        spark.sparkContext.setJobGroup("dfguard-profile", "profile")
+        profile = _profile_spark_dataframe(df)
+        spark.sparkContext.setJobGroup("other", "other")
+
+        assert len(tracker.getJobIdsForGroup("dfguard-profile")) == 1
+        assert profile["rows"] == 3
+        assert profile["nulls"] == {"id": 0, "score.x": 2, "name": 1}
+        assert profile["numeric_stats"]["id"]["mean"] == 2.0
+        assert profile["numeric_stats"]["score.x"]["max"] == 2.0
+        assert profile["column_stats"]["name"]["approx_distinct"] == 1
+        assert profile["approx_distinct_rows"] == 3
+
+    def test_duplicate_modes_agree(self, spark):
+        from dfguard.spark.validate_spark import validate_spark
+
+        df = spark.createDataFrame(
+            [(1, None), (None, 1), (1, None), (2, 2)], "a int, b int"
+        )
+        for options in ({}, {"exact_duplicates": True}):
+            report = validate_spark(df, **options)
+            dup = next(r for r in report.structural_results if r.name == "spark_duplicate_rows")
+            assert dup.details["count"] == 1
+
+        report = validate_spark(df, duplicate_keys=["a"], exact_duplicates=True)
+        dup = next(r for r in report.structural_results if r.name == "spark_duplicate_rows")
+        assert dup.details["count"] == 1
+
+    def test_outliers_from_approximate_quartiles(self, spark):
+        from dfguard.spark.validate_spark import validate_spark
+
+        rows = [(float(i), i) for i in range(1, 100)] + [(float("nan"), 1000), (None, 2000)]
+        df = spark.createDataFrame(rows, "x double, n bigint")
+        report = validate_spark(df, quantile_accuracy=0.001)
+
+        assert report.profile["numeric_stats"]["x"]["median"] == 50.0
+        outliers = report.numeric_results[0].details
+        assert outliers["x"]["count"] == 0  # NaN is null, not beyond the fences
+        assert outliers["n"]["count"] == 2
+        assert outliers["n"]["outliers_exact"] is True
+
+
+def _frame():
+    import pandas as pd
+
+    return pd.DataFrame({
+        "n": [1.0, 2.0, 3.0, 100.0, None, 2.0],
+        "s": [" a", "b", "1", "2", None, "b"],
+        "flag": [True, False, True, True, False, False],
+    })
+
+
+def _results(report):
+    return [(r.name, r.warning, r.details) for r in report.all_results]
+
+
+class TestDistributedStates:
+    """The executor and driver halves of validate_spark_distributed(), without Spark."""
+
+    def test_merged_partition_states_match_validate(self):
+        import pyarrow as pa
+
+        from dfguard.core import _build_default_engine, validate
+        from dfguard.spark.distributed import merge_states, partition_state
+
+        df = _frame()
+        engine = _build_default_engine()
+        options = {"plan": engine.plan(), "duplicates": {}}
+        names = list(df.columns)
+        expected = _results(validate(df))
+
+        def arrow(part):
+            return pa.Table.from_pandas(part, preserve_index=False).to_batches()
+
+        # mapInArrow and mapInPandas partitions, one of them empty
+        for batches in ([arrow(df[:4]), arrow(df[4:]), []], [[df[:4]], [df[4:]], []]):
+            states = [partition_state(b, names, **options) for b in batches]
+            profile = merge_states(states, names, **options)
+
+            assert profile["rows"] == 6
+            assert profile["duplicate_count"] == 1
+            assert _results(engine.run(profile)) == expected
+
+    def test_duplicates_span_partitions(self):
+        from dfguard.spark.distributed import merge_states, partition_state
+
+        df = _frame()
+        names = list(df.columns)
+        options = {"duplicates": {"key_columns": ["s"]}}
+        states = [partition_state([df[:3]], names, **options), partition_state([df[3:]], names, **options)]
+        assert merge_states(states, names, **options)["duplicate_count"] == 1
+
+    def test_all_null_columns_use_declared_dtypes(self):
+        import pyarrow as pa
+
+        from dfguard.core import validate, validate_profile
+        from dfguard.profiler import _null_dtypes
+        from dfguard.spark.distributed import merge_states, partition_state
+
+        table = pa.table({"x": [1.0, 2.0, 3.0, 4.0], "s": pa.nulls(4, pa.string())})
+        names = table.column_names
+        options = {"duplicates": {}, "dtypes": _null_dtypes(table.schema, names)}
+        parts = [table.slice(0, 2).to_batches(), [], table.slice(2).to_batches()]
+        states = [partition_state(batches, names, **options) for batches in parts]
+        profile = merge_states(states, names, **options)
+
+        assert profile["column_stats"]["s"]["dtype"] == "object"
+        assert _results(validate_profile(profile)) == _results(validate(table.to_pandas()))
+
+    def test_bigint_ids_beyond_float_precision(self):
+        import numpy as np
+        import pandas as pd
+        import pyarrow as pa
+
+        from dfguard.spark.distributed import merge_states, partition_state
+
+        ids = np.arange(6, dtype=np.int64) + 1450000000000000001
+        df = pd.DataFrame({"id": ids, "v": [1, 1, 1, 2, 2, 2]})
+        names = list(df.columns)
+        arrow = pa.RecordBatch.from_pandas(df, preserve_index=False)
+
+        for options in ({"duplicates": {}}, {"duplicates": {"key_columns": ["id"]}}):
+            for halves in ([[arrow.slice(0, 3)], [arrow.slice(3)]], [[df[:3]], [df[3:]]]):
+                states = [partition_state(b, names, **options) for b in halves]
+                profile = merge_states(states, names, **options)
+                assert profile["duplicate_count"] == 0
+                assert profile["column_stats"]["id"]["max"] == ids[-1]
+
+
+class TestDistributedSpark:
+
+    @pytest.fixture(scope="class")
+    def spark(self):
+        pyspark = pytest.importorskip("pyspark")
+        session = (
+            pyspark.sql.SparkSession.builder.master("local[2]")
+            .appName("dfguard-tests").getOrCreate()
+        )
+        yield session
+        session.stop()
+
+    def test_matches_pandas_validate(self, spark):
+        from dfguard.core import validate
+        from dfguard.spark.distributed import validate_spark_distributed
+
+        df = _frame()
+        report = validate_spark_distributed(spark.createDataFrame(df).repartition(3), "t")
+
+        assert report.profile["backend"] == "spark"
+        assert report.profile["partitions"] == 3
+        assert _results(report) == _results(validate(df))
+
+    def test_duplicates_can_be_skipped(self, spark):
+        from dfguard.spark.distributed import validate_spark_distributed
+
+        report = validate_spark_distributed(spark.createDataFrame(_frame()), check_duplicates=False)
+        assert "duplicate_count" not in report.profile
+        assert "duplicate_rows" not in [r.name for r in report.structural_results]
+
+
+class TestPersistPolicy:
+
+    def test_plan_nodes(self):
+        from dfguard.spark.persist import plan_nodes
+
+        scan = "Project [a#0]\n+- Filter (a#0 > 1)\n   +- Relation [a#0,b#1] parquet"
+        join = (
+            "Aggregate [a#0], [a#0, count(1) AS c#5L]\n"
+            "+- Join Inner, (a#0 = a#2)\n"
+            "   :- Relation default.t[a#0] parquet\n"
+            "   +- LocalRelation [a#2]"
+        )
+        assert plan_nodes(scan) == ["Project", "Filter", "Relation"]
+        assert plan_nodes(join) == ["Aggregate", "Join", "Relation", "LocalRelation"]
+
+    @pytest.fixture(scope="class")
+    def spark(self):
+        pyspark = pytest.importorskip("pyspark")
+        session = (
+            pyspark.sql.SparkSession.builder.master("local[1]")
+            .appName("dfguard-tests").getOrCreate()
+        )
+        yield session
+        session.stop()
+
+    def test_derived_input_is_persisted_once_and_released(self, spark):
+        from dfguard.spark.validate_spark import validate_spark
+
+        left = spark.createDataFrame([(i, float(i)) for i in range(20)], "id int, x double")
+        right = spark.createDataFrame([(i, "a") for i in range(20)], "id int, tag string")
+        joined = left.join(right, "id")
+
+        report = validate_spark(joined)
+        assert report.to_dict()["persist"] == {"policy": "auto", "applied": "memory_and_disk"}
+        assert not joined.is_cached
+
+    def test_cheap_scans_and_cached_inputs_are_left_alone(self, spark, tmp_path):
+        from dfguard.spark.validate_spark import validate_spark
+
+        path = str(tmp_path / "t")
+        spark.range(10).selectExpr("id", "id * 2.0 AS x").write.parquet(path)
+        scan = spark.read.parquet(path).filter("id > 2")
+        assert validate_spark(scan, persist="memory").profile["persist"]["reason"] == "cheap scan"
+
+        cached = scan.groupBy("id").count().cache()
+        assert validate_spark(cached).profile["persist"]["reason"] == "already cached"
+        assert cached.is_cached
+
+        with pytest.raises(ValueError, match="persist policy"):
+            validate_spark(scan, persist="disk")
+
+
+class TestFileListing:
+
+    def _files(self, root, sizes, subdir="part=1"):
+        directory = root / subdir
+        directory.mkdir(parents=True, exist_ok=True)
+        paths = []
+        for i, size in enumerate(sizes):
+            path = directory / f"part {i}.parquet"
+            path.write_bytes(b"x" * size)
+            paths.append(path)
+        return paths
+
+    def test_sizes_from_one_listing_per_directory(self, tmp_path, monkeypatch):
+        from dfguard.spark.listing import FileListing
+
+        paths = self._files(tmp_path, [10, 20]) + self._files(tmp_path, [30], subdir="part=2")
+        # As Spark reports them: file: URIs, percent-encoded
+        uris = [p.as_uri() for p in paths] + [str(tmp_path / "part=1" / "gone.parquet")]
+
+        listing = FileListing()
+        calls = []
+        original = FileListing._list_local
+        monkeypatch.setattr(FileListing, "_list_local", staticmethod(lambda d: calls.append(d) or original(d)))
+
+        sizes = listing.sizes(uris)
+        assert [sizes[u] for u in uris] == [10, 20, 30, None]
+        assert sorted(calls) == [str(tmp_path / "part=1"), str(tmp_path / "part=2")]
+
+        listing.sizes(uris[:1])
+        assert len(calls) == 2  # cached
+
+    def test_remote_paths_without_a_session_are_unlisted(self):
+        from dfguard.spark.listing import FileListing
+
+        assert FileListing().sizes(["s3a://bucket/t/part-0.parquet"]) == {"s3a://bucket/t/part-0.parquet": None}
+
+    def test_rule_reports_histogram(self, tmp_path):
+        from dfguard.rules.spark.performance import SmallFileRule
+
+        files = [p.as_uri() for p in self._files(tmp_path, [100] * 101 + [2 * 1024 * 1024])]
+        result = SmallFileRule().apply({"input_files": files})
+
+        assert result.warning is True
+        assert result.details["num_files"] == 102
+        assert result.details["size_histogram"]["<1MB"] == 101
+        assert result.details["size_histogram"]["1-16MB"] == 1
+        assert "unlisted_files" not in result.details
+
+    def test_rule_without_sizes_does_not_warn(self, tmp_path):
+        from dfguard.rules.spark.performance import SmallFileRule
+
+        remote = [f"s3a://bucket/t/part-{i}.parquet" for i in range(200)]
+        result = SmallFileRule().apply({"df_spark": None, "input_files": remote})
+        assert result.warning is False
+        assert result.message == "File sizes unavailable"
+        assert result.details == {"num_files": 200, "unlisted_files": 200}
+
+        # Only the listed files count towards the average
+        files = [p.as_uri() for p in self._files(tmp_path, [20 * 1024 * 1024])]
+        result = SmallFileRule().apply({"input_files": files + remote})
+        assert result.warning is False
+        assert result.details["avg_size_mb"] == 20.0
+        assert result.details["unlisted_files"] == 200
+
+    def test_rule_on_a_local_spark_table(self, tmp_path):
+        pyspark = pytest.importorskip("pyspark")
+        from dfguard.rules.spark.performance import SmallFileRule
+
+        spark = pyspark.sql.SparkSession.builder.master("local[1]").getOrCreate()
+        path = str(tmp_path / "t")
+        spark.range(100).repartition(4).write.parquet(path)
+
+        result = SmallFileRule().apply({"df_spark": spark.read.parquet(path)})
+        assert result.details["num_files"] == 4
+        assert result.details["size_histogram"]["<1MB"] == 4
+
+
+class _FakeCatalogSession:
+    """Answers the DESCRIBE queries of catalog_stats like Spark's catalog."""
+
+    def __init__(self, statistics, columns):
+        self.statistics = statistics
+        self.columns = columns
+        self.queries = []
+
+    def sql(self, query):
+        self.queries.append(query)
+        if query.startswith("DESCRIBE TABLE EXTENDED t `"):
+            name = query.split("`")[1]
+            info = self.columns.get(name, {})
+            rows = [(k, info.get(k, "NULL")) for k in ("col_name", "num_nulls", "distinct_count", "min", "max")]
+        else:
+            rows = [("id", "bigint", None), ("", "", ""), ("Statistics", self.statistics, "")]
+        return type("Result", (), {"collect": lambda _self: rows})()
+
+
+class TestCatalogStatistics:
+
+    def test_reads_describe_output(self):
+        from dfguard.spark.catalog_stats import complete, read_table_statistics
+
+        spark = _FakeCatalogSession("4096 bytes, 100 rows", {
+            "id": {"num_nulls": "0", "distinct_count": "100", "min": "1", "max": "100"},
+        })
+        stats = read_table_statistics(spark, "t", ["id", "name"])
+
+        assert stats["size_in_bytes"] == 4096 and stats["rows"] == 100
+        assert stats["columns"]["id"] == {"null_count": 0, "distinct_count": 100, "min": "1", "max": "100"}
+        assert stats["columns"]["name"]["null_count"] is None
+        assert complete(stats, ["id"]) and not complete(stats, ["id", "name"])
+
+    def test_size_only_statistics_have_no_columns(self):
+        from dfguard.spark.catalog_stats import table_statistics
+
+        spark = _FakeCatalogSession("4096 bytes", {})
+        stats = table_statistics(spark, "t", ["id"])
+        assert stats == {"size_in_bytes": 4096, "rows": None, "columns": {}}
+        assert len(spark.queries) == 1  # no column lookups, no ANALYZE
+
+    def test_reads_table_compares_full_identifiers(self):
+        from types import SimpleNamespace
+
+        from dfguard.spark.catalog_stats import reads_table
+
+        def frame(plan):
+            query = SimpleNamespace(optimizedPlan=lambda: SimpleNamespace(toString=lambda: plan))
+            catalog = SimpleNamespace(currentCatalog=lambda: "spark_catalog", currentDatabase=lambda: "default")
+            return SimpleNamespace(
+                _jdf=SimpleNamespace(queryExecution=lambda: query),
+                sparkSession=SimpleNamespace(catalog=catalog),
+            )
+
+        events = frame("Relation spark_catalog.default.events[id#0L,ts#1] parquet")
+        assert reads_table(events, "events")
+        assert reads_table(events, "default.events")
+        assert reads_table(events, "`spark_catalog`.`default`.`EVENTS`")
+        # ts is a column of events, not the table
+        assert not reads_table(events, "ts")
+        assert not reads_table(events, "other.events")
+
+        hive = frame("HiveTableRelation [`spark_catalog`.`sales`.`t`, org.apache.hadoop.hive.serde2.lazy.LazySimpleSerDe]")
+        assert reads_table(hive, "sales.t") and not reads_table(hive, "t")
+        assert not reads_table(frame("Relation [id#0L] parquet"), "t")
+
+    def test_engine_keeps_catalog_rules(self):
+        from dfguard.spark.catalog_stats import CATALOG_RULES
+        from dfguard.spark.engine import SparkRuleEngine
+
+        engine = SparkRuleEngine(metadata_only=True)
+        rules = engine.structural_rules + engine.quality_rules + engine.numeric_rules + engine.performance_rules
+        assert sorted(r.name for r in rules) == sorted(CATALOG_RULES)
+
+
+class TestCatalogFastPath:
+
+    @pytest.fixture(scope="class")
+    def spark(self, tmp_path_factory):
+        pyspark = pytest.importorskip("pyspark")
+        warehouse = str(tmp_path_factory.mktemp("warehouse"))
+        session = (
+            pyspark.sql.SparkSession.builder.master("local[1]")
+            .appName("dfguard-tests")
+            .config("spark.sql.warehouse.dir", warehouse)
+            .getOrCreate()
+        )
+        session.createDataFrame(
+            [(i, float(i) if i % 10 else None) for i in range(100)], "id bigint, x double"
+        ).write.saveAsTable("dfguard_catalog_t")
+        yield session
+        session.sql("DROP TABLE IF EXISTS dfguard_catalog_t")
+        session.stop()
+
+    def test_metadata_only_validation_runs_no_job(self, spark):
+        from dfguard.spark.validate_spark import validate_spark
+
+        report = validate_spark(table_name="dfguard_catalog_t", metadata_only=True)
+        assert report.profile.get("stats_source") is None
+        assert "compute_stats=True" in report.profile["notes"][0]
+
+        report = validate_spark(table_name="dfguard_catalog_t", metadata_only=True, compute_stats=True)
+        tracker = spark.sparkContext.statusTracker()
+        spark.sparkContext.setJobGroup("dfguard-catalog", "catalog")
+        report = validate_spark(table_name="dfguard_catalog_t", metadata_only=True)
+        spark.sparkContext.setJobGroup("other", "other")
+
+        assert tracker.getJobIdsForGroup("dfguard-catalog") == []
+        assert report.to_dict()["stats_source"] == "catalog"
+        assert report.profile["rows"] == 100
+        assert report.profile["nulls"] == {"id": 0, "x": 10}
+        assert {r.name for r in report.all_results} <= {
+            "spark_non_empty", "spark_null_ratio", "spark_type_mismatch", "spark_small_file_problem",
+        }
+
+    def test_stale_catalog_distinct_counts_are_recounted(self, spark):
+        from dfguard.spark.validate_spark import _profile_spark_dataframe
+
+        df = spark.table("dfguard_catalog_t")
+        stale = {
+            "rows": 10,
+            "size_in_bytes": 1024,
+            "columns": {"id": {"null_count": 0, "distinct_count": 10}},
+        }
+        profile = _profile_spark_dataframe(df, "dfguard_catalog_t", catalog=stale)
+
+        assert "stale" in profile["notes"][0]
+        assert profile["rows"] == 100
+        assert 90 <= profile["column_stats"]["id"]["approx_distinct"] <= 110
+        assert profile["column_stats"]["x"]["approx_distinct"] is not None
+        assert "stats_source" not in profile
+
+    def test_filtered_reads_do_not_use_the_catalog(self, spark):
+        from dfguard.spark.validate_spark import validate_spark
+
+        df = spark.table("dfguard_catalog_t").filter("id < 50")
+        report = validate_spark(df, "dfguard_catalog_t")
+        assert report.profile["rows"] == 50
+        assert "not a plain read" in report.profile["notes"][0]
+
+
+class _FakeSparkContext:
+    """Job groups and a status tracker over canned jobs; the UI is off."""
+
+    uiWebUrl = None
+    applicationId = "app"
+
+    def __init__(self):
+        self.properties = {"spark.jobGroup.id": "caller"}
+        self.groups = {}
+
+    def getLocalProperty(self, key):
+        return self.properties.get(key)
+
+    def setLocalProperty(self, key, value):
+        if value is None:
+            self.properties.pop(key, None)
+        else:
+            self.properties[key] = value
+
+    def setJobGroup(self, group, description):
+        self.properties.update({"spark.jobGroup.id": group, "spark.job.description": description})
+
+    def launch(self, stages):
+        """A job in the current group; stages maps stage id to completed tasks."""
+        self.groups.setdefault(self.properties["spark.jobGroup.id"], []).append(stages)
+
+    def statusTracker(self):
+        from types import SimpleNamespace as NS
+
+        jobs = {
+            (group, i): stages
+            for group, items in self.groups.items()
+            for i, stages in enumerate(items)
+        }
+        tasks = {sid: n for stages in jobs.values() for sid, n in stages.items()}
+        return NS(
+            getJobIdsForGroup=lambda g: [key for key in jobs if key[0] == g],
+            getJobInfo=lambda key: NS(status="SUCCEEDED", stageIds=list(jobs[key])),
+            getStageInfo=lambda sid: NS(numCompletedTasks=tasks[sid], numFailedTasks=0, numActiveTasks=0),
+        )
+
+
+class TestJobMetrics:
+
+    def test_jobs_are_attributed_to_their_step(self):
+        from types import SimpleNamespace as NS
+
+        from dfguard.spark.job_metrics import SparkJobTracker
+
+        sc = _FakeSparkContext()
+        tracker = SparkJobTracker(NS(sparkContext=sc), collect=True)
+
+        def rule_jobs():
+            sc.launch({1: 0, 2: 8})  # stage 1 reused a shuffle
+            sc.launch({3: 2})
+            return "done"
+
+        _, profile = tracker.run("profile", lambda: sc.launch({0: 4}))
+        result, rule = tracker.run("rule", rule_jobs)
+
+        assert result == "done"
+        assert profile["spark"]["jobs"] == 1 and profile["spark"]["tasks"] == 4
+        assert rule["spark"] == {
+            "jobs": 2, "stages": 2, "skipped_stages": 1, "tasks": 10, "failed_tasks": 0,
+            "task_seconds": None, "input_bytes": None,
+            "shuffle_read_bytes": None, "shuffle_write_bytes": None,
+        }
+        assert sc.properties == {"spark.jobGroup.id": "caller"}  # restored
+
+        from dfguard.renderers import render_timings
+        render_timings({"profile": profile, "rules": [{"name": "rule", "bucket": "quality", **rule}]})
+
+    def test_groups_without_collecting(self):
+        from types import SimpleNamespace as NS
+
+        from dfguard.spark.job_metrics import SparkJobTracker
+
+        sc = _FakeSparkContext()
+        groups = []
+        result, cost = SparkJobTracker(NS(sparkContext=sc)).run(
+            "rule", lambda: groups.append(sc.properties["spark.job.description"])
+        )
+        assert cost is None
+        assert groups == ["dfguard: rule"]
+
+    def test_validate_spark_reports_per_rule_jobs(self):
+        pyspark = pytest.importorskip("pyspark")
+        from dfguard.renderers import render_timings
+        from dfguard.spark.validate_spark import validate_spark
+
+        spark = pyspark.sql.SparkSession.builder.master("local[1]").getOrCreate()
+        df = spark.createDataFrame([(i % 7, float(i)) for i in range(50)], "k int, x double")
+        report = validate_spark(df, exact_duplicates=True, job_metrics=True)
+
+        timings = report.to_dict()["timings"]
+        assert timings["profile"]["spark"]["jobs"] == 1
+        rules = {r["name"]: r["spark"] for r in timings["rules"]}
+        assert rules["spark_duplicate_rows"]["jobs"] >= 1
+        assert rules["spark_duplicate_rows"]["shuffle_write_bytes"] > 0
+        assert rules["spark_null_ratio"]["jobs"] == 0
+        render_timings(report.timings)
@@ -0,0 +1,42 @@
+import os
+import subprocess
+import sys
+
+import dfguard
+
+
+def _loaded_after(statement):
+    """Heavy modules present in sys.modules after running statement in a fresh interpreter."""
+    code = (
+        f"{statement}\n"
+        "import sys\n"
+        "print(','.join(m for m in ('pandas', 'numpy', 'pyarrow', 'rich', 'pyspark') if m in sys.modules))"
+    )
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(dfguard.__file__)))
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True)
+    return [m for m in proc.stdout.strip().split(",") if m]
+
+
+class TestStartup:
+
+    def test_import_dfguard_is_light(self):
+        assert _loaded_after("import dfguard") == []
+
+    def test_cli_module_is_light(self):
+        assert _loaded_after("import dfguard.cli") == []
+
+    def test_version_skips_heavy_imports(self):
+        loaded = _loaded_after(
+            "from typer.testing import CliRunner\n"
+            "from dfguard.cli import app\n"
+            "assert CliRunner().invoke(app, ['--version']).stdout.startswith('dfguard ')"
+        )
+        assert loaded == []
+
+    def test_spark_modules_do_not_need_pyspark_at_import(self):
+        loaded = _loaded_after("import dfguard.spark.validate_spark")
+        assert "pyspark" not in loaded
+
+    def test_validate_still_exported(self):
+        assert "validate" in dfguard.__all__
+        assert callable(dfguard.validate)
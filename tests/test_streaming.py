@@ -0,0 +1,267 @@
+import numpy as np
+import pandas as pd
+import pytest
+from typer.testing import CliRunner
+
+from dfguard import validate
+from dfguard.accumulators import DuplicateAccumulator, ProfileAccumulator
+from dfguard.cli import app
+from dfguard.core import validate_profile
+from dfguard.profiler import iqr_fences, stream_profile
+from dfguard.sketches import QuantileSketch, k_for_error, normalized_rank_error
+
+
+def _results(report):
+    return [(r.name, r.warning, r.details) for r in report.all_results]
+
+
+def _mixed_frame(n=3000, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "num": rng.normal(size=n).round(3),
+        "cat": rng.integers(0, 5, n),
+        "text": rng.choice([" a", "b", "c  d", "1", None], n),
+        "sparse": np.where(rng.random(n) < 0.3, np.nan, rng.exponential(size=n).round(2)),
+    })
+
+
+class TestStreamingProfile:
+
+    def test_streamed_csv_matches_in_memory(self, tmp_path):
+        """Chunked CSV validation must match validate(df) rule for rule."""
+        p = tmp_path / "data.csv"
+        _mixed_frame().to_csv(p, index=False)
+
+        expected = _results(validate(pd.read_csv(p)))
+        for chunksize in (7, 500, 10_000):
+            profile = stream_profile(str(p), chunksize=chunksize)
+            assert profile["df"] is None
+            assert _results(validate_profile(profile)) == expected
+
+    def test_no_row_cap(self, tmp_path):
+        p = tmp_path / "tall.csv"
+        pd.DataFrame({"x": range(60_000)}).to_csv(p, index=False)
+
+        profile = stream_profile(str(p), chunksize=10_000)
+        assert profile["rows"] == 60_000
+
+    def test_dtype_drift_across_chunks(self, tmp_path):
+        """A column that turns textual in a later chunk is reported as text."""
+        p = tmp_path / "drift.csv"
+        pd.DataFrame({"v": [1, 2, 3, 4, "two", 6]}).to_csv(p, index=False)
+
+        profile = stream_profile(str(p), chunksize=3)
+        stats = profile["column_stats"]["v"]
+        assert stats["numeric"] is False
+        assert stats["numeric_coercible"] == 5
+
+    def test_cli_streams_csv(self, tmp_path):
+        p = tmp_path / "data.csv"
+        pd.DataFrame({"x": [1, 2, 2, 3]}).to_csv(p, index=False)
+
+        result = CliRunner().invoke(app, [str(p), "--json", "--chunksize", "2"])
+        assert result.exit_code == 0
+        assert '"rows": 4' in result.stdout
+
+
+class TestAccumulators:
+
+    def test_duplicates_across_chunks_and_merge(self):
+        df = pd.DataFrame({"a": [1, 2, 1, 3, 2, 1], "b": ["x", "y", "x", "z", "y", "x"]})
+
+        left, right = DuplicateAccumulator(), DuplicateAccumulator()
+        left.update(df.iloc[:3])
+        right.update(df.iloc[3:])
+        left.merge(right)
+
+        assert left.duplicates == int(df.duplicated().sum())
+        assert left.distinct == 3
+
+    def test_large_int64_keys_stay_distinct(self, tmp_path):
+        ids = np.arange(100, dtype=np.int64) + 1450000000000000001
+        df = pd.DataFrame({"id": ids})
+
+        acc = DuplicateAccumulator()
+        acc.update(df)
+        assert acc.duplicates == 0
+
+        p = tmp_path / "ids.csv"
+        df.to_csv(p, index=False)
+        assert stream_profile(str(p), chunksize=30)["duplicate_count"] == 0
+
+    def test_int_and_float_chunks_hash_alike(self):
+        acc = DuplicateAccumulator()
+        acc.update(pd.DataFrame({"x": [1, 2]}))
+        acc.update(pd.DataFrame({"x": [2.0, np.nan, 2.5]}))
+        acc.update(pd.DataFrame({"x": [np.nan, 2.5, -0.0, 0]}))
+        assert acc.duplicates == 4
+
+    def test_profile_accumulators_merge(self):
+        df = _mixed_frame(n=500)
+        left, right = ProfileAccumulator(), ProfileAccumulator()
+        left.update(df.iloc[:200])
+        right.update(df.iloc[200:])
+        left.merge(right)
+
+        merged = validate_profile(left.to_profile())
+        assert _results(merged) == _results(validate(df))
+
+    def test_std_of_large_offsets(self, tmp_path):
+        """Offset data must not lose its variance to sum-of-squares cancellation."""
+        df = pd.DataFrame({
+            "ts": np.arange(3000) + 1.6e12,
+            "v": [1e9, 1e9 + 1, 1e9 + 2] * 1000,
+        })
+        p = tmp_path / "data.csv"
+        df.to_csv(p, index=False)
+        expected = df.std()
+
+        profiles = [validate(df).profile]
+        for backend in ("pandas", "arrow"):
+            profiles.append(stream_profile(str(p), chunksize=700, backend=backend))
+        for profile in profiles:
+            for col in df.columns:
+                stats = profile["numeric_stats"][col]
+                assert np.isclose(stats["mean"], df[col].mean(), rtol=1e-12)
+                assert np.isclose(stats["std"], expected[col], rtol=1e-9)
+
+    def test_sketch_exact_until_limit(self):
+        values = np.arange(1000, dtype=float)
+        sketch = QuantileSketch(k=64, exact_limit=2000)
+        sketch.update(values)
+
+        assert sketch.is_exact
+        assert sketch.quantiles([0.25, 0.75]) == list(np.quantile(values, [0.25, 0.75]))
+
+    def test_sketch_approximate_after_limit(self):
+        rng = np.random.default_rng(0)
+        values = rng.normal(size=200_000)
+        sketch = QuantileSketch(k=512, exact_limit=0)
+        for part in np.array_split(values, 20):
+            sketch.update(part)
+
+        assert not sketch.is_exact
+        assert sketch.retained < 5_000
+        q1, q3 = sketch.quantiles([0.25, 0.75])
+        assert abs(q1 - np.quantile(values, 0.25)) < 0.05
+        assert abs(q3 - np.quantile(values, 0.75)) < 0.05
+
+
+class TestApproximateOutliers:
+
+    def _outliers(self, report, col):
+        rule = next(r for r in report.all_results if r.name == "numeric_outliers")
+        return rule.details[col]
+
+    def test_accuracy_to_k(self):
+        k = k_for_error(0.01)
+        assert normalized_rank_error(k) <= 0.01 < normalized_rank_error(k - 1)
+        assert QuantileSketch(k=k).error_bound == 0.0
+
+    def test_small_columns_stay_exact(self):
+        df = _mixed_frame(n=500)
+        assert _results(validate(df, quantile_accuracy=0.01)) == _results(validate(df))
+
+    def test_in_memory_approximate_mode(self):
+        rng = np.random.default_rng(3)
+        df = pd.DataFrame({"x": rng.standard_t(3, size=300_000)})
+        exact = self._outliers(validate(df), "x")
+
+        approx = self._outliers(validate(df, quantile_accuracy=0.01), "x")
+        assert approx["quantile_error"].endswith("%")
+        assert approx["outliers_exact"] is False
+        assert abs(approx["count"] - exact["count"]) / exact["count"] < 0.1
+
+        recounted = self._outliers(validate(df, quantile_accuracy=0.01, exact_outliers=True), "x")
+        assert recounted["outliers_exact"] is True
+
+    def test_streamed_second_pass_is_exact(self, tmp_path):
+        rng = np.random.default_rng(4)
+        df = pd.DataFrame({"x": rng.lognormal(size=120_000).round(4), "t": "a"})
+        p = tmp_path / "big.csv"
+        df.to_csv(p, index=False)
+
+        profile = stream_profile(str(p), quantile_accuracy=0.02, exact_outliers=True)
+        stats = profile["column_stats"]["x"]
+        lower, upper = iqr_fences(stats["q1"], stats["q3"])
+
+        assert stats["quartiles_exact"] is False
+        assert stats["outliers"] == int(((df["x"] < lower) | (df["x"] > upper)).sum())
+        assert self._outliers(validate_profile(profile), "x")["outliers_exact"] is True
+
+    def test_accuracy_must_be_inside_zero_one(self, tmp_path):
+        p = tmp_path / "data.csv"
+        _mixed_frame(n=100).to_csv(p, index=False)
+
+        for bound in ("0", "1", "0.0", "1.0"):
+            result = CliRunner().invoke(app, [str(p), "--quantile-accuracy", bound])
+            assert result.exit_code == 2
+        assert CliRunner().invoke(app, [str(p), "--quantile-accuracy", "0.5"]).exit_code == 0
+
+        # 0.0 is an invalid accuracy, not "use the default"
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            stream_profile(str(p), quantile_accuracy=0.0)
+
+
+class TestParquetStreaming:
+
+    def test_row_groups_match_in_memory(self, tmp_path):
+        p = tmp_path / "data.parquet"
+        _mixed_frame().to_parquet(p, index=False, row_group_size=400)
+
+        expected = _results(validate(pd.read_parquet(p)))
+        profile = stream_profile(str(p), chunksize=150)
+
+        assert profile["df"] is None
+        assert _results(validate_profile(profile)) == expected
+
+    def test_column_projection(self, tmp_path):
+        p = tmp_path / "wide.parquet"
+        _mixed_frame(n=100).to_parquet(p, index=False)
+
+        profile = stream_profile(str(p), columns=["num", "sparse"])
+
+        assert profile["column_names"] == ["num", "sparse"]
+        assert set(profile["column_stats"]) == {"num", "sparse"}
+        assert profile["rows"] == 100
+
+    def test_empty_parquet_keeps_schema(self, tmp_path):
+        p = tmp_path / "empty.parquet"
+        _mixed_frame(n=10).iloc[:0].to_parquet(p, index=False)
+
+        profile = stream_profile(str(p))
+        assert profile["rows"] == 0
+        assert profile["columns"] == 4
+
+    def test_cli_columns_option(self, tmp_path):
+        p = tmp_path / "wide.parquet"
+        _mixed_frame(n=50).to_parquet(p, index=False)
+
+        result = CliRunner().invoke(app, [str(p), "--json", "--columns", "num,text"])
+        assert result.exit_code == 0
+        assert '"columns": 2' in result.stdout
+
+    def test_all_null_columns_keep_their_schema_type(self, tmp_path):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        from dfguard.incremental import validate_incremental
+
+        p = tmp_path / "nulls.parquet"
+        pq.write_table(pa.table({
+            "num": pa.array(np.arange(300, dtype=float)),
+            "text": pa.array(["a", "b", "c"] * 100),
+            "empty_text": pa.nulls(300, pa.string()),
+            "empty_int": pa.nulls(300, pa.int64()),
+            "empty_null": pa.nulls(300),
+        }), p, row_group_size=100)
+
+        expected = _results(validate(pd.read_parquet(p)))
+        for backend in ("pandas", "arrow"):
+            profile = stream_profile(str(p), chunksize=70, backend=backend)
+            assert profile["column_stats"]["empty_text"]["dtype"] == "object"
+            assert profile["column_stats"]["empty_int"]["dtype"] == "float64"
+            assert _results(validate_profile(profile)) == expected
+
+        report = validate_incremental([str(p)], str(tmp_path / "state.pkl"), chunksize=70)
+        assert _results(report) == expected
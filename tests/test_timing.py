@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+from typer.testing import CliRunner
+
+from dfguard import validate
+from dfguard.cli import app
+from dfguard.timing import aggregate, measure, ranked
+
+
+def _frame(n=5000):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({"x": rng.normal(size=n), "s": rng.choice([" a", "b"], n)})
+
+
+RULES = {"non_empty", "duplicate_rows", "whitespace_issues", "null_ratio",
+         "type_consistency", "numeric_outliers"}
+
+
+class TestTimings:
+
+    def test_measure_reports_cost(self):
+        result, cost = measure(lambda: np.ones(1_000_000).sum(), rows=10)
+        assert result == 1_000_000
+        assert cost["peak_memory_bytes"] >= 8_000_000
+        assert cost["wall_seconds"] >= 0 and cost["cpu_seconds"] >= 0
+        assert cost["rows"] == 10
+
+        _, cost = measure(lambda: None, memory="rss")
+        assert cost["memory_method"] == "rss"
+        with pytest.raises(ValueError):
+            measure(lambda: None, memory="heap")
+
+    def test_validate_timings(self):
+        report = validate(_frame(), timings=True)
+        timings = report.to_dict()["timings"]
+
+        assert timings["profile"]["rows"] == 5000
+        assert {e["name"] for e in timings["rules"]} == RULES
+        assert ranked(timings)[0]["wall_seconds"] == max(
+            e["wall_seconds"] for e in [timings["profile"]] + timings["rules"]
+        )
+        assert "timings" not in validate(_frame()).to_dict()
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_parallel_timings(self, executor):
+        report = validate(_frame(), timings=True, workers=3, executor=executor)
+        names = [e["name"] for e in report.timings["rules"]]
+        assert set(names) == RULES
+        assert [r.name for r in report.all_results] == [
+            r.name for r in validate(_frame()).all_results
+        ]
+
+    def test_aggregate(self):
+        t = validate(_frame(), timings=True).timings
+        total = aggregate([t, t])
+        nulls = next(e for e in total["rules"] if e["name"] == "null_ratio")
+        assert nulls["files"] == 2
+        assert nulls["rows"] == 10_000
+
+    def test_cli_profile_rules(self, tmp_path):
+        path = tmp_path / "d.csv"
+        _frame().to_csv(path, index=False)
+
+        result = CliRunner().invoke(app, [str(path), "--profile-rules"])
+        assert result.exit_code == 0
+        assert "Rule Timings" in result.stdout
+        assert "(profiling)" in result.stdout